@@ -0,0 +1,137 @@
+"""Batch execution of JSONL request bodies with bounded concurrency."""
+
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def parse_jsonl(body: bytes, model: Type[M]) -> List[Dict[str, Any]]:
+    """
+    Parse one request body per line.
+
+    Blank lines are skipped. Line numbers start at 1, as in an editor, so
+    they can be used to find a row in the uploaded file.
+
+    Returns:
+        List of ``{"line": n, "request": model}`` for valid rows and
+        ``{"line": n, "error": message}`` for rows that failed validation
+    """
+    rows = []
+    for number, line in enumerate(body.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            rows.append({"line": number, "request": model.model_validate_json(line)})
+        except ValidationError as e:
+            rows.append({"line": number, "error": str(e)})
+    return rows
+
+
+def _schedule(
+    rows: List[Dict[str, Any]],
+    key: Callable[[M], str],
+    call: Callable[[M], Awaitable[Any]],
+    concurrency: int,
+) -> Tuple[List[Dict[str, Any]], Dict[str, asyncio.Task]]:
+    """Start one call per distinct key; return row outcomes and their tasks."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    first_line: Dict[str, int] = {}
+    tasks: Dict[str, asyncio.Task] = {}
+
+    async def run_one(request: M) -> Any:
+        async with semaphore:
+            return await call(request)
+
+    outcomes = []
+    for row in rows:
+        if "request" not in row:
+            outcomes.append(row)
+            continue
+        row_key = key(row["request"])
+        outcome = {"line": row["line"], "key": row_key}
+        if row_key in tasks:
+            outcome["duplicate_of"] = first_line[row_key]
+        else:
+            first_line[row_key] = row["line"]
+            tasks[row_key] = asyncio.ensure_future(run_one(row["request"]))
+        outcomes.append(outcome)
+    return outcomes, tasks
+
+
+def _settle(outcome: Dict[str, Any], task: asyncio.Task) -> Dict[str, Any]:
+    """Record the result or exception of a finished task on a row outcome."""
+    if task.exception() is not None:
+        outcome["error"] = str(task.exception())
+        outcome["error_type"] = type(task.exception()).__name__
+    else:
+        outcome["result"] = task.result()
+    return outcome
+
+
+async def iter_batch(
+    rows: List[Dict[str, Any]],
+    key: Callable[[M], str],
+    call: Callable[[M], Awaitable[Any]],
+    concurrency: int,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run a batch like ``run_batch``, yielding each row as soon as it is done.
+
+    Rows that failed validation come first; the others follow in completion
+    order, duplicates together with the row they share a call with. Calls
+    still running when the consumer stops iterating are cancelled.
+    """
+    outcomes, tasks = _schedule(rows, key, call, concurrency)
+    waiting: Dict[str, List[Dict[str, Any]]] = {}
+    for outcome in outcomes:
+        if "key" in outcome:
+            waiting.setdefault(outcome["key"], []).append(outcome)
+        else:
+            yield outcome
+
+    key_of = {task: row_key for row_key, task in tasks.items()}
+    pending = set(tasks.values())
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=lambda t: waiting[key_of[t]][0]["line"]):
+                for outcome in waiting[key_of[task]]:
+                    yield _settle(outcome, task)
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def run_batch(
+    rows: List[Dict[str, Any]],
+    key: Callable[[M], str],
+    call: Callable[[M], Awaitable[Any]],
+    concurrency: int,
+) -> List[Dict[str, Any]]:
+    """
+    Run ``call`` once per distinct request key, ``concurrency`` at a time.
+
+    Rows with the same key share one call; later duplicates point at the
+    first row through ``duplicate_of``. A call that raises only fails its
+    own rows.
+
+    Returns:
+        One outcome per row, in input order
+    """
+    outcomes = [outcome async for outcome in iter_batch(rows, key, call, concurrency)]
+    return sorted(outcomes, key=lambda outcome: outcome["line"])
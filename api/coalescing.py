@@ -0,0 +1,58 @@
+"""In-flight request coalescing for identical concurrent Clear API calls."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestCoalescer:
+    """
+    Share one in-flight call between identical concurrent requests.
+
+    The first caller for a key starts the work; callers arriving while it
+    runs await the same task and receive the same result (or exception).
+    The task is shielded, so a client that disconnects does not cancel
+    the work for the others.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``factory`` for ``key`` unless an identical call is in flight.
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def is_running(self, key: str) -> bool:
+        """Return True if a call for ``key`` is in flight."""
+        return key in self._in_flight
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Consume the exception so an unawaited failure is not logged
+            task.exception()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return coalescing counters."""
+        return {
+            "in_flight": len(self._in_flight),
+            "started": self.started,
+            "coalesced": self.coalesced,
+        }
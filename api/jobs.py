@@ -0,0 +1,339 @@
+"""Durable background jobs for searches that run longer than a request."""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from diskcache import Cache
+from fastapi.concurrency import run_in_threadpool
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED = (SUCCEEDED, FAILED)
+
+# number of queued jobs, and the lease expiry of every running job by id
+QUEUED_COUNT_KEY = "jobs:queued"
+LEASES_KEY = "jobs:leases"
+
+
+class JobQueue:
+    """
+    Job records and a FIFO queue of job ids stored in one diskcache ``Cache``.
+
+    Records live under ``job:<id>`` and survive restarts; finished jobs
+    expire after ``retention`` seconds. Each record has a copy without its
+    result under ``job-status:<id>``, cheap to poll while a report is large.
+    A worker that claims a job holds a lease on it and renews it while the
+    job runs. Jobs whose lease ran out (their process died) are put back on
+    the queue by ``recover``, up to ``max_attempts`` runs in total. Every
+    process sharing the directory can claim jobs; ``Cache.pull`` hands each
+    queued id to exactly one of them.
+
+    The number of queued jobs and the leases of running jobs are kept up to
+    date on every change, so neither ``recover`` nor ``get_stats`` has to
+    scan the records of retained jobs.
+    """
+
+    def __init__(
+        self,
+        cache: Cache,
+        retention: float = 86400.0,
+        lease: float = 120.0,
+        max_attempts: int = 3,
+    ):
+        self.cache = cache
+        self.retention = retention
+        self.lease = lease
+        self.max_attempts = max_attempts
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"job:{job_id}"
+
+    @staticmethod
+    def _status_key(job_id: str) -> str:
+        return f"job-status:{job_id}"
+
+    def _save(self, job: Dict[str, Any], previous: Optional[str]) -> Dict[str, Any]:
+        """Store a job that was in the ``previous`` status (None if new)."""
+        job["updated_at"] = time.time()
+        expire = self.retention if job["status"] in FINISHED else None
+        self.cache.set(self._key(job["id"]), job, expire=expire)
+        status = {key: value for key, value in job.items() if key != "result"}
+        self.cache.set(self._status_key(job["id"]), status, expire=expire)
+
+        if previous != job["status"]:
+            if previous == QUEUED:
+                self.cache.incr(QUEUED_COUNT_KEY, -1)
+            if job["status"] == QUEUED:
+                self.cache.incr(QUEUED_COUNT_KEY)
+        if RUNNING in (previous, job["status"]):
+            leases = self.cache.get(LEASES_KEY, {})
+            if job["status"] == RUNNING:
+                leases[job["id"]] = job["lease_expires"]
+            else:
+                leases.pop(job["id"], None)
+            self.cache.set(LEASES_KEY, leases)
+        return job
+
+    def submit(self, request: Dict[str, Any], account_id: Optional[str] = None) -> Dict:
+        """
+        Store a new job and queue it.
+
+        Returns:
+            Dict: The job record
+        """
+        now = time.time()
+        job = {
+            "id": uuid.uuid4().hex,
+            "status": QUEUED,
+            "request": request,
+            "account_id": account_id,
+            "attempts": 0,
+            "created_at": now,
+            "started_at": None,
+            "finished_at": None,
+            "lease_expires": None,
+            "result": None,
+            "error": None,
+        }
+        with self.cache.transact():
+            self._save(job, None)
+            self.cache.push(job["id"], prefix="queue")
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job record."""
+        return self.cache.get(self._key(job_id))
+
+    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job record without its result."""
+        return self.cache.get(self._status_key(job_id))
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """Take the next queued job and mark it running, if there is one."""
+        while True:
+            with self.cache.transact():
+                _, job_id = self.cache.pull(prefix="queue")
+                if job_id is None:
+                    return None
+                job = self.get(job_id)
+                # expired or already finished records are skipped
+                if job is None or job["status"] != QUEUED:
+                    continue
+                job.update(
+                    status=RUNNING,
+                    attempts=job["attempts"] + 1,
+                    started_at=time.time(),
+                    lease_expires=time.time() + self.lease,
+                )
+                return self._save(job, QUEUED)
+
+    def renew(self, job_id: str) -> None:
+        """Extend the lease of a running job."""
+        with self.cache.transact():
+            job = self.get(job_id)
+            if job is not None and job["status"] == RUNNING:
+                job["lease_expires"] = time.time() + self.lease
+                self._save(job, RUNNING)
+
+    def requeue(self, job_id: str) -> None:
+        """Put a running job back on the queue, e.g. when its worker stops."""
+        with self.cache.transact():
+            job = self.get(job_id)
+            if job is not None and job["status"] == RUNNING:
+                job.update(status=QUEUED, lease_expires=None)
+                self._save(job, RUNNING)
+                self.cache.push(job_id, prefix="queue")
+
+    def finish(
+        self, job_id: str, result: Any = None, error: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Record the outcome of a job: failed if ``error`` is set."""
+        with self.cache.transact():
+            job = self.get(job_id)
+            if job is None:
+                return None
+            previous = job["status"]
+            job.update(
+                status=FAILED if error is not None else SUCCEEDED,
+                result=result,
+                error=error,
+                finished_at=time.time(),
+                lease_expires=None,
+            )
+            return self._save(job, previous)
+
+    def recover(self) -> int:
+        """
+        Requeue running jobs whose lease expired.
+
+        Jobs that already ran ``max_attempts`` times are failed instead.
+
+        Returns:
+            int: Number of jobs requeued or failed
+        """
+        now = time.time()
+        recovered = 0
+        leases = self.cache.get(LEASES_KEY, {})
+        for job_id in [job_id for job_id, expires in leases.items() if expires <= now]:
+            with self.cache.transact():
+                job = self.get(job_id)
+                if job is None or job["status"] != RUNNING:
+                    # the record expired or was evicted, forget its lease
+                    current = self.cache.get(LEASES_KEY, {})
+                    if current.pop(job_id, None) is not None:
+                        self.cache.set(LEASES_KEY, current)
+                    continue
+                if job["lease_expires"] > now:
+                    continue
+                if job["attempts"] >= self.max_attempts:
+                    job.update(
+                        status=FAILED,
+                        error="Job was interrupted too many times",
+                        finished_at=now,
+                        lease_expires=None,
+                    )
+                else:
+                    job.update(status=QUEUED, lease_expires=None)
+                    self.cache.push(job["id"], prefix="queue")
+                self._save(job, RUNNING)
+                recovered += 1
+        return recovered
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the number of queued and running jobs."""
+        return {
+            "queued": self.cache.get(QUEUED_COUNT_KEY, 0),
+            "running": len(self.cache.get(LEASES_KEY, {})),
+        }
+
+
+class JobWorkerPool:
+    """
+    Asyncio workers that run queued jobs with ``handler``.
+
+    Each worker claims one job at a time, keeps its lease renewed while the
+    handler runs, and records the result or the exception message. Idle
+    workers poll the queue every ``poll_interval`` seconds and wake up at
+    once for jobs submitted through ``notify`` in this process.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handler: Callable[[Dict[str, Any]], Awaitable[Any]],
+        workers: int = 4,
+        poll_interval: float = 1.0,
+    ):
+        self.queue = queue
+        self.handler = handler
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stats = {"succeeded": 0, "failed": 0, "recovered": 0}
+
+    async def start(self) -> None:
+        """Requeue interrupted jobs and start the workers."""
+        self._wakeup = asyncio.Event()
+        self._stats["recovered"] += await run_in_threadpool(self.queue.recover)
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.ensure_future(self._recover_periodically()))
+
+    async def stop(self) -> None:
+        """
+        Stop the workers.
+
+        Jobs that were running are cancelled and put back on the queue.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wake an idle worker after a job was submitted."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _work(self) -> None:
+        while True:
+            job = await run_in_threadpool(self.queue.claim)
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job)
+
+    async def _run(self, job: Dict[str, Any]) -> None:
+        task = asyncio.ensure_future(self.handler(job))
+        while not task.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(task), self.queue.lease / 3)
+            except asyncio.TimeoutError:
+                await run_in_threadpool(self.queue.renew, job["id"])
+            except asyncio.CancelledError:
+                task.cancel()
+                self.queue.requeue(job["id"])
+                raise
+            except Exception:
+                break
+
+        if task.exception() is not None:
+            self._stats["failed"] += 1
+            self.logger.warning("Job %s failed: %s", job["id"], task.exception())
+            await run_in_threadpool(
+                self.queue.finish, job["id"], None, str(task.exception())
+            )
+        else:
+            self._stats["succeeded"] += 1
+            await run_in_threadpool(self.queue.finish, job["id"], task.result())
+
+    async def _recover_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.queue.lease)
+            self._stats["recovered"] += await run_in_threadpool(self.queue.recover)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return worker counters and the queue length."""
+        return {"workers": self.workers, **self._stats, **self.queue.get_stats()}
+
+
+async def watch_job(
+    queue: JobQueue, job_id: str, timeout: float, poll_interval: float = 0.25
+):
+    """
+    Yield a job record whenever its status changes, until it finishes.
+
+    Polls the record without its result; the full record, report included,
+    is only read once the job has finished. Stops after ``timeout`` seconds
+    without the job finishing, or at once if the job does not exist.
+    """
+    deadline = time.monotonic() + timeout
+    last_status = None
+    while True:
+        job = await run_in_threadpool(queue.get_status, job_id)
+        if job is None:
+            return
+        if job["status"] in FINISHED:
+            job = await run_in_threadpool(queue.get, job_id)
+            if job is not None:
+                yield job
+            return
+        if job["status"] != last_status:
+            last_status = job["status"]
+            # only finished jobs have a result
+            yield {**job, "result": None}
+        if time.monotonic() >= deadline:
+            return
+        await asyncio.sleep(poll_interval)
@@ -1,29 +1,66 @@
 """Parser module for converting XML responses to JSON format."""
 
 import xml.etree.ElementTree as ET
-from typing import Dict, Any
-
-
-def parse_business_report_xml(xml_content: str) -> Dict[str, Any]:
+from typing import Dict, Any, Iterable, Union
+
+from processing_engine.utils.keyword_classifier import get_keyword_classifiers
+from processing_engine.utils.report_stream import (
+    STATUS,
+    iter_report_elements,
+    parse_sections,
+    unevaluated_flags,
+)
+from processing_engine.utils.xml_backend import (
+    ParseError,
+    find_descendant,
+    find_descendants,
+    get_xml_backend,
+)
+
+
+def parse_business_report_xml(
+    xml_content: str, sections: Union[str, Iterable[str], None] = None
+) -> Dict[str, Any]:
     """
     Parse business report XML and convert to JSON format.
+
+    The XML is read in a single streaming pass: each section is converted
+    and analysed as soon as it has been read, then dropped.
+
+    Args:
+        xml_content: Report XML
+        sections: Allow-list of sections to convert and analyse (e.g.
+            ``"UCC,LienJudgment,Criminal"``); None converts every section.
+            Risk flags that none of the listed sections evaluate are None.
     """
+    sections = parse_sections(sections)
+    result = _new_report_result()
+    found_status = False
     try:
-        root = ET.fromstring(xml_content)
-    except ET.ParseError as e:
+        for kind, element in iter_report_elements(xml_content, sections):
+            if kind == STATUS:
+                _set_status(result, element)
+                found_status = True
+            else:
+                _add_section(result, element)
+    except ParseError as e:
         return {"error": f"Invalid XML: {str(e)}"}
 
-        # Extract status information
-    status = root.find(".//Status")
-    if status is None:
+    if not found_status:
         return {"error": "No Status section found in XML"}
+    for flag in unevaluated_flags(sections):
+        result["Flags"][flag] = None
+    return result
+
 
-    result = {
-        "Reference": _get_text(status, "Reference"),
-        "Type": _get_text(status, "ReportType"),
-        "Subject": _get_text(status, "ReportSubject"),
-        "ID": _get_text(status, "EntityId"),
-        "Timestamp": _get_text(status, "TimeStamp"),
+def _new_report_result() -> Dict[str, Any]:
+    """Empty parsed report, with the keys in output order."""
+    return {
+        "Reference": None,
+        "Type": None,
+        "Subject": None,
+        "ID": None,
+        "Timestamp": None,
         "Flags": {
             "UCCFilings": "None",
             "LiensAndJudgements": "None",
@@ -39,48 +76,67 @@ def parse_business_report_xml(xml_content: str) -> Dict[str, Any]:
         "Results": {},
     }
 
-    # Extract section results
-    section_results = root.findall(".//SectionResults")
-    for section in section_results:
-        section_name = _get_text(section, "SectionName")
-        # Remove "Section" suffix for cleaner naming
-        clean_section_name = section_name.replace("Section", "")
-        section_data = {
-            "Description": _get_text(section, "CLEARReportDescription"),
-            "Status": _get_text(section, "SectionStatus"),
-            "RecordCount": _get_text(section, "SectionRecordCount"),
-            "Details": _parse_section_details(section),
-        }
-        result["Results"][clean_section_name] = section_data
 
-        # Handle special sections
-        if section_name == "QuickAnalysisFlagSection":
-            result["Flags"] = {
-                **result.get("Flags", {}),
-                **_extract_risk_flags(section),
-            }
-        elif section_name == "UCCSection":
-            ucc_analysis = _analyze_ucc_filings(section)
-            result["UCCFilingsAnalysis"] = ucc_analysis
-            result["Flags"]["UCCFilings"] = ucc_analysis["risk_assessment"]
-        elif section_name == "LienJudgmentSection":
-            liens_analysis = _analyze_liens_and_judgments(section)
-            result["LiensAndJudgementsAnalysis"] = liens_analysis
-            result["Flags"]["LiensAndJudgements"] = liens_analysis["risk_assessment"]
-        elif section_name == "CriminalSection":
-            criminal_analysis = _analyze_criminal_history(section)
-            result["CriminalHistoryAnalysis"] = criminal_analysis
-            result["Flags"]["CriminalHistory"] = criminal_analysis["risk_assessment"]
-        elif section_name == "LawsuitSection":
-            lawsuit_analysis = _analyze_lawsuits(section)
-            result["LawsuitAnalysis"] = lawsuit_analysis
-            result["Flags"]["Lawsuits"] = lawsuit_analysis["risk_assessment"]
-        elif section_name == "DocketSection":
-            docket_analysis = _analyze_docket_records(section)
-            result["DocketAnalysis"] = docket_analysis
-            result["Flags"]["Dockets"] = docket_analysis["risk_assessment"]
+def _set_status(result: Dict[str, Any], status: ET.Element) -> None:
+    """Copy the report's status information into the result."""
+    result["Reference"] = _get_text(status, "Reference")
+    result["Type"] = _get_text(status, "ReportType")
+    result["Subject"] = _get_text(status, "ReportSubject")
+    result["ID"] = _get_text(status, "EntityId")
+    result["Timestamp"] = _get_text(status, "TimeStamp")
+
+
+def _add_section(result: Dict[str, Any], section: ET.Element) -> None:
+    """Convert one SectionResults element and run its analysis, if any."""
+    section_name = _get_text(section, "SectionName")
+    # Remove "Section" suffix for cleaner naming
+    clean_section_name = section_name.replace("Section", "")
+    section_data = {
+        "Description": _get_text(section, "CLEARReportDescription"),
+        "Status": _get_text(section, "SectionStatus"),
+        "RecordCount": _get_text(section, "SectionRecordCount"),
+        "Details": _parse_section_details(section),
+    }
+    result["Results"][clean_section_name] = section_data
 
-    return result
+    # Handle special sections
+    if section_name == "QuickAnalysisFlagSection":
+        result["Flags"] = {
+            **result.get("Flags", {}),
+            **_extract_risk_flags(section),
+        }
+    elif section_name == "UCCSection":
+        ucc_analysis = _analyze_ucc_filings(section)
+        result["UCCFilingsAnalysis"] = ucc_analysis
+        result["Flags"]["UCCFilings"] = ucc_analysis["risk_assessment"]
+    elif section_name == "LienJudgmentSection":
+        liens_analysis = _analyze_liens_and_judgments(section)
+        result["LiensAndJudgementsAnalysis"] = liens_analysis
+        result["Flags"]["LiensAndJudgements"] = liens_analysis["risk_assessment"]
+    elif section_name == "CriminalSection":
+        criminal_analysis = _analyze_criminal_history(section)
+        result["CriminalHistoryAnalysis"] = criminal_analysis
+        result["Flags"]["CriminalHistory"] = criminal_analysis["risk_assessment"]
+    elif section_name == "LawsuitSection":
+        lawsuit_analysis = _analyze_lawsuits(section)
+        result["LawsuitAnalysis"] = lawsuit_analysis
+        result["Flags"]["Lawsuits"] = lawsuit_analysis["risk_assessment"]
+    elif section_name == "DocketSection":
+        docket_analysis = _analyze_docket_records(section)
+        result["DocketAnalysis"] = docket_analysis
+        result["Flags"]["Dockets"] = docket_analysis["risk_assessment"]
+
+
+def parse_person_report_xml(
+    xml_content: str, sections: Union[str, Iterable[str], None] = None
+) -> Dict[str, Any]:
+    """
+    Parse person report XML and convert to JSON format.
+
+    Person reports share the Status and SectionResults layout of business
+    reports; the analyses only apply to the sections a report contains.
+    """
+    return parse_business_report_xml(xml_content, sections)
 
 
 def _get_text(element: ET.Element, tag: str) -> str:
@@ -94,7 +150,7 @@ def _extract_risk_flags(section: ET.Element) -> Dict[str, str]:
     flags = {}
 
     # Find the RiskFlagsWithDocguids element (note: lowercase 'g')
-    risk_flags = section.find(".//RiskFlagsWithDocguids")
+    risk_flags = find_descendant(section, "RiskFlagsWithDocguids")
     if risk_flags is None:
         return flags
 
@@ -114,7 +170,7 @@ def _extract_risk_flags(section: ET.Element) -> Dict[str, str]:
 
 def _analyze_ucc_filings(section: ET.Element) -> Dict[str, Any]:
     """Analyze UCC filings to determine active vs inactive status."""
-    ucc_records = section.findall(".//UCCRecord")
+    ucc_records = find_descendants(section, "UCCRecord")
     if not ucc_records:
         return {"active_count": 0, "inactive_count": 0, "filings": []}
 
@@ -123,15 +179,15 @@ def _analyze_ucc_filings(section: ET.Element) -> Dict[str, Any]:
     stats = {"active": 0, "inactive": 0, "all_groups": []}
 
     for record in ucc_records:
-        filing_info = record.find(".//UCCFilingInfo")
+        filing_info = find_descendant(record, "UCCFilingInfo")
         if filing_info is None:
             continue
 
-        filing_stmt = filing_info.find(".//FilingStmtInfo")
+        filing_stmt = find_descendant(filing_info, "FilingStmtInfo")
         if filing_stmt is None:
             continue
 
-        business_info = filing_stmt.find(".//BusinessInfo")
+        business_info = find_descendant(filing_stmt, "BusinessInfo")
         if business_info is None:
             continue
 
@@ -214,7 +270,7 @@ def _analyze_ucc_filings(section: ET.Element) -> Dict[str, Any]:
 
 def _analyze_criminal_history(section: ET.Element) -> Dict[str, Any]:
     """Analyze criminal records to provide summary statistics and risk assessment."""
-    criminal_records = section.findall(".//CriminalExpansionRecord")
+    criminal_records = find_descendants(section, "CriminalExpansionRecord")
     if not criminal_records:
         return {
             "risk_assessment": "None",
@@ -227,6 +283,8 @@ def _analyze_criminal_history(section: ET.Element) -> Dict[str, Any]:
     individuals = set()
     all_criminal_records = []
 
+    classify_offense = get_keyword_classifiers()["criminal_offense"].classify
+
     # Categories for risk assessment
     violent_crimes = 0
     financial_crimes = 0
@@ -236,17 +294,17 @@ def _analyze_criminal_history(section: ET.Element) -> Dict[str, Any]:
 
     for record in criminal_records:
         # Extract defendant information
-        defendant_info = record.find(".//DefendantInfo")
+        defendant_info = find_descendant(record, "DefendantInfo")
         if defendant_info is not None:
-            person_info = defendant_info.find(".//PersonInfo")
+            person_info = find_descendant(defendant_info, "PersonInfo")
             if person_info is not None:
-                person_name = person_info.find(".//PersonName")
+                person_name = find_descendant(person_info, "PersonName")
                 if person_name is not None:
                     full_name = _get_text(person_name, "FullName")
                     individuals.add(full_name)
 
         # Extract offender information
-        offender_infos = record.findall(".//OffenderInfo")
+        offender_infos = find_descendants(record, "OffenderInfo")
         for offender_info in offender_infos:
             criminal_offense = _get_text(offender_info, "CriminalOffense")
             crime_date = _get_text(offender_info, "CrimeDate")
@@ -256,31 +314,10 @@ def _analyze_criminal_history(section: ET.Element) -> Dict[str, Any]:
             docket_number = _get_text(offender_info, "DocketNumber")
 
             # Determine crime category
-            is_violent = any(
-                violent in criminal_offense.upper()
-                for violent in [
-                    "ASSAULT",
-                    "BATTERY",
-                    "MURDER",
-                    "ROBBERY",
-                    "BURGLARY",
-                    "KIDNAP",
-                ]
-            )
-            is_financial = any(
-                financial in criminal_offense.upper()
-                for financial in [
-                    "FRAUD",
-                    "THEFT",
-                    "EMBEZZLEMENT",
-                    "FORGERY",
-                    "MONEY LAUNDERING",
-                ]
-            )
-            is_felony = any(
-                felony in criminal_offense.upper()
-                for felony in ["FELONY", "AGGRAVATED", "FIRST DEGREE", "SECOND DEGREE"]
-            )
+            categories = classify_offense(criminal_offense)
+            is_violent = "violent" in categories
+            is_financial = "financial" in categories
+            is_felony = "felony" in categories
 
             # Check if recent (last 10 years)
             try:
@@ -349,7 +386,7 @@ def _analyze_criminal_history(section: ET.Element) -> Dict[str, Any]:
 
 def _analyze_liens_and_judgments(section: ET.Element) -> Dict[str, Any]:
     """Analyze liens and judgments to provide summary statistics and risk assessment."""
-    lien_records = section.findall(".//LienJudgeRecord")
+    lien_records = find_descendants(section, "LienJudgeRecord")
     if not lien_records:
         return {
             "risk_assessment": "None",
@@ -373,10 +410,11 @@ def _analyze_liens_and_judgments(section: ET.Element) -> Dict[str, Any]:
     recent_liens = 0
     high_value_liens = 0
     all_lien_records = []
+    classify_filing_type = get_keyword_classifiers()["lien_filing_type"].classify
 
     for record in lien_records:
         # Extract filing information
-        filing_info = record.find(".//FilingInfo")
+        filing_info = find_descendant(record, "FilingInfo")
         if filing_info is None:
             continue
 
@@ -385,19 +423,19 @@ def _analyze_liens_and_judgments(section: ET.Element) -> Dict[str, Any]:
         release_date = _get_text(filing_info, "ReleaseDate")
 
         # Extract debtor information
-        debtor_info = record.find(".//Debtor")
+        debtor_info = find_descendant(record, "Debtor")
         if debtor_info is None:
             continue
 
         owed_amount = _get_text(debtor_info, "DebtorOwedAmount")
 
         # Extract creditor information
-        creditor_info = record.find(".//Creditor")
+        creditor_info = find_descendant(record, "Creditor")
         creditor_name = ""
         if creditor_info is not None:
-            party_info = creditor_info.find(".//PartyInfo")
+            party_info = find_descendant(creditor_info, "PartyInfo")
             if party_info is not None:
-                person_name = party_info.find(".//PersonName")
+                person_name = find_descendant(party_info, "PersonName")
                 if person_name is not None:
                     creditor_name = _get_text(person_name, "FullName")
 
@@ -411,13 +449,9 @@ def _analyze_liens_and_judgments(section: ET.Element) -> Dict[str, Any]:
             pass
 
         # Determine lien characteristics
-        is_tax_lien = any(
-            tax in filing_type.upper()
-            for tax in ["TAX", "IRS", "STATE TAX", "FEDERAL TAX"]
-        )
-        is_civil_judgment = any(
-            judgment in filing_type.upper() for judgment in ["JUDGMENT", "CIVIL"]
-        )
+        categories = classify_filing_type(filing_type)
+        is_tax_lien = "tax_lien" in categories
+        is_civil_judgment = "civil_judgment" in categories
         is_released = release_date is not None and release_date.strip() != ""
         is_recent = False
         is_high_value = amount > 10000
@@ -525,6 +559,9 @@ def _analyze_lawsuits(section: ET.Element) -> Dict[str, Any]:
     class_action_lawsuits = 0
     regulatory_lawsuits = 0
     all_lawsuit_records = []
+    classifiers = get_keyword_classifiers()
+    classify_case_type = classifiers["lawsuit_case_type"].classify
+    classify_party = classifiers["lawsuit_party"].classify
 
     for record in lawsuit_records:
         # Extract lawsuit information directly from record
@@ -537,60 +574,36 @@ def _analyze_lawsuits(section: ET.Element) -> Dict[str, Any]:
 
         # Check if company is defendant or plaintiff
         company_interest = ""
-        defendants = record.findall(".//Defendant")
-        plaintiffs = record.findall(".//Plaintiff")
+        defendants = find_descendants(record, "Defendant")
+        plaintiffs = find_descendants(record, "Plaintiff")
 
         # Check if Thomson/company name appears in defendants or plaintiffs
-        company_names = ["THOMSON", "REUTERS", "THOMSON REUTERS", "THOMSON CORPORATION"]
         for defendant in defendants:
             full_name = _get_text(defendant, "FullName")
-            if any(name in full_name.upper() for name in company_names):
+            if "company" in classify_party(full_name):
                 company_interest = "DEFENDANT"
                 break
 
         if not company_interest:
             for plaintiff in plaintiffs:
                 full_name = _get_text(plaintiff, "FullName")
-                if any(name in full_name.upper() for name in company_names):
+                if "company" in classify_party(full_name):
                     company_interest = "PLAINTIFF"
                     break
 
         # Determine lawsuit characteristics based on actual case types
-        # Handle empty or None case_type
-        case_type_upper = case_type.upper() if case_type else ""
+        categories = classify_case_type(case_type)
+        is_employment = "employment" in categories
+        is_contract = "contract" in categories
 
-        is_employment = case_type in ["WRONGFUL TERMINATION"]
-
-        is_contract = case_type in [
-            "BREACH OF CONTRACT",
-            "OTHER - CONTRACT ACTION",
-            "OTHER - CONTRACTS",
-            "ACCOUNT STATED",
-        ]
-
-        # Check for class action indicators
-        # 1. Multiple plaintiffs (common in class actions)
-        # 2. Specific case types that might indicate class actions
+        # Class action indicators: multiple plaintiffs (common in class
+        # actions) or a case type that suggests one
         multiple_plaintiffs = len(plaintiffs) > 1
-        class_action_keywords = [
-            "CLASS ACTION",
-            "MASS TORT",
-            "COLLECTIVE ACTION",
-            "REPRESENTATIVE ACTION",
-        ]
-        class_action_case_types = ["FRAUD"]  # Based on actual data
-
-        is_class_action = (
-            multiple_plaintiffs
-            or any(keyword in case_type_upper for keyword in class_action_keywords)
-            or case_type in class_action_case_types
-        )
+        is_class_action = multiple_plaintiffs or "class_action" in categories
 
         # Regulatory cases - based on actual data, these are rare
         # Most regulatory cases would be handled by federal agencies
-        is_regulatory = case_type in [
-            "MISC - FOREIGN CIVIL JUDGMENTS"  # Could involve regulatory compliance
-        ]
+        is_regulatory = "regulatory" in categories
         is_active = company_interest in ["DEFENDANT", "PLAINTIFF"] and filing_date
         is_recent = False
         is_high_value = False  # Would need amount field if available
@@ -666,7 +679,7 @@ def _analyze_lawsuits(section: ET.Element) -> Dict[str, Any]:
 
 def _analyze_docket_records(section: ET.Element) -> Dict[str, Any]:
     """Analyze docket records to provide summary statistics and risk assessment."""
-    docket_records = section.findall(".//CompanyDocketRecord")
+    docket_records = find_descendants(section, "CompanyDocketRecord")
 
     if not docket_records:
         return {
@@ -691,7 +704,7 @@ def _analyze_docket_records(section: ET.Element) -> Dict[str, Any]:
     all_docket_records = []
 
     for record in docket_records:
-        docket_info = record.find(".//DocketInfo")
+        docket_info = find_descendant(record, "DocketInfo")
         if docket_info is None:
             continue
 
@@ -823,7 +836,7 @@ def _determine_final_ucc_status(filings: list) -> str:
 
 def _parse_section_details(section: ET.Element) -> Dict[str, Any]:
     """Parse the SectionDetails content."""
-    section_details = section.find(".//SectionDetails")
+    section_details = find_descendant(section, "SectionDetails")
     if section_details is None:
         return {}
 
@@ -883,12 +896,12 @@ def parse_business_search_response(xml_content: str) -> Dict[str, Any]:
         Dict with GroupId and other search result data
     """
     try:
-        root = ET.fromstring(xml_content)
-    except ET.ParseError as e:
+        root = get_xml_backend().fromstring(xml_content)
+    except ParseError as e:
         return {"error": f"Invalid XML: {str(e)}"}
 
     # Extract GroupId from search results
-    group_id_element = root.find(".//GroupId")
+    group_id_element = find_descendant(root, "GroupId")
     if group_id_element is None:
         return {"error": "No GroupId found in search results"}
 
@@ -0,0 +1,36 @@
+"""NDJSON streaming of batch results and parsed reports."""
+
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterator
+
+from fastapi.encoders import jsonable_encoder
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def ndjson_line(item: Any) -> bytes:
+    """Encode one item as a line of NDJSON."""
+    return json.dumps(jsonable_encoder(item), separators=(",", ":")).encode() + b"\n"
+
+
+async def ndjson_stream(items: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+    """Encode items as NDJSON lines while they are produced."""
+    async for item in items:
+        yield ndjson_line(item)
+
+
+def report_parts(report: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Split a parsed report into a header and one part per section.
+
+    The first part holds every top-level field except ``Results``; each
+    following part holds one entry of ``Results``. A client can rebuild
+    the report with ``header | {"Results": {name: data, ...}}``. Reports
+    without sections (such as error bodies) are a single header part.
+    """
+    yield {
+        "part": "header",
+        "data": {key: value for key, value in report.items() if key != "Results"},
+    }
+    for name, section in (report.get("Results") or {}).items():
+        yield {"part": "section", "name": name, "data": section}
@@ -3,8 +3,12 @@
 import os
 import time
 from typing import Dict, Optional
-import requests
-from diskcache import Cache
+from processing_engine.cache.tiered_cache import TieredCache
+from processing_engine.external_integrations.token_provider import (
+    EXPIRY_BUFFER,
+    TokenProvider,
+    get_token_provider,
+)
 from .config import ENDPOINTS
 
 
@@ -12,14 +16,17 @@ class Token:
     """
     Singleton class for managing Clear API authentication tokens.
 
-    This class provides persistent token caching using diskcache and handles
-    token expiry automatically. It uses the authentication endpoint from config.py
-    and reads client credentials from environment variables.
+    This class provides persistent token caching using diskcache (behind an
+    in-process memory tier) and handles token expiry automatically. It uses
+    the authentication endpoint from config.py and reads client credentials
+    from environment variables. Tokens are served from the shared in-process
+    TokenProvider, so the disk is only read on a miss.
     """
 
     _instance: Optional["Token"] = None
-    _cache: Optional[Cache] = None
+    _cache: Optional[TieredCache] = None
     _cache_key = "clear_api_token"
+    _provider: Optional[TokenProvider] = None
 
     def __new__(cls) -> "Token":
         """Ensure only one instance of Token class exists."""
@@ -33,10 +40,6 @@ class Token:
         if getattr(self, "_initialized", False):
             return
 
-        # Initialize diskcache for persistent storage
-        cache_dir = os.path.join(os.path.expanduser("~"), ".clear_api_cache")
-        self._cache = Cache(cache_dir)
-
         # Get authentication endpoint from config
         self.auth_url = ENDPOINTS["auth"]
 
@@ -50,6 +53,13 @@ class Token:
                 "must be set"
             )
 
+        # Share the in-process token holder (and its diskcache) with other callers
+        cache_dir = os.path.join(os.path.expanduser("~"), ".clear_api_cache")
+        self._provider = get_token_provider(
+            self.auth_url, self.client_key, self.client_secret, cache_dir
+        )
+        self._cache = self._provider.cache
+
         self._initialized = True
 
     def get_token(self) -> str:
@@ -60,22 +70,19 @@ class Token:
             str: access_token
 
         Raises:
-            requests.RequestException: If token request fails
+            httpx.HTTPError: If token request fails
             ValueError: If client credentials are missing
         """
-        # Check if we have a cached token that's still valid
-        cached_data = self._cache.get(self._cache_key)
-
-        if cached_data:
-            token, expires_at = cached_data
-            current_time = time.time()
+        return self._provider.get_token()
 
-            # If token is still valid (with 60 second buffer), return it
-            if current_time < expires_at - 60:
-                return token
+    async def get_token_async(self) -> str:
+        """
+        Get a valid access token without blocking the event loop.
 
-        # Token expired or doesn't exist, get a new one
-        return self._refresh_token()
+        Returns:
+            str: access_token
+        """
+        return await self._provider.get_token_async()
 
     def _refresh_token(self) -> str:
         """
@@ -85,34 +92,22 @@ class Token:
             str: access_token
 
         Raises:
-            requests.RequestException: If token request fails
+            httpx.HTTPError: If token request fails
         """
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": self.client_key,
-            "client_secret": self.client_secret,
-        }
-
-        response = requests.post(self.auth_url, headers=headers, data=data, timeout=30)
-        response.raise_for_status()
-
-        token_data = response.json()
-        access_token = token_data["access_token"]
-        expires_in = token_data["expires_in"]
-
-        # Calculate absolute expiry time
-        expires_at = time.time() + expires_in
-
-        # Cache the token with its expiry time
-        self._cache.set(self._cache_key, (access_token, expires_at))
-
-        return access_token
+        return self._provider.refresh()
 
     def clear_cache(self) -> None:
         """Clear the cached token."""
-        self._cache.delete(self._cache_key)
+        self._provider.clear()
+
+    def get_refresh_stats(self) -> Dict:
+        """
+        Get token state and refreshes per hour across all worker processes.
+
+        Returns:
+            Dict: Token validity, current lease holder and refresh counters
+        """
+        return self._provider.get_stats()
 
     def get_cached_token_info(self) -> Optional[Dict]:
         """
@@ -121,7 +116,7 @@ class Token:
         Returns:
             Optional[Dict]: Token info or None if no cached token
         """
-        cached_data = self._cache.get(self._cache_key)
+        cached_data = self._provider.snapshot()
         if not cached_data:
             return None
 
@@ -132,5 +127,5 @@ class Token:
         return {
             "token": token[:10] + "..." if len(token) > 10 else token,
             "expires_in": expires_in,
-            "is_valid": current_time < expires_at - 60,
+            "is_valid": current_time < expires_at - EXPIRY_BUFFER,
         }
@@ -1,42 +1,163 @@
 """FastAPI application for Clear API"""
 
 # Standard library imports
+import asyncio
 import hashlib
+import json
+import logging
 import os
-import xml.etree.ElementTree as ET
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import partial
+from typing import AbstractSet, Any, Optional, Union
 
 # Third-party imports
 from dotenv import load_dotenv
-import requests
-from fastapi import FastAPI
+import httpx
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from diskcache import Cache
 
 # First-party imports
 from api.config import ENDPOINTS
 from api.token import Token
-from api.builder import build_business_search_xml, build_business_report_xml
-from api.parser import parse_business_report_xml
-from models import BusinessSearchRequest
+from api.builder import (
+    build_business_report_xml,
+    build_business_search_xml,
+    build_person_report_xml,
+    build_person_search_xml,
+)
+from api.batch import iter_batch, parse_jsonl, run_batch
+from api.coalescing import RequestCoalescer
+from api.jobs import JobQueue, JobWorkerPool, watch_job
+from api.parser import parse_business_report_xml, parse_person_report_xml
+from api.streaming import NDJSON_MEDIA_TYPE, ndjson_line, ndjson_stream, report_parts
+from models import (
+    BusinessSearchRequest,
+    BusinessWithPrincipalsRequest,
+    PersonSearchRequest,
+)
 from processing_engine.processors.external_reports.clear_processor import ClearProcessor
 from processing_engine.models.execution import ProcessingResult
+from processing_engine.cache.keys import request_fingerprint
+from processing_engine.cache.negative_cache import (
+    INVALID_REQUEST,
+    NO_MATCH,
+    get_negative_cache,
+)
+from processing_engine.cache.report_cache import get_report_cache, view_name
+from processing_engine.cache.soft_ttl_cache import SoftTTLCache
+from processing_engine.cache.tiered_cache import TieredCache
+from processing_engine.config.clear_config import ClearAPIConfig
+from processing_engine.external_integrations.transport import get_transport
+from processing_engine.external_integrations.circuit_breaker import (
+    get_clear_circuit_breakers,
+)
+from processing_engine.external_integrations.exceptions import CircuitOpenError
+from processing_engine.external_integrations.rate_limiter import get_clear_rate_limiter
+from processing_engine.external_integrations.retry import (
+    IDEMPOTENT_METHODS,
+    get_clear_retry_policy,
+)
+from processing_engine.utils.report_stream import parse_sections
+from processing_engine.utils.xml_backend import get_xml_backend
 
 load_dotenv()
 
-app = FastAPI(debug=True)
+
+@asynccontextmanager
+async def lifespan(fastapi_app: FastAPI):
+    """Open the shared CLEAR HTTP client on startup and close it on shutdown."""
+    transport = get_transport()
+    fastapi_app.state.http_client = transport.open_async()
+    fastapi_app.state.job_workers = JobWorkerPool(
+        _jobs, run_search_job, workers=JOB_WORKERS
+    )
+    await fastapi_app.state.job_workers.start()
+    try:
+        yield
+    finally:
+        await fastapi_app.state.job_workers.stop()
+        await transport.aclose()
+
+
+app = FastAPI(debug=True, lifespan=lifespan)
+
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(_request: Request, exc: CircuitOpenError):
+    """Fail fast with 503 while a CLEAR endpoint's circuit is open."""
+    return JSONResponse(
+        status_code=503,
+        headers={"Retry-After": str(max(1, round(exc.retry_in)))},
+        content={"error": str(exc), "endpoint": exc.endpoint},
+    )
+
 
 # cache init
 CACHE_DIR = os.getenv(
     "SEARCH_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".clear_api_search_cache")
 )
 SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", str(8 * 3600)))
-_search_cache = Cache(CACHE_DIR)
+# request-keyed tier in front of the results-hash tier, skips every Clear call;
+# past the soft TTL the cached result is served while it is refreshed
+SEARCH_REQUEST_CACHE_TTL = int(os.getenv("SEARCH_REQUEST_CACHE_TTL", str(3600)))
+SEARCH_REQUEST_CACHE_HARD_TTL = int(
+    os.getenv("SEARCH_REQUEST_CACHE_HARD_TTL", str(SEARCH_CACHE_TTL))
+)
+# hot keys are served from process memory, misses fall through to diskcache
+_search_cache = TieredCache.from_config(
+    Cache(CACHE_DIR), ClearAPIConfig.from_environment()
+)
 
+_search_results = SoftTTLCache(
+    _search_cache, SEARCH_REQUEST_CACHE_TTL, SEARCH_REQUEST_CACHE_HARD_TTL
+)
 
-def get_headers(content_type: str = "application/xml") -> dict:
+# identical /search calls running at the same time share one Clear round trip
+_search_coalescer = RequestCoalescer()
+
+# background refreshes of stale search results, kept referenced until done
+_revalidations: set = set()
+_revalidation_stats = {"started": 0, "failed": 0}
+
+# distinct searches of one /search/batch upload running at a time; each one
+# still waits for the shared rate limiter before every Clear call
+SEARCH_BATCH_CONCURRENCY = int(os.getenv("SEARCH_BATCH_CONCURRENCY", "8"))
+
+# what differs between business and person searches; the pipeline is shared
+SEARCH_KINDS = {
+    "business": {
+        "search_xml": build_business_search_xml,
+        "report_xml": build_business_report_xml,
+        "parse_report": parse_business_report_xml,
+        "key_prefix": "search_req:",
+    },
+    "person": {
+        "search_xml": build_person_search_xml,
+        "report_xml": build_person_report_xml,
+        "parse_report": parse_person_report_xml,
+        "key_prefix": "person_req:",
+    },
+}
+
+# searches submitted to /jobs, kept on disk so they survive restarts
+JOBS_DIR = os.getenv(
+    "JOBS_DIR", os.path.join(os.path.expanduser("~"), ".clear_api_jobs")
+)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_RETENTION = int(os.getenv("JOB_RETENTION", str(24 * 3600)))
+_jobs = JobQueue(Cache(JOBS_DIR), retention=JOB_RETENTION)
+
+logger = logging.getLogger(__name__)
+
+
+async def get_headers(content_type: str = "application/xml") -> dict:
     """Get standardized headers for Clear API requests."""
 
-    token = Token().get_token()
+    # served from memory; disk and OAuth are only touched off the event loop
+    token = await Token().get_token_async()
 
     headers = {
         "Authorization": f"Bearer {token}",
@@ -45,7 +166,6 @@ def get_headers(content_type: str = "application/xml") -> dict:
         "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
         "Accept-Language": "en-US,en;q=0.9",
         "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
     }
 
     if content_type:
@@ -55,12 +175,57 @@ def get_headers(content_type: str = "application/xml") -> dict:
     return headers
 
 
+async def clear_request(
+    client: httpx.AsyncClient, method: str, url: str, endpoint: str, **kwargs
+) -> httpx.Response:
+    """Send one rate-limited CLEAR request, retrying transient failures."""
+    breaker = get_clear_circuit_breakers().get(endpoint)
+
+    async def send() -> httpx.Response:
+        await get_clear_rate_limiter().acquire_async(endpoint)
+        return await client.request(method, url, **kwargs)
+
+    return await get_clear_retry_policy().run_async(
+        lambda: breaker.call_async(send),
+        # a search or report POST that reached Clear must not be bought twice
+        idempotent=method.upper() in IDEMPOTENT_METHODS,
+    )
+
+
 @app.get("/")
 def read_root():
     """Return the root endpoint with API information."""
     return {"message": "Clear API Adapter", "version": "1.0.0"}
 
 
+@app.get("/metrics")
+def metrics():
+    """Return runtime statistics for the CLEAR integration."""
+    try:
+        token_stats = Token().get_refresh_stats()
+    except ValueError:
+        # credentials are not configured, there is no token to report on
+        token_stats = None
+
+    return {
+        "transport": get_transport().get_stats(),
+        "token": token_stats,
+        "circuit_breakers": get_clear_circuit_breakers().snapshot(),
+        "search_coalescing": _search_coalescer.get_stats(),
+        "search_revalidations": {
+            **_revalidation_stats,
+            "in_flight": len(_revalidations),
+        },
+        "caches": {
+            "search": _search_cache.get_stats(),
+            "reports": get_report_cache().cache.get_stats(),
+        },
+        "negative_cache": get_negative_cache().get_stats(),
+        "jobs": app.state.job_workers.get_stats(),
+        "xml_backend": get_xml_backend().name,
+    }
+
+
 @app.get("/test")
 def test_clear_processor():
     """Test endpoint to execute CLEAR processor with sample data."""
@@ -131,15 +296,390 @@ def test_clear_processor():
 
 
 @app.post("/search")
-async def search(business_data: BusinessSearchRequest):
-    """Search for a business using JSON body with Pydantic validation."""
-    business_data_dict = business_data.model_dump()
+async def search(
+    business_data: BusinessSearchRequest,
+    request: Request,
+    account_id: Optional[str] = Header(default=None, alias="X-Account-Id"),
+    stream: bool = False,
+    sections: Optional[str] = None,
+):
+    """
+    Search for a business using JSON body with Pydantic validation.
+
+    With ``stream=true`` the report is sent as NDJSON: a header line with the
+    summary fields, then one line per report section. ``sections`` limits
+    the report to a comma separated list of sections (``UCC,Criminal``).
+    """
+    client: httpx.AsyncClient = request.app.state.http_client
+    result = await cached_search(
+        client, "business", business_data, account_id, parse_sections(sections)
+    )
+    if not stream:
+        return result
+    return StreamingResponse(
+        (ndjson_line(part) for part in report_parts(result)),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
 
-    search_response = requests.post(
-        ENDPOINTS["business-search"],
-        headers=get_headers(),
-        data=build_business_search_xml(business_data_dict),
-        timeout=30,
+@app.post("/search/batch")
+async def search_batch(
+    request: Request,
+    account_id: Optional[str] = Header(default=None, alias="X-Account-Id"),
+    stream: bool = False,
+    sections: Optional[str] = None,
+):
+    """
+    Search for many businesses from a JSONL body, one search request per line.
+
+    Identical rows are searched once and results are returned in input order.
+    Rows that fail validation or whose search fails are reported per line.
+    With ``stream=true`` each row is sent as an NDJSON line as soon as its
+    search completes, so rows arrive out of order and carry their ``line``.
+    """
+    client: httpx.AsyncClient = request.app.state.http_client
+    rows = parse_jsonl(await request.body(), BusinessSearchRequest)
+    report_sections = parse_sections(sections)
+    key = partial(search_request_key, kind="business", sections=report_sections)
+
+    async def call(business_data: BusinessSearchRequest):
+        # a search Clear failed is a failed row, not a result
+        return raise_for_error(
+            await cached_search(
+                client, "business", business_data, account_id, report_sections
+            )
+        )
+
+    if stream:
+        return StreamingResponse(
+            ndjson_stream(iter_batch(rows, key, call, SEARCH_BATCH_CONCURRENCY)),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+    results = await run_batch(rows, key, call, SEARCH_BATCH_CONCURRENCY)
+    return {
+        "rows": len(results),
+        "unique": len({row["key"] for row in results if "key" in row}),
+        "failed": sum(1 for row in results if "error" in row),
+        "results": results,
+    }
+
+
+@app.post("/person/search")
+async def person_search(
+    person_data: PersonSearchRequest,
+    request: Request,
+    account_id: Optional[str] = Header(default=None, alias="X-Account-Id"),
+    stream: bool = False,
+    sections: Optional[str] = None,
+):
+    """
+    Search for a person and return their report.
+
+    Served by the same cached, coalesced pipeline as business searches.
+    ``stream`` and ``sections`` work as for ``/search``.
+    """
+    client: httpx.AsyncClient = request.app.state.http_client
+    result = await cached_search(
+        client, "person", person_data, account_id, parse_sections(sections)
+    )
+    if not stream:
+        return result
+    return StreamingResponse(
+        (ndjson_line(part) for part in report_parts(result)),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+@app.post("/business-with-principals")
+async def business_with_principals(
+    data: BusinessWithPrincipalsRequest,
+    request: Request,
+    account_id: Optional[str] = Header(default=None, alias="X-Account-Id"),
+    sections: Optional[str] = None,
+):
+    """
+    Get a business report and a person report for each of its principals.
+
+    The business and principal searches run concurrently, so the call takes
+    about as long as the slowest of them. A failed principal lookup is
+    reported in its place without failing the business report. ``sections``
+    applies to every report, as for ``/search``.
+    """
+    client: httpx.AsyncClient = request.app.state.http_client
+    report_sections = parse_sections(sections)
+    principals = list(data.principals)
+    if not principals and data.business.principal is not None:
+        principals.append(
+            PersonSearchRequest(
+                person=data.business.principal.model_dump(),
+                address=data.business.address,
+            )
+        )
+
+    business, *people = await asyncio.gather(
+        cached_search(
+            client,
+            "business",
+            BusinessSearchRequest(reference=data.reference, business=data.business),
+            account_id,
+            report_sections,
+        ),
+        *(
+            cached_search(client, "person", principal, account_id, report_sections)
+            for principal in principals
+        ),
+        return_exceptions=True,
+    )
+
+    def outcome(result):
+        if isinstance(result, BaseException):
+            return {"error": str(result), "error_type": type(result).__name__}
+        return result
+
+    return {
+        "business": outcome(business),
+        "principals": [
+            {"request": principal.person.model_dump(), "result": outcome(person)}
+            for principal, person in zip(principals, people)
+        ],
+    }
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(
+    business_data: BusinessSearchRequest,
+    request: Request,
+    account_id: Optional[str] = Header(default=None, alias="X-Account-Id"),
+):
+    """Queue a business search and report; poll or subscribe for the result."""
+    job = await run_in_threadpool(_jobs.submit, business_data.model_dump(), account_id)
+    request.app.state.job_workers.notify()
+    return {
+        "id": job["id"],
+        "status": job["status"],
+        "status_url": f"/jobs/{job['id']}",
+        "events_url": f"/jobs/{job['id']}/events",
+    }
+
+
+async def run_search_job(job: dict) -> dict:
+    """
+    Run a queued business search and report.
+
+    Raises:
+        RuntimeError: If the search came back as an error body, so the job
+            is recorded as failed rather than succeeded
+    """
+    return raise_for_error(
+        await cached_search(
+            app.state.http_client,
+            "business",
+            BusinessSearchRequest.model_validate(job["request"]),
+            job["account_id"],
+        )
+    )
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, wait: float = 0):
+    """
+    Get a job's status and, once finished, its result.
+
+    With ``wait`` (seconds, at most 60) the call long-polls: it returns as
+    soon as the job finishes or when the wait is over.
+    """
+    job = None
+    async for job in watch_job(_jobs, job_id, timeout=min(max(wait, 0), 60)):
+        pass
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    """Server-sent events with the job record on every status change."""
+    if await run_in_threadpool(_jobs.get_status, job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        async for job in watch_job(_jobs, job_id, timeout=JOB_RETENTION):
+            yield f"event: {job['status']}\ndata: {json.dumps(job)}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+async def cached_search(
+    client: httpx.AsyncClient,
+    kind: str,
+    search_data: Union[BusinessSearchRequest, PersonSearchRequest],
+    account_id: Optional[str] = None,
+    sections: Optional[AbstractSet[str]] = None,
+):
+    """
+    Answer a business or person search from the caches, or run it once for
+    all callers.
+
+    ``sections`` (from ``parse_sections``) limits the parsed report to those
+    sections; each allow-list is cached separately.
+    """
+    search_data_dict = search_data.model_dump()
+
+    key = search_request_key(search_data, kind, sections)
+    # a run may reuse reports as old as its account allows, so only accounts
+    # with the same freshness window share one
+    run_key = f"{key}@{get_report_cache().max_age_for(account_id):g}"
+
+    async def search_and_cache():
+        parsed, fetched_at = await run_clear_search(
+            client, kind, search_data_dict, account_id, sections=sections
+        )
+        # failures come back as an error body, only cache real results
+        if "error" not in parsed:
+            await run_in_threadpool(
+                _search_results.set,
+                key,
+                {"fetched_at": fetched_at, "report": parsed},
+            )
+        elif parsed.get("outcome") in (NO_MATCH, INVALID_REQUEST):
+            # known dead ends are remembered briefly so retries skip Clear
+            await run_in_threadpool(
+                get_negative_cache().put, key, parsed["outcome"], parsed
+            )
+        return parsed
+
+    cached, stale = await run_in_threadpool(_search_results.get, key)
+    # a report too old for this account is a miss, the run replaces it
+    cached = fresh_search_entry(cached, account_id)
+    if cached is not None:
+        if stale:
+            # only this request-keyed entry is stale: the refresh still reuses
+            # unchanged search results and any report fresh for the account
+            revalidate(run_key, search_and_cache)
+        return cached["report"]
+
+    negative = await run_in_threadpool(get_negative_cache().get, key)
+    if negative is not None:
+        return negative
+
+    return await _search_coalescer.run(run_key, search_and_cache)
+
+
+def raise_for_error(result: dict) -> dict:
+    """
+    Return a search result, for callers that report failures as exceptions.
+
+    Raises:
+        RuntimeError: With the message of an error body
+    """
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    return result
+
+
+def fresh_search_entry(entry: Any, account_id: Optional[str]) -> Optional[dict]:
+    """
+    A cached search entry (``{"fetched_at": ..., "report": ...}``), or None if
+    there is none or its report is older than the account's freshness window.
+    """
+    if not isinstance(entry, dict) or "fetched_at" not in entry:
+        return None
+    if not get_report_cache().is_fresh(entry["fetched_at"], account_id):
+        return None
+    return entry
+
+
+def revalidate(key: str, factory) -> None:
+    """Refresh a stale cached search in the background, once per key."""
+    if _search_coalescer.is_running(key):
+        return
+
+    def finished(task: asyncio.Task) -> None:
+        _revalidations.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            _revalidation_stats["failed"] += 1
+            logger.warning("Background search refresh failed: %s", task.exception())
+
+    _revalidation_stats["started"] += 1
+    task = asyncio.ensure_future(_search_coalescer.run(key, factory))
+    _revalidations.add(task)
+    task.add_done_callback(finished)
+
+
+def search_request_key(
+    search_data: Union[BusinessSearchRequest, PersonSearchRequest],
+    kind: str = "business",
+    sections: Optional[AbstractSet[str]] = None,
+) -> str:
+    """Cache and coalescing key for a business or person search request."""
+    # the reference is only a label, it does not change what Clear returns
+    fingerprint = request_fingerprint(search_data.model_dump(), ignore=("reference",))
+    return view_name(SEARCH_KINDS[kind]["key_prefix"] + fingerprint, sections)
+
+
+@app.post("/search/invalidate")
+async def invalidate_search(
+    business_data: BusinessSearchRequest, sections: Optional[str] = None
+):
+    """Drop the cached result of one business search request."""
+    key = search_request_key(business_data, sections=parse_sections(sections))
+    invalidated = await run_in_threadpool(_search_results.delete, key)
+    invalidated |= await run_in_threadpool(get_negative_cache().delete, key)
+    return {"key": key, "invalidated": invalidated}
+
+
+@app.delete("/search/cache")
+async def clear_search_cache():
+    """Drop every cached search result, request-keyed and results-keyed."""
+    removed = await run_in_threadpool(_search_cache.clear)
+    return {"removed": removed}
+
+
+async def run_clear_search(
+    client: httpx.AsyncClient,
+    kind: str,
+    search_data_dict: dict,
+    account_id: Optional[str] = None,
+    sections: Optional[AbstractSet[str]] = None,
+):
+    """
+    Run the Clear search, results, report and report results calls for a
+    business or person search.
+
+    A report is only bought when neither the results-keyed tier nor the
+    report cache has one within the account's freshness window. Only the
+    report ``sections`` listed are parsed, all of them if None.
+
+    Returns:
+        Tuple of the parsed report (or an error body) and the time the
+        report was fetched from Clear (None with an error body)
+    """
+    report_cache = get_report_cache()
+    parse_report = partial(SEARCH_KINDS[kind]["parse_report"], sections=sections)
+    # a report parsed for one allow-list is a different view of it
+    view = view_name("api", sections)
+
+    # a known entity may already have a fresh report, no search needed
+    entity_id = search_data_dict[kind].get("company_entity_id")
+    if entity_id:
+        cached = await run_in_threadpool(
+            report_cache.lookup_by_entity,
+            entity_id,
+            view,
+            account_id,
+            parse_report,
+        )
+        if cached is not None:
+            return cached
+
+    search_response = await clear_request(
+        client,
+        "POST",
+        ENDPOINTS[f"{kind}-search"],
+        f"{kind}-search",
+        headers=await get_headers(),
+        content=SEARCH_KINDS[kind]["search_xml"](search_data_dict),
     )
 
     if search_response.status_code != 200:
@@ -149,15 +689,29 @@ async def search(business_data: BusinessSearchRequest):
             + ": "
             + search_response.text
         )
-        return {
+        error = {
             "error": f"Search request failed with status {search_response.status_code}",
             "response": search_response.text,
         }
+        # Clear rejected the criteria themselves, resending will not help
+        if search_response.status_code in (400, 422):
+            error["outcome"] = INVALID_REQUEST
+        return error, None
 
-    search_results_response = requests.get(
-        ET.fromstring(search_response.text).find(".//Uri").text,
-        headers=get_headers(content_type=None),
-        timeout=30,
+    search_uri = get_xml_backend().fromstring(search_response.text).find(".//Uri")
+    if search_uri is None:
+        return {
+            "error": f"No matching {kind} found - no results URI in response",
+            "response": search_response.text,
+            "outcome": NO_MATCH,
+        }, None
+
+    search_results_response = await clear_request(
+        client,
+        "GET",
+        search_uri.text,
+        "results",
+        headers=await get_headers(content_type=None),
     )
 
     if search_results_response.status_code != 200:
@@ -174,30 +728,55 @@ async def search(business_data: BusinessSearchRequest):
             + ": "
             + search_results_response.text,
             "response": search_results_response.text,
-        }
+        }, None
 
     # --- search results caching logic ---
     results_text = search_results_response.text
-    results_key = (
-        "search_res:" + hashlib.sha256(results_text.encode("utf-8")).hexdigest()
+    results_key = view_name(
+        "search_res:" + hashlib.sha256(results_text.encode("utf-8")).hexdigest(),
+        sections,
     )
 
-    cached = _search_cache.get(results_key)
+    # the entry is shared by every account, each applies its own window
+    cached = fresh_search_entry(
+        await run_in_threadpool(_search_cache.get, results_key), account_id
+    )
     if cached is not None:
         # return cached parsed result immediately
-        return cached
+        return cached["report"], cached["fetched_at"]
     # --- search results caching logic end ---
 
-    business_report_data = {
-        "reference": "S2S Business Report",
-        "group_id": ET.fromstring(search_results_response.text).find(".//GroupId").text,
-    }
+    group_id_element = get_xml_backend().fromstring(results_text).find(".//GroupId")
+    if group_id_element is None:
+        return {
+            "error": f"No matching {kind} found - no GroupId in search results",
+            "response": results_text,
+            "outcome": NO_MATCH,
+        }, None
+    group_id = group_id_element.text
+
+    # the same report may have been bought by another request or a processor
+    cached = await run_in_threadpool(
+        report_cache.lookup, group_id, view, account_id, parse_report
+    )
+    if cached is not None:
+        return cached
 
-    report_response = requests.post(
-        ENDPOINTS["business-report"],
-        headers=get_headers(),
-        data=build_business_report_xml(business_report_data),
-        timeout=30,
+    report_data = {
+        "reference": f"S2S {kind.title()} Report",
+        "group_id": group_id,
+    }
+    # person reports need the same permissible purpose as their search
+    if "permissible_purpose" in search_data_dict:
+        report_data["permissible_purpose"] = search_data_dict["permissible_purpose"]
+
+    report_response = await clear_request(
+        client,
+        "POST",
+        ENDPOINTS[f"{kind}-report"],
+        f"{kind}-report",
+        headers=await get_headers(),
+        content=SEARCH_KINDS[kind]["report_xml"](report_data),
     )
 
     if report_response.status_code != 200:
@@ -210,25 +789,56 @@ async def search(business_data: BusinessSearchRequest):
         return {
             "error": f"Report request failed with status {report_response.status_code}",
             "response": report_response.text,
-        }
+        }, None
 
-    if ET.fromstring(report_response.text).find(".//Uri") is None:
-        print(f"Report request failed. Response: {report_response}")
+    report_uri = get_xml_backend().fromstring(report_response.text).find(".//Uri")
+    if report_uri is None:
+        print(f"Report request failed. Response: {report_response.text}")
 
         return {
             "error": "Report request failed - no URI found in response",
-            "response": report_response,
-        }
-
-    final_response = requests.get(
-        ET.fromstring(report_response.text).find(".//Uri").text,
-        headers=get_headers(content_type=None),
-        timeout=30,
-    ).text
-
-    parsed = parse_business_report_xml(final_response)
+            "response": report_response.text,
+        }, None
+
+    final_response = await clear_request(
+        client,
+        "GET",
+        report_uri.text,
+        "results",
+        headers=await get_headers(content_type=None),
+    )
 
+    if final_response.status_code != 200:
+        print(
+            "Report results request failed with status "
+            + str(final_response.status_code)
+            + ": "
+            + final_response.text
+        )
+        return {
+            "error": "Report results request failed with status "
+            f"{final_response.status_code}",
+            "response": final_response.text,
+        }, None
+
+    # parsing a full report is CPU bound, keep it off the event loop
+    parsed = await run_in_threadpool(parse_report, final_response.text)
+    if "error" in parsed:
+        return parsed, None
+
+    stored = await run_in_threadpool(
+        report_cache.put,
+        group_id,
+        final_response.text,
+        view,
+        parsed,
+        account_id,
+        entity_id=parsed.get("ID", ""),
+    )
     # store parsed result keyed by the search results content
-    _search_cache.set(results_key, parsed, expire=SEARCH_CACHE_TTL)
+    entry = {"fetched_at": stored["fetched_at"], "report": parsed}
+    await run_in_threadpool(
+        _search_cache.set, results_key, entry, expire=SEARCH_CACHE_TTL
+    )
 
-    return parsed
+    return parsed, entry["fetched_at"]
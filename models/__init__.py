@@ -1,9 +1,12 @@
 """Pydantic models for Clear API requests."""
 
-from .business import BusinessSearchRequest
+from .business import BusinessSearchRequest, BusinessWithPrincipalsRequest
 from .permissible_purpose import PermissiblePurpose
+from .person import PersonSearchRequest
 
 __all__ = [
     "BusinessSearchRequest",
+    "BusinessWithPrincipalsRequest",
     "PermissiblePurpose",
+    "PersonSearchRequest",
 ]
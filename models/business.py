@@ -1,11 +1,11 @@
 """Business-related Pydantic models for Clear API."""
 
-from typing import Optional, Union
+from typing import List, Optional, Union
 from pydantic import BaseModel, Field
 
 from models.address import Address
 from models.permissible_purpose import PermissiblePurpose
-from models.person import Person
+from models.person import Person, PersonSearchRequest
 
 
 class IndustryCodes(BaseModel):
@@ -76,3 +76,17 @@ class BusinessSearchRequest(BaseModel):
     # permissible_purpose: PermissiblePurpose = Field(
     #     default=PermissiblePurpose(), description="Permissible purpose"
     # )
+
+
+class BusinessWithPrincipalsRequest(BaseModel):
+    """Search request for a business and the people behind it."""
+
+    reference: str = Field(
+        default="S2S Business Search", description="Search reference"
+    )
+    business: Business = Field(description="Business information")
+    principals: List[PersonSearchRequest] = Field(
+        default_factory=list,
+        description="Principals to search. "
+        "If empty, the business principal is searched at the business address.",
+    )
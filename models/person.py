@@ -3,6 +3,9 @@
 from typing import Optional
 from pydantic import BaseModel, Field
 
+from models.address import Address
+from models.permissible_purpose import PermissiblePurpose
+
 
 class Person(BaseModel):
     """Person's name information."""
@@ -13,3 +16,35 @@ class Person(BaseModel):
     secondary_last_name: Optional[str] = Field(
         default="", description="Secondary last name"
     )
+
+
+class PersonCriteria(Person):
+    """Person search criteria: the name plus optional identifiers."""
+
+    ssn: Optional[str] = Field(
+        default="", description="Social Security Number", format="9 digits"
+    )
+    person_birth_date: Optional[str] = Field(
+        default="", description="Date of birth", format="MM/DD/YYYY"
+    )
+    phone_number: Optional[str] = Field(default="", description="Phone number")
+    email_address: Optional[str] = Field(default="", description="Email address")
+    driver_license_number: Optional[str] = Field(
+        default="", description="Driver license number"
+    )
+    npi_number: Optional[str] = Field(
+        default="",
+        description="National Provider Identifier",
+        format="10 numeric characters",
+    )
+
+
+class PersonSearchRequest(BaseModel):
+    """Search request for a person."""
+
+    reference: str = Field(default="S2S Person Search", description="Search reference")
+    person: PersonCriteria = Field(description="Person information")
+    address: Optional[Address] = Field(default=None, description="Address information")
+    permissible_purpose: PermissiblePurpose = Field(
+        default_factory=PermissiblePurpose, description="Permissible purpose"
+    )
@@ -0,0 +1,19 @@
+"""Caches shared by the FastAPI adapter and the processors."""
+
+from .keys import request_fingerprint
+from .negative_cache import NegativeCache, get_negative_cache, set_negative_cache
+from .report_cache import ReportCache, get_report_cache, set_report_cache
+from .soft_ttl_cache import SoftTTLCache
+from .tiered_cache import TieredCache
+
+__all__ = [
+    "request_fingerprint",
+    "NegativeCache",
+    "get_negative_cache",
+    "set_negative_cache",
+    "ReportCache",
+    "get_report_cache",
+    "set_report_cache",
+    "SoftTTLCache",
+    "TieredCache",
+]
@@ -0,0 +1,39 @@
+"""Canonical cache keys for CLEAR requests."""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize a request value so cosmetic differences hash the same."""
+    if isinstance(value, dict):
+        normalized = {key: _normalize(item) for key, item in value.items()}
+        # Empty fields are omitted from the Clear request XML anyway
+        return {key: item for key, item in normalized.items() if item not in ("", None)}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, str):
+        return " ".join(value.split()).casefold()
+    return value
+
+
+def request_fingerprint(payload: Dict[str, Any], ignore: Iterable[str] = ()) -> str:
+    """
+    Build a canonical hash of a request body.
+
+    Strings are trimmed, whitespace-collapsed and case-folded, empty fields
+    are dropped and keys are sorted, so requests asking Clear the same
+    question get the same fingerprint.
+
+    Args:
+        payload: Request body as a dictionary
+        ignore: Top-level keys that do not change the answer (e.g. reference)
+
+    Returns:
+        str: SHA-256 hex digest of the normalized body
+    """
+    ignored = set(ignore)
+    body = _normalize({k: v for k, v in payload.items() if k not in ignored})
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
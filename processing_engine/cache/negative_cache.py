@@ -0,0 +1,104 @@
+"""Short-lived cache of CLEAR searches known to find nothing."""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Union
+
+from diskcache import Cache
+
+from processing_engine.config.clear_config import ClearAPIConfig
+
+from .tiered_cache import TieredCache
+
+# Outcomes that repeat for the same request until the underlying data changes
+NO_MATCH = "no_match"
+INVALID_REQUEST = "invalid_request"
+
+
+class NegativeCache:
+    """
+    Remember searches that found no match or that CLEAR rejected as invalid.
+
+    Entries use the same keys as the positive caches they sit next to but
+    live in their own namespace with a short TTL, so a merchant that shows
+    up in CLEAR later is found again soon. Hits are counted per outcome,
+    separately from the positive caches.
+    """
+
+    def __init__(self, cache: Union[Cache, TieredCache], ttl: float = 900.0):
+        self.cache = cache
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def from_config(cls, config: ClearAPIConfig) -> "NegativeCache":
+        """Build the cache from the CLEAR API configuration."""
+        disk = Cache(os.path.expanduser(config.report_cache_directory))
+        return cls(TieredCache.from_config(disk, config), ttl=config.negative_cache_ttl)
+
+    @staticmethod
+    def _key(key: str) -> str:
+        return f"negative:{key}"
+
+    def _count(self, outcome: str, name: str) -> None:
+        with self._lock:
+            counters = self._stats.setdefault(outcome, {"hits": 0, "stored": 0})
+            counters[name] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached negative result for a key, if any."""
+        entry = self.cache.get(self._key(key))
+        if entry is None:
+            return None
+        self._count(entry["outcome"], "hits")
+        return entry["result"]
+
+    def put(self, key: str, outcome: str, result: Any) -> None:
+        """
+        Remember a negative outcome for a key.
+
+        Args:
+            key: Key of the request, as used by the positive cache
+            outcome: ``NO_MATCH`` or ``INVALID_REQUEST``
+            result: What to return to the next caller with the same request
+        """
+        self.cache.set(
+            self._key(key), {"outcome": outcome, "result": result}, expire=self.ttl
+        )
+        self._count(outcome, "stored")
+
+    def delete(self, key: str) -> bool:
+        """Forget the negative outcome for a key."""
+        return self.cache.delete(self._key(key))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit and store counters per outcome."""
+        with self._lock:
+            return {
+                "ttl": self.ttl,
+                "outcomes": {name: dict(c) for name, c in self._stats.items()},
+            }
+
+
+# Global negative cache instance
+_negative_cache: Optional[NegativeCache] = None
+_negative_cache_lock = threading.Lock()
+
+
+def get_negative_cache() -> NegativeCache:
+    """Get the process-wide negative cache built from the environment."""
+    global _negative_cache
+    with _negative_cache_lock:
+        if _negative_cache is None:
+            _negative_cache = NegativeCache.from_config(
+                ClearAPIConfig.from_environment()
+            )
+        return _negative_cache
+
+
+def set_negative_cache(cache: NegativeCache) -> None:
+    """Replace the process-wide negative cache."""
+    global _negative_cache
+    with _negative_cache_lock:
+        _negative_cache = cache
@@ -0,0 +1,318 @@
+"""Cache of CLEAR reports keyed by GroupId and EntityId."""
+
+import hashlib
+import os
+import threading
+import time
+import zlib
+from typing import AbstractSet, Any, Callable, Dict, Optional, Tuple, Union
+
+from diskcache import Cache
+
+from processing_engine.config.clear_config import ClearAPIConfig
+
+from processing_engine.utils.report_stream import STATUS, iter_report_elements
+from processing_engine.utils.xml_backend import ParseError
+
+from .tiered_cache import TieredCache
+
+
+def report_entity_id(xml_content: str) -> Optional[str]:
+    """
+    Return the EntityId from a report's Status section, if any.
+
+    The report is streamed only up to its Status section, which comes
+    first, so no tree of the whole report is built.
+    """
+    try:
+        for kind, element in iter_report_elements(xml_content):
+            if kind == STATUS:
+                entity_id = element.findtext("EntityId")
+                return entity_id.strip() if entity_id else None
+    except ParseError:
+        pass
+    return None
+
+
+def view_name(view: str, sections: Optional[AbstractSet[str]] = None) -> str:
+    """
+    Name of a parsed view limited to a section allow-list.
+
+    Views parsed from different sections differ, so each allow-list gets its
+    own view of the same stored report.
+    """
+    if not sections:
+        return view
+    return f"{view}[{','.join(sorted(sections))}]"
+
+
+class ReportCache:
+    """
+    Paid CLEAR reports shared by every caller that needs them.
+
+    An entry is stored under the report's GroupId and indexed by the
+    report's EntityId. It holds the raw XML (compressed) with its metadata,
+    plus any number of parsed *views* of it: the FastAPI adapter and
+    ``ClearProcessor`` parse reports differently, and a view missing from a
+    fresh entry is derived from the stored XML instead of buying the report
+    again.
+
+    Freshness is decided per account when reading: an entry older than the
+    account's window is treated as a miss, while entries stay on disk for
+    the longest window configured.
+    """
+
+    def __init__(
+        self,
+        cache: Union[Cache, TieredCache],
+        max_age: float = 86400.0,
+        account_max_age: Optional[Dict[str, float]] = None,
+    ):
+        self.cache = cache
+        self.max_age = max_age
+        self.account_max_age = account_max_age or {}
+
+    @classmethod
+    def from_config(cls, config: ClearAPIConfig) -> "ReportCache":
+        """Build the cache from the CLEAR API configuration."""
+        disk = Cache(os.path.expanduser(config.report_cache_directory))
+        return cls(
+            TieredCache.from_config(disk, config),
+            max_age=config.report_cache_max_age,
+            account_max_age=dict(config.report_cache_account_max_age),
+        )
+
+    @property
+    def retention(self) -> float:
+        """Seconds an entry is kept on disk: the longest freshness window."""
+        return max([self.max_age, *self.account_max_age.values()])
+
+    def max_age_for(self, account_id: Optional[str]) -> float:
+        """Freshness window for an account."""
+        return self.account_max_age.get(account_id, self.max_age)
+
+    @staticmethod
+    def _group_key(group_id: str) -> str:
+        return f"report:group:{group_id}"
+
+    @staticmethod
+    def _entity_key(entity_id: str) -> str:
+        return f"report:entity:{entity_id}"
+
+    def _fresh_entry(
+        self, group_id: str, account_id: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        entry = self.cache.get(self._group_key(group_id))
+        if entry is None:
+            return None
+        if not self.is_fresh(entry["fetched_at"], account_id):
+            return None
+        return entry
+
+    def get(
+        self,
+        group_id: str,
+        view: str,
+        account_id: Optional[str] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+    ) -> Optional[Any]:
+        """
+        Get a parsed view of the report for a GroupId.
+
+        Args:
+            group_id: GroupId returned by the CLEAR search
+            view: Name of the parsed view (e.g. ``"api"``, ``"processor"``)
+            account_id: Account whose freshness window applies
+            parse: Builds the view from raw XML if the entry lacks it
+
+        Returns:
+            The parsed view, or None if there is no fresh entry
+        """
+        found = self.lookup(group_id, view, account_id, parse)
+        return found[0] if found is not None else None
+
+    def lookup(
+        self,
+        group_id: str,
+        view: str,
+        account_id: Optional[str] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+    ) -> Optional[Tuple[Any, float]]:
+        """
+        Like ``get``, but also return when the report was fetched, so callers
+        caching the view elsewhere can apply the same freshness window.
+
+        Returns:
+            Tuple of the parsed view and its ``fetched_at`` time, or None
+        """
+        found = self._lookup_entry(group_id, view, account_id, parse)
+        return (found[0], found[1]["fetched_at"]) if found is not None else None
+
+    def get_with_xml(
+        self,
+        group_id: str,
+        view: str,
+        account_id: Optional[str] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+    ) -> Optional[Tuple[Any, str]]:
+        """
+        Like ``get``, but also return the raw report XML, for views that leave
+        it out rather than store a second, uncompressed copy.
+
+        Returns:
+            Tuple of the parsed view and the report XML, or None
+        """
+        found = self._lookup_entry(group_id, view, account_id, parse)
+        return (found[0], self.raw_xml(found[1])) if found is not None else None
+
+    def _lookup_entry(
+        self,
+        group_id: str,
+        view: str,
+        account_id: Optional[str],
+        parse: Optional[Callable[[str], Any]],
+    ) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """The parsed view of a fresh entry, with the entry it came from."""
+        entry = self._fresh_entry(group_id, account_id)
+        if entry is None:
+            return None
+        if view in entry["views"]:
+            return entry["views"][view], entry
+        if parse is None:
+            return None
+
+        parsed = parse(self.raw_xml(entry))
+        with self.cache.transact():
+            current = self.cache.get(self._group_key(group_id))
+            if current is not None and current["fetched_at"] == entry["fetched_at"]:
+                # the memory tier hands out the stored dict itself; readers
+                # holding it must never see it change
+                self._store(current | {"views": current["views"] | {view: parsed}})
+        return parsed, entry
+
+    def get_by_entity(
+        self,
+        entity_id: str,
+        view: str,
+        account_id: Optional[str] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+    ) -> Optional[Any]:
+        """Get a parsed view of the latest report for an EntityId."""
+        found = self.lookup_by_entity(entity_id, view, account_id, parse)
+        return found[0] if found is not None else None
+
+    def lookup_by_entity(
+        self,
+        entity_id: str,
+        view: str,
+        account_id: Optional[str] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+    ) -> Optional[Tuple[Any, float]]:
+        """Like ``get_by_entity``, but also return when the report was fetched."""
+        group_id = self.cache.get(self._entity_key(entity_id))
+        if group_id is None:
+            return None
+        return self.lookup(group_id, view, account_id=account_id, parse=parse)
+
+    def is_fresh(self, fetched_at: float, account_id: Optional[str] = None) -> bool:
+        """Whether a report fetched at ``fetched_at`` is fresh for an account."""
+        return time.time() - fetched_at <= self.max_age_for(account_id)
+
+    def put(
+        self,
+        group_id: str,
+        raw_xml: str,
+        view: str,
+        parsed: Any,
+        account_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Store a freshly bought report and one parsed view of it.
+
+        Args:
+            entity_id: The report's EntityId as read by the caller's parser
+                (empty if it has none); read from the XML if None
+
+        Returns:
+            Dict: The entry metadata (without the XML and views)
+        """
+        if entity_id is None:
+            entity_id = report_entity_id(raw_xml)
+        raw = raw_xml.encode("utf-8")
+        entry = {
+            "group_id": group_id,
+            "entity_id": (entity_id or "").strip() or None,
+            "fetched_at": time.time(),
+            "fetched_by": account_id,
+            "raw_sha256": hashlib.sha256(raw).hexdigest(),
+            "raw_size": len(raw),
+            "raw_xml": zlib.compress(raw),
+            "views": {view: parsed},
+        }
+        self._store(entry)
+        return self.metadata(entry)
+
+    def _store(self, entry: Dict[str, Any]) -> None:
+        with self.cache.transact():
+            self.cache.set(
+                self._group_key(entry["group_id"]), entry, expire=self.retention
+            )
+            if entry["entity_id"]:
+                self.cache.set(
+                    self._entity_key(entry["entity_id"]),
+                    entry["group_id"],
+                    expire=self.retention,
+                )
+
+    @staticmethod
+    def raw_xml(entry: Dict[str, Any]) -> str:
+        """Decompress the raw report XML of an entry."""
+        return zlib.decompress(entry["raw_xml"]).decode("utf-8")
+
+    @staticmethod
+    def metadata(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Describe an entry without its XML payload or parsed views."""
+        return {
+            key: value
+            for key, value in entry.items()
+            if key not in ("raw_xml", "views")
+        } | {"views": sorted(entry["views"])}
+
+    def info(self, group_id: str) -> Optional[Dict[str, Any]]:
+        """Metadata of the cached report for a GroupId, fresh or not."""
+        entry = self.cache.get(self._group_key(group_id))
+        return self.metadata(entry) if entry is not None else None
+
+    def invalidate(self, group_id: str) -> bool:
+        """Remove the report for a GroupId and its EntityId index entry."""
+        with self.cache.transact():
+            entry = self.cache.get(self._group_key(group_id))
+            if entry is None:
+                return False
+            if entry["entity_id"]:
+                entity_key = self._entity_key(entry["entity_id"])
+                if self.cache.get(entity_key) == group_id:
+                    self.cache.delete(entity_key)
+            return self.cache.delete(self._group_key(group_id))
+
+
+# Global report cache instance
+_report_cache: Optional[ReportCache] = None
+_report_cache_lock = threading.Lock()
+
+
+def get_report_cache() -> ReportCache:
+    """Get the process-wide report cache built from the environment."""
+    global _report_cache
+    with _report_cache_lock:
+        if _report_cache is None:
+            _report_cache = ReportCache.from_config(ClearAPIConfig.from_environment())
+        return _report_cache
+
+
+def set_report_cache(cache: ReportCache) -> None:
+    """Replace the process-wide report cache."""
+    global _report_cache
+    with _report_cache_lock:
+        _report_cache = cache
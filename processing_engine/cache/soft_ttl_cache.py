@@ -0,0 +1,54 @@
+"""Cache entries with a soft TTL for revalidation and a hard TTL for expiry."""
+
+import time
+from typing import Any, Optional, Tuple, Union
+
+from diskcache import Cache
+
+from .tiered_cache import TieredCache
+
+
+class SoftTTLCache:
+    """
+    Stale-while-revalidate view over a cache.
+
+    Values are stored with the time they were written and expire from the
+    underlying cache after ``hard_ttl`` seconds. Reads between ``soft_ttl``
+    and ``hard_ttl`` still return the value but flag it as stale, so the
+    caller can answer immediately and refresh it in the background.
+    """
+
+    def __init__(
+        self,
+        cache: Union[Cache, TieredCache],
+        soft_ttl: float,
+        hard_ttl: float,
+    ):
+        if hard_ttl < soft_ttl:
+            raise ValueError("hard_ttl must not be shorter than soft_ttl")
+        self.cache = cache
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+
+    def get(self, key: str) -> Tuple[Optional[Any], bool]:
+        """
+        Look up a value.
+
+        Returns:
+            Tuple of the value (None on a miss) and whether it is stale
+        """
+        entry = self.cache.get(key)
+        if not isinstance(entry, dict) or "stored_at" not in entry:
+            return None, False
+        stale = time.time() - entry["stored_at"] > self.soft_ttl
+        return entry["value"], stale
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, fresh for ``soft_ttl`` and kept for ``hard_ttl``."""
+        self.cache.set(
+            key, {"stored_at": time.time(), "value": value}, expire=self.hard_ttl
+        )
+
+    def delete(self, key: str) -> bool:
+        """Remove a value."""
+        return self.cache.delete(key)
@@ -0,0 +1,202 @@
+"""Two-tier cache: a bounded in-process LRU in front of diskcache."""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from diskcache import Cache
+
+from processing_engine.config.clear_config import ClearAPIConfig
+
+_MISSING = object()
+
+
+def pickled_size(value: Any) -> int:
+    """
+    Estimate a value's size in bytes: its length for bytes and str, which
+    diskcache stores as they are, else the length of its pickle.
+    """
+    if isinstance(value, (bytes, str)):
+        return len(value)
+    return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class TieredCache:
+    """
+    In-memory LRU over a diskcache ``Cache``.
+
+    Reads are served from memory when possible; a miss falls through to the
+    disk tier and the value is kept in memory until the disk entry expires
+    or ``max_local_age`` seconds pass, whichever comes first. The local age
+    bound limits how long a worker can serve a value another process has
+    since replaced or deleted. Writes go through to disk.
+
+    The memory tier is bounded by item count and by the estimated size of
+    its values (``sizeof``, by default the pickled size); least recently
+    used entries are evicted first and values larger than the byte budget
+    are never held in memory.
+    Operations that must see other processes' writes (leases, counters)
+    should use ``disk`` directly.
+    """
+
+    def __init__(
+        self,
+        disk: Cache,
+        max_items: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_local_age: float = 30.0,
+        sizeof: Callable[[Any], int] = pickled_size,
+    ):
+        self.disk = disk
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_local_age = max_local_age
+        self.sizeof = sizeof
+
+        self._lock = threading.Lock()
+        # key -> (value, size in bytes, wall-clock expiry)
+        self._memory: "OrderedDict[Any, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._stats = {
+            "memory_hits": 0,
+            "memory_misses": 0,
+            "disk_hits": 0,
+            "disk_misses": 0,
+            "evictions": 0,
+        }
+
+    @classmethod
+    def from_config(cls, disk: Cache, config: ClearAPIConfig) -> "TieredCache":
+        """Wrap a disk cache using the memory tier limits from configuration."""
+        return cls(
+            disk,
+            max_items=config.memory_cache_max_items,
+            max_bytes=config.memory_cache_max_bytes,
+            max_local_age=config.memory_cache_max_age,
+        )
+
+    @property
+    def directory(self) -> str:
+        """Directory of the disk tier."""
+        return self.disk.directory
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _remember(self, key: Any, value: Any, expire_time: Optional[float]) -> None:
+        """Keep a value in memory until ``expire_time`` or the local age bound."""
+        if self.max_items <= 0:
+            return
+        size = self.sizeof(value)
+        expires_at = time.time() + self.max_local_age
+        if expire_time is not None:
+            expires_at = min(expires_at, expire_time)
+
+        with self._lock:
+            self._forget_locked(key)
+            if size > self.max_bytes:
+                return
+            self._memory[key] = (value, size, expires_at)
+            self._bytes += size
+            while len(self._memory) > self.max_items or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._memory.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats["evictions"] += 1
+
+    def _forget_locked(self, key: Any) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def _forget(self, key: Any) -> None:
+        with self._lock:
+            self._forget_locked(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get a value from memory, falling back to disk."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[2] > time.time():
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return entry[0]
+                self._forget_locked(key)
+            self._stats["memory_misses"] += 1
+
+        value, expire_time = self.disk.get(key, default=_MISSING, expire_time=True)
+        if value is _MISSING:
+            self._count("disk_misses")
+            return default
+        self._count("disk_hits")
+        self._remember(key, value, expire_time)
+        return value
+
+    def set(self, key: Any, value: Any, expire: Optional[float] = None) -> bool:
+        """Write a value through to disk and keep it in memory."""
+        result = self.disk.set(key, value, expire=expire)
+        self._remember(key, value, time.time() + expire if expire else None)
+        return result
+
+    def add(self, key: Any, value: Any, expire: Optional[float] = None) -> bool:
+        """Store a value only if the key is absent on disk."""
+        added = self.disk.add(key, value, expire=expire)
+        if added:
+            self._remember(key, value, time.time() + expire if expire else None)
+        else:
+            self._forget(key)
+        return added
+
+    def delete(self, key: Any) -> bool:
+        """Remove a key from both tiers."""
+        self._forget(key)
+        return self.disk.delete(key)
+
+    def incr(self, key: Any, delta: int = 1, default: int = 0) -> int:
+        """Increment a counter on disk."""
+        self._forget(key)
+        return self.disk.incr(key, delta, default)
+
+    def touch(self, key: Any, expire: Optional[float] = None) -> bool:
+        """Update the expiry of a disk entry."""
+        self._forget(key)
+        return self.disk.touch(key, expire=expire)
+
+    def transact(self) -> AbstractContextManager:
+        """Run a disk transaction."""
+        return self.disk.transact()
+
+    def clear(self) -> int:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._bytes = 0
+        return self.disk.clear()
+
+    def clear_memory(self) -> None:
+        """Drop the memory tier, keeping the disk tier."""
+        with self._lock:
+            self._memory.clear()
+            self._bytes = 0
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for both tiers and memory usage."""
+        with self._lock:
+            return {
+                **self._stats,
+                "memory_items": len(self._memory),
+                "memory_bytes": self._bytes,
+                "max_items": self.max_items,
+                "max_bytes": self.max_bytes,
+            }
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        self.disk.close()
@@ -1,5 +1,17 @@
 """Configuration management for processing engine."""
 
 from .clear_config import ClearAPIConfig, get_clear_config, set_clear_config
+from .transport_config import (
+    TransportConfig,
+    get_transport_config,
+    set_transport_config,
+)
 
-__all__ = ["ClearAPIConfig", "get_clear_config", "set_clear_config"]
+__all__ = [
+    "ClearAPIConfig",
+    "get_clear_config",
+    "set_clear_config",
+    "TransportConfig",
+    "get_transport_config",
+    "set_transport_config",
+]
@@ -1,10 +1,20 @@
 """Configuration management for Thomson Reuters CLEAR API integration."""
 
 import os
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
+def _parse_float_map(value: str) -> Dict[str, float]:
+    """Parse ``"name=1.5,other=2"`` into a dictionary of floats."""
+    result = {}
+    for item in value.split(","):
+        if "=" in item:
+            name, number = item.split("=", 1)
+            result[name.strip()] = float(number)
+    return result
+
+
 class ClearAPIConfig(BaseModel):
     """Configuration model for CLEAR API integration."""
 
@@ -25,15 +35,76 @@ class ClearAPIConfig(BaseModel):
     # Request Configuration
     request_timeout: int = Field(default=30, description="Request timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum number of retry attempts")
+    retry_base_delay: float = Field(
+        default=0.5, description="Smallest delay between retry attempts in seconds"
+    )
+    retry_max_delay: float = Field(
+        default=20.0, description="Largest delay between retry attempts in seconds"
+    )
+    retry_budget: float = Field(
+        default=60.0,
+        description="Total seconds a request may spend retrying before giving up",
+    )
     rate_limit_interval: float = Field(
         default=0.1, description="Minimum interval between requests in seconds"
     )
+    endpoint_rate_limits: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Separate requests-per-second limits keyed by endpoint name",
+    )
+    endpoint_costs: Dict[str, float] = Field(
+        default_factory=lambda: {"business-report": 2.0, "person-report": 2.0},
+        description="Weighted cost of one request against the shared rate limit",
+    )
+    circuit_failure_threshold: int = Field(
+        default=5, description="Failures within the window that open a circuit"
+    )
+    circuit_failure_window: float = Field(
+        default=60.0, description="Window in seconds for counting circuit failures"
+    )
+    circuit_recovery_timeout: float = Field(
+        default=30.0, description="Seconds an open circuit waits before probing"
+    )
+    rate_limit_backend: str = Field(
+        default="diskcache",
+        description="Where rate limit state lives: memory, diskcache or redis",
+    )
+    rate_limit_location: str = Field(
+        default="~/.clear_api_ratelimit",
+        description="Cache directory (diskcache) or server URL (redis) for rate limits",
+    )
 
     # Cache Configuration
     token_cache_ttl: int = Field(default=3600, description="Token cache TTL in seconds")
     cache_directory: str = Field(
         default="~/.clear_api_cache", description="Directory for token caching"
     )
+    memory_cache_max_items: int = Field(
+        default=1024, description="Entries kept in each in-process cache tier"
+    )
+    memory_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Approximate bytes kept in each in-process cache tier",
+    )
+    memory_cache_max_age: float = Field(
+        default=30.0,
+        description="Seconds a value read from disk is served from memory",
+    )
+    report_cache_directory: str = Field(
+        default="~/.clear_api_report_cache",
+        description="Directory for caching parsed CLEAR reports",
+    )
+    report_cache_max_age: float = Field(
+        default=86400.0, description="Seconds a cached report is considered fresh"
+    )
+    report_cache_account_max_age: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Report freshness windows in seconds keyed by account ID",
+    )
+    negative_cache_ttl: float = Field(
+        default=900.0,
+        description="Seconds a no-match or invalid search is remembered",
+    )
 
     # Processing Configuration
     enable_business_checks: bool = Field(
@@ -57,6 +128,10 @@ class ClearAPIConfig(BaseModel):
     enable_docket_records: bool = Field(
         default=True, description="Include docket records"
     )
+    report_sections: List[str] = Field(
+        default_factory=list,
+        description="Report sections to parse (e.g. UCC, LienJudgment); empty for all",
+    )
 
     @classmethod
     def from_environment(cls) -> "ClearAPIConfig":
@@ -70,9 +145,48 @@ class ClearAPIConfig(BaseModel):
             ),
             request_timeout=int(os.getenv("CLEAR_REQUEST_TIMEOUT", "30")),
             max_retries=int(os.getenv("CLEAR_MAX_RETRIES", "3")),
+            retry_base_delay=float(os.getenv("CLEAR_RETRY_BASE_DELAY", "0.5")),
+            retry_max_delay=float(os.getenv("CLEAR_RETRY_MAX_DELAY", "20")),
+            retry_budget=float(os.getenv("CLEAR_RETRY_BUDGET", "60")),
             rate_limit_interval=float(os.getenv("CLEAR_RATE_LIMIT_INTERVAL", "0.1")),
+            endpoint_rate_limits=_parse_float_map(
+                os.getenv("CLEAR_ENDPOINT_RATE_LIMITS", "")
+            ),
+            endpoint_costs=_parse_float_map(
+                os.getenv("CLEAR_ENDPOINT_COSTS", "business-report=2,person-report=2")
+            ),
+            circuit_failure_threshold=int(
+                os.getenv("CLEAR_CIRCUIT_FAILURE_THRESHOLD", "5")
+            ),
+            circuit_failure_window=float(
+                os.getenv("CLEAR_CIRCUIT_FAILURE_WINDOW", "60")
+            ),
+            circuit_recovery_timeout=float(
+                os.getenv("CLEAR_CIRCUIT_RECOVERY_TIMEOUT", "30")
+            ),
+            rate_limit_backend=os.getenv("CLEAR_RATE_LIMIT_BACKEND", "diskcache"),
+            rate_limit_location=os.getenv(
+                "CLEAR_RATE_LIMIT_LOCATION", "~/.clear_api_ratelimit"
+            ),
             token_cache_ttl=int(os.getenv("CLEAR_TOKEN_CACHE_TTL", "3600")),
             cache_directory=os.getenv("CLEAR_CACHE_DIR", "~/.clear_api_cache"),
+            memory_cache_max_items=int(
+                os.getenv("CLEAR_MEMORY_CACHE_MAX_ITEMS", "1024")
+            ),
+            memory_cache_max_bytes=int(
+                os.getenv("CLEAR_MEMORY_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+            ),
+            memory_cache_max_age=float(os.getenv("CLEAR_MEMORY_CACHE_MAX_AGE", "30")),
+            report_cache_directory=os.getenv(
+                "CLEAR_REPORT_CACHE_DIR", "~/.clear_api_report_cache"
+            ),
+            report_cache_max_age=float(
+                os.getenv("CLEAR_REPORT_CACHE_MAX_AGE", "86400")
+            ),
+            report_cache_account_max_age=_parse_float_map(
+                os.getenv("CLEAR_REPORT_CACHE_ACCOUNT_MAX_AGE", "")
+            ),
+            negative_cache_ttl=float(os.getenv("CLEAR_NEGATIVE_CACHE_TTL", "900")),
             enable_business_checks=os.getenv(
                 "CLEAR_ENABLE_BUSINESS_CHECKS", "true"
             ).lower()
@@ -88,6 +202,11 @@ class ClearAPIConfig(BaseModel):
             == "true",
             enable_docket_records=os.getenv("CLEAR_ENABLE_DOCKETS", "true").lower()
             == "true",
+            report_sections=[
+                name.strip()
+                for name in os.getenv("CLEAR_REPORT_SECTIONS", "").split(",")
+                if name.strip()
+            ],
         )
 
     def get_endpoints(self) -> Dict[str, str]:
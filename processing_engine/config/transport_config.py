@@ -0,0 +1,61 @@
+"""Configuration management for the shared CLEAR HTTP transport."""
+
+import os
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class TransportConfig(BaseModel):
+    """Configuration model for the pooled HTTP transport used by CLEAR callers."""
+
+    # Pool Configuration
+    max_connections: int = Field(
+        default=100, description="Maximum number of concurrent connections"
+    )
+    max_keepalive_connections: int = Field(
+        default=20, description="Maximum number of idle keep-alive connections"
+    )
+    max_connections_per_host: int = Field(
+        default=20, description="Maximum number of concurrent requests per host"
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, description="Seconds an idle connection is kept open"
+    )
+
+    # Protocol Configuration
+    http2: bool = Field(
+        default=True, description="Negotiate HTTP/2 when the h2 package is installed"
+    )
+    request_timeout: float = Field(
+        default=30.0, description="Request timeout in seconds"
+    )
+
+    @classmethod
+    def from_environment(cls) -> "TransportConfig":
+        """Create configuration from environment variables."""
+        return cls(
+            max_connections=int(os.getenv("CLEAR_POOL_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("CLEAR_POOL_MAX_KEEPALIVE", "20")),
+            max_connections_per_host=int(os.getenv("CLEAR_POOL_MAX_PER_HOST", "20")),
+            keepalive_expiry=float(os.getenv("CLEAR_POOL_KEEPALIVE_EXPIRY", "30")),
+            http2=os.getenv("CLEAR_HTTP2", "true").lower() == "true",
+            request_timeout=float(os.getenv("CLEAR_REQUEST_TIMEOUT", "30")),
+        )
+
+
+# Global configuration instance
+_config_instance: Optional[TransportConfig] = None
+
+
+def get_transport_config() -> TransportConfig:
+    """Get the global transport configuration instance."""
+    global _config_instance
+    if _config_instance is None:
+        _config_instance = TransportConfig.from_environment()
+    return _config_instance
+
+
+def set_transport_config(config: TransportConfig) -> None:
+    """Set the global transport configuration instance."""
+    global _config_instance
+    _config_instance = config
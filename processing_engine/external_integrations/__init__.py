@@ -1,17 +1,27 @@
 """External API integrations for processing engine."""
 
-from .base_client import (
-    BaseExternalAPIClient,
+from .base_client import BaseApiClient
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState
+from .exceptions import (
     APIClientError,
     AuthenticationError,
+    CircuitOpenError,
     RateLimitError,
 )
 from .clear_client import ClearAPIClient
+from .transport import ClearTransport, get_transport, set_transport
 
 __all__ = [
-    "BaseExternalAPIClient",
+    "BaseApiClient",
     "APIClientError",
     "AuthenticationError",
     "RateLimitError",
+    "CircuitOpenError",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitState",
     "ClearAPIClient",
+    "ClearTransport",
+    "get_transport",
+    "set_transport",
 ]
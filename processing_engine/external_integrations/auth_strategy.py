@@ -1,7 +1,7 @@
 """Authentication strategies for external API clients."""
 
 from abc import ABC, abstractmethod
-from requests import Session
+from httpx import Client as Session
 
 
 class AuthStrategy(ABC):
@@ -9,7 +9,7 @@ class AuthStrategy(ABC):
 
     @abstractmethod
     def apply(self, session: Session) -> None:
-        """Apply authentication to a requests session."""
+        """Apply authentication to an HTTP client session."""
 
     def __repr__(self) -> str:
         """
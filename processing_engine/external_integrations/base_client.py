@@ -1,15 +1,23 @@
 """Base API client with rate limiting and authentication support."""
 
 from abc import ABC
-import requests
+import httpx
 from .auth_strategy import AuthStrategy
-from .rate_limiter import RateLimiter
+from .circuit_breaker import CircuitBreakerRegistry
+from .exceptions import APIClientError, RateLimitError
+from .rate_limiter import EndpointRateLimiter, RateLimiter
+from .retry import IDEMPOTENT_METHODS, RetryPolicy
+from .transport import get_transport
 
 
 class BaseApiClient(ABC):
     """
-    Base client for external APIs with pluggable authentication
-    and optional rate limiting.
+    Base client for external APIs with pluggable authentication,
+    optional rate limiting and circuit breaking, and retries of
+    transient failures.
+
+    Requests go through the shared, pooled CLEAR transport so every
+    instance reuses the same keep-alive connections.
     """
 
     BASE_URL: str
@@ -18,27 +26,54 @@ class BaseApiClient(ABC):
         self,
         auth_strategy: AuthStrategy | None = None,
         timeout: int = 30,
-        rate_limiter: RateLimiter | None = None,
+        rate_limiter: RateLimiter | EndpointRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
     ):
         self.base_url = self.BASE_URL.rstrip("/")
         self.auth_strategy = auth_strategy
-        self.session = requests.Session()
+        self.session = get_transport().session(timeout=timeout)
         self.timeout = timeout
         self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breakers = circuit_breakers
 
         if self.auth_strategy:
             self.auth_strategy.apply(self.session)
 
     def _full_url(self, path: str) -> str:
+        # CLEAR hands back absolute result URIs, pass those through untouched
+        if path.startswith(("http://", "https://")):
+            return path
         return f"{self.base_url}/{path.lstrip('/')}"
 
-    def _request(self, method: str, path: str, **kwargs):
-        if self.rate_limiter:
+    def _throttle(self, endpoint: str | None) -> None:
+        if isinstance(self.rate_limiter, EndpointRateLimiter):
+            self.rate_limiter.acquire(endpoint or "default")
+        elif self.rate_limiter:
             self.rate_limiter.acquire()
 
+    def _send(
+        self, method: str, path: str, endpoint: str | None = None, **kwargs
+    ) -> httpx.Response:
         url = self._full_url(path)
-        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
-        return self._handle_response(response)
+
+        def send() -> httpx.Response:
+            # every attempt counts against the quota, retries included
+            self._throttle(endpoint)
+            return self.session.request(method, url, timeout=self.timeout, **kwargs)
+
+        def attempt() -> httpx.Response:
+            if self.circuit_breakers is None:
+                return send()
+            return self.circuit_breakers.get(endpoint or "default").call(send)
+
+        return self.retry_policy.run(
+            attempt, idempotent=method.upper() in IDEMPOTENT_METHODS
+        )
+
+    def _request(self, method: str, path: str, **kwargs):
+        return self._handle_response(self._send(method, path, **kwargs))
 
     def get(self, path: str, **kwargs):
         """Make a GET request."""
@@ -56,12 +91,18 @@ class BaseApiClient(ABC):
         """Make a DELETE request."""
         return self._request("DELETE", path, **kwargs)
 
-    def _handle_response(self, response):
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as e:
-            raise RuntimeError(f"API request failed: {e}") from e
+    def _handle_response(self, response: httpx.Response):
+        self._raise_for_status(response)
         try:
             return response.json()
         except ValueError:
             return response.text
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if response.status_code == 429:
+                raise RateLimitError(f"API rate limit exceeded: {e}") from e
+            raise APIClientError(f"API request failed: {e}") from e
@@ -0,0 +1,254 @@
+"""Per-endpoint circuit breakers for external API calls."""
+
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+import httpx
+
+from processing_engine.config.clear_config import ClearAPIConfig
+
+from .exceptions import CircuitOpenError
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Fail fast on an endpoint that keeps failing.
+
+    The circuit opens once ``failure_threshold`` failures (5xx answers or
+    transport errors such as timeouts) happen within ``failure_window``
+    seconds. While open, calls raise ``CircuitOpenError`` without touching
+    the network. After ``recovery_timeout`` seconds the circuit is half-open
+    and lets ``half_open_max_calls`` probes through: a successful probe
+    closes it, a failed one opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        failure_window: float = 60.0,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.failure_window = failure_window
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures: Deque[float] = deque()
+        self._opened_at = 0.0
+        self._probes = 0
+        self._rejected = 0
+
+    def _current_state(self, now: float) -> CircuitState:
+        """Resolve the state, moving from open to half-open when due."""
+        if (
+            self._state is CircuitState.OPEN
+            and now - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        with self._lock:
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            elapsed = time.monotonic() - self._opened_at
+            return max(0.0, self.recovery_timeout - elapsed)
+
+    def before_call(self) -> None:
+        """
+        Admit a call or fail fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or out of probe slots
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state is CircuitState.CLOSED:
+                return
+            if state is CircuitState.HALF_OPEN and (
+                self._probes < self.half_open_max_calls
+            ):
+                self._probes += 1
+                return
+            self._rejected += 1
+            retry_in = max(0.0, self.recovery_timeout - (now - self._opened_at))
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self) -> None:
+        """Record a healthy answer; a successful probe closes the circuit."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self.logger.info("Circuit for %s closed", self.name)
+                self._state = CircuitState.CLOSED
+                self._failures.clear()
+
+    def record_failure(self) -> None:
+        """Record a failure, opening the circuit past the threshold."""
+        with self._lock:
+            now = time.monotonic()
+            if self._state is CircuitState.HALF_OPEN:
+                self._open(now)
+                return
+
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.failure_window:
+                self._failures.popleft()
+            if (
+                self._state is CircuitState.CLOSED
+                and len(self._failures) >= self.failure_threshold
+            ):
+                self._open(now)
+
+    def _release(self) -> None:
+        """Give back a probe slot for a call that ended without a verdict."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def _open(self, now: float) -> None:
+        self.logger.warning(
+            "Circuit for %s opened for %.0fs", self.name, self.recovery_timeout
+        )
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._failures.clear()
+
+    def _record_response(self, response: httpx.Response) -> None:
+        if response.status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def _record_exception(self, error: BaseException) -> None:
+        if isinstance(error, httpx.TransportError):
+            self.record_failure()
+        else:
+            self._release()
+
+    def call(self, send: Callable[[], httpx.Response]) -> httpx.Response:
+        """Send a request through the breaker."""
+        self.before_call()
+        try:
+            response = send()
+        except BaseException as e:
+            self._record_exception(e)
+            raise
+        self._record_response(response)
+        return response
+
+    async def call_async(
+        self, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Send an async request through the breaker."""
+        self.before_call()
+        try:
+            response = await send()
+        except BaseException as e:
+            self._record_exception(e)
+            raise
+        self._record_response(response)
+        return response
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the breaker state for monitoring."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            return {
+                "state": state.value,
+                "recent_failures": len(
+                    [t for t in self._failures if now - t <= self.failure_window]
+                ),
+                "retry_in": (
+                    max(0.0, self.recovery_timeout - (now - self._opened_at))
+                    if state is CircuitState.OPEN
+                    else 0.0
+                ),
+                "rejected": self._rejected,
+            }
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers created on demand, one per endpoint name."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        failure_window: float = 60.0,
+        recovery_timeout: float = 30.0,
+    ):
+        self.failure_threshold = failure_threshold
+        self.failure_window = failure_window
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: ClearAPIConfig) -> "CircuitBreakerRegistry":
+        """Build the registry from the CLEAR API configuration."""
+        return cls(
+            failure_threshold=config.circuit_failure_threshold,
+            failure_window=config.circuit_failure_window,
+            recovery_timeout=config.circuit_recovery_timeout,
+        )
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """Get the breaker guarding an endpoint."""
+        with self._lock:
+            if endpoint not in self._breakers:
+                self._breakers[endpoint] = CircuitBreaker(
+                    endpoint,
+                    failure_threshold=self.failure_threshold,
+                    failure_window=self.failure_window,
+                    recovery_timeout=self.recovery_timeout,
+                )
+            return self._breakers[endpoint]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the state of every breaker created so far."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.snapshot() for name, breaker in breakers.items()}
+
+
+# Global CLEAR circuit breakers
+_circuit_breakers: Optional[CircuitBreakerRegistry] = None
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_clear_circuit_breakers() -> CircuitBreakerRegistry:
+    """Get the process-wide CLEAR circuit breakers built from the environment."""
+    global _circuit_breakers
+    with _circuit_breakers_lock:
+        if _circuit_breakers is None:
+            _circuit_breakers = CircuitBreakerRegistry.from_config(
+                ClearAPIConfig.from_environment()
+            )
+        return _circuit_breakers
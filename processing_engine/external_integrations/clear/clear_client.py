@@ -1,7 +1,7 @@
 """Clear API client implementation."""
 
-from processing_engine.external_integrations.base_client import BaseExternalAPIClient
+from processing_engine.external_integrations.base_client import BaseApiClient
 
 
-class ClearClient(BaseExternalAPIClient):
+class ClearClient(BaseApiClient):
     """Clear API client."""
@@ -1,19 +1,29 @@
 """Thomson Reuters CLEAR API client implementation."""
 
+import logging
 import os
 import time
 from typing import Dict, Any, Optional
-import requests
-from diskcache import Cache
+import httpx
 
-from .base_client import BaseExternalAPIClient, AuthenticationError, APIClientError
+from .base_client import BaseApiClient
+from .circuit_breaker import CircuitBreakerRegistry, get_clear_circuit_breakers
+from .exceptions import APIClientError, AuthenticationError, CircuitOpenError
+from .rate_limiter import EndpointRateLimiter, RateLimiter, get_clear_rate_limiter
+from .retry import RetryPolicy, get_clear_retry_policy
+from .token_provider import EXPIRY_BUFFER, get_token_provider
 
 
-class ClearAPIClient(BaseExternalAPIClient):
+class ClearAPIClient(BaseApiClient):
     """Thomson Reuters CLEAR API client with authentication and caching."""
 
     def __init__(
-        self, client_key: Optional[str] = None, client_secret: Optional[str] = None
+        self,
+        client_key: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter | EndpointRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
     ):
         """Initialize CLEAR API client with credentials."""
         credentials = {
@@ -27,7 +37,8 @@ class ClearAPIClient(BaseExternalAPIClient):
                 "either as parameters or environment variables"
             )
 
-        super().__init__(credentials)
+        self.credentials = credentials
+        self.logger = logging.getLogger(__name__)
 
         # API endpoints configuration
         self.api_base = (
@@ -37,6 +48,14 @@ class ClearAPIClient(BaseExternalAPIClient):
             os.getenv("CLEAR_S2S_URL") or "https://s2ssandbox.thomsonreuters.com"
         ).rstrip("/")
 
+        self.BASE_URL = self.s2s_base
+        super().__init__(
+            timeout=int(os.getenv("CLEAR_REQUEST_TIMEOUT", "30")),
+            rate_limiter=rate_limiter or get_clear_rate_limiter(),
+            retry_policy=retry_policy or get_clear_retry_policy(),
+            circuit_breakers=circuit_breakers or get_clear_circuit_breakers(),
+        )
+
         self.endpoints = {
             "auth": f"{self.api_base}/tr-oauth/v1/token",
             "business-search": f"{self.s2s_base}/v2/business/searchResults",
@@ -45,76 +64,71 @@ class ClearAPIClient(BaseExternalAPIClient):
             "person-report": f"{self.s2s_base}/v3/personReport/reportResults",
         }
 
-        # Token caching setup
-        cache_dir = os.path.join(os.path.expanduser("~"), ".clear_api_cache")
-        self._cache = Cache(cache_dir)
-        self._cache_key = "clear_api_token"
-        self._token_cache = None
-        self._token_expires_at = 0
+        # Token holder shared with every other CLEAR caller in this process
+        self._token_provider = get_token_provider(
+            self.endpoints["auth"],
+            self.credentials["client_key"],
+            self.credentials["client_secret"],
+            os.path.join(os.path.expanduser("~"), ".clear_api_cache"),
+        )
 
     def authenticate(self) -> str:
         """Authenticate with CLEAR API and return access token."""
-        # Check cached token first
-        current_time = time.time()
-
-        if self._token_cache and current_time < self._token_expires_at - 60:
-            return self._token_cache
-
-        # Check disk cache
-        cached_data = self._cache.get(self._cache_key)
-        if cached_data:
-            token, expires_at = cached_data
-            if current_time < expires_at - 60:
-                self._token_cache = token
-                self._token_expires_at = expires_at
-                return token
-
-        # Get new token
-        return self._refresh_token()
+        try:
+            return self._token_provider.get_token()
+        except httpx.HTTPError as e:
+            raise AuthenticationError(
+                f"Failed to authenticate with CLEAR API: {str(e)}"
+            ) from e
+        except KeyError as e:
+            raise AuthenticationError(f"Invalid token response format: {str(e)}") from e
 
     def _refresh_token(self) -> str:
         """Request a new access token from CLEAR API."""
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": self.credentials["client_key"],
-            "client_secret": self.credentials["client_secret"],
-        }
-
         try:
-            response = requests.post(
-                self.endpoints["auth"], headers=headers, data=data, timeout=self.timeout
-            )
-            response.raise_for_status()
-
-            token_data = response.json()
-            access_token = token_data["access_token"]
-            expires_in = token_data["expires_in"]
-
-            # Calculate absolute expiry time
-            expires_at = time.time() + expires_in
-
-            # Cache the token
-            self._token_cache = access_token
-            self._token_expires_at = expires_at
-            self._cache.set(self._cache_key, (access_token, expires_at))
-
-            self.logger.info("Successfully refreshed CLEAR API token")
-            return access_token
-
-        except requests.exceptions.RequestException as e:
+            return self._token_provider.refresh()
+        except httpx.HTTPError as e:
             raise AuthenticationError(
                 f"Failed to authenticate with CLEAR API: {str(e)}"
             ) from e
         except KeyError as e:
             raise AuthenticationError(f"Invalid token response format: {str(e)}") from e
 
+    def _xml_request(
+        self,
+        method: str,
+        endpoint: str,
+        url: Optional[str] = None,
+        xml_request: Optional[str] = None,
+    ) -> httpx.Response:
+        """Send an authenticated XML request to a named CLEAR endpoint."""
+        headers = {
+            "Authorization": f"Bearer {self.authenticate()}",
+            "Accept": "application/xml",
+        }
+        if xml_request is not None:
+            headers["Content-Type"] = "application/xml"
+
+        response = self._send(
+            method,
+            url or self.endpoints[endpoint],
+            endpoint=endpoint,
+            headers=headers,
+            content=xml_request,
+        )
+        self._raise_for_status(response)
+        return response
+
     def business_search(self, xml_request: str) -> Dict[str, Any]:
         """Perform a business search request."""
         try:
-            response = self.post(self.endpoints["business-search"], xml_request)
+            response = self._xml_request(
+                "POST", "business-search", xml_request=xml_request
+            )
             return {"xml_response": response.text, "status_code": response.status_code}
+        except CircuitOpenError:
+            # keep the fail-fast error typed so callers can back off
+            raise
         except Exception as e:
             self.logger.error(f"Business search failed: {str(e)}")
             raise APIClientError(f"Business search failed: {str(e)}") from e
@@ -122,8 +136,12 @@ class ClearAPIClient(BaseExternalAPIClient):
     def person_search(self, xml_request: str) -> Dict[str, Any]:
         """Perform a person search request."""
         try:
-            response = self.post(self.endpoints["person-search"], xml_request)
+            response = self._xml_request(
+                "POST", "person-search", xml_request=xml_request
+            )
             return {"xml_response": response.text, "status_code": response.status_code}
+        except CircuitOpenError:
+            raise
         except Exception as e:
             self.logger.error(f"Person search failed: {str(e)}")
             raise APIClientError(f"Person search failed: {str(e)}") from e
@@ -131,8 +149,12 @@ class ClearAPIClient(BaseExternalAPIClient):
     def business_report(self, xml_request: str) -> Dict[str, Any]:
         """Generate a business report."""
         try:
-            response = self.post(self.endpoints["business-report"], xml_request)
+            response = self._xml_request(
+                "POST", "business-report", xml_request=xml_request
+            )
             return {"xml_response": response.text, "status_code": response.status_code}
+        except CircuitOpenError:
+            raise
         except Exception as e:
             self.logger.error(f"Business report failed: {str(e)}")
             raise APIClientError(f"Business report failed: {str(e)}") from e
@@ -140,40 +162,44 @@ class ClearAPIClient(BaseExternalAPIClient):
     def person_report(self, xml_request: str) -> Dict[str, Any]:
         """Generate a person report."""
         try:
-            response = self.post(self.endpoints["person-report"], xml_request)
+            response = self._xml_request(
+                "POST", "person-report", xml_request=xml_request
+            )
             return {"xml_response": response.text, "status_code": response.status_code}
+        except CircuitOpenError:
+            raise
         except Exception as e:
             self.logger.error(f"Person report failed: {str(e)}")
             raise APIClientError(f"Person report failed: {str(e)}") from e
 
+    def fetch_results(self, uri: str) -> Dict[str, Any]:
+        """Fetch a search or report result URI returned by CLEAR."""
+        try:
+            response = self._xml_request("GET", "results", url=uri)
+            return {"xml_response": response.text, "status_code": response.status_code}
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Result fetch failed: {str(e)}")
+            raise APIClientError(f"Result fetch failed: {str(e)}") from e
+
     def clear_token_cache(self) -> None:
         """Clear the cached authentication token."""
-        self._token_cache = None
-        self._token_expires_at = 0
-        self._cache.delete(self._cache_key)
+        self._token_provider.clear()
         self.logger.info("Cleared CLEAR API token cache")
 
     def get_token_info(self) -> Optional[Dict[str, Any]]:
         """Get information about the current cached token."""
-        if not self._token_cache:
-            cached_data = self._cache.get(self._cache_key)
-            if cached_data:
-                token, expires_at = cached_data
-                self._token_cache = token
-                self._token_expires_at = expires_at
-
-        if not self._token_cache:
+        cached_data = self._token_provider.snapshot()
+        if not cached_data:
             return None
 
+        token, expires_at = cached_data
         current_time = time.time()
-        expires_in = int(self._token_expires_at - current_time)
+        expires_in = int(expires_at - current_time)
 
         return {
-            "token_preview": (
-                self._token_cache[:10] + "..."
-                if len(self._token_cache) > 10
-                else self._token_cache
-            ),
+            "token_preview": token[:10] + "..." if len(token) > 10 else token,
             "expires_in": expires_in,
-            "is_valid": current_time < self._token_expires_at - 60,
+            "is_valid": current_time < expires_at - EXPIRY_BUFFER,
         }
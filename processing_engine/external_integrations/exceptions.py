@@ -0,0 +1,24 @@
+"""Exceptions raised by the external API clients."""
+
+
+class APIClientError(RuntimeError):
+    """Raised when an external API request fails."""
+
+
+class AuthenticationError(APIClientError):
+    """Raised when authentication against an external API fails."""
+
+
+class RateLimitError(APIClientError):
+    """Raised when an external API rejects a request with HTTP 429."""
+
+
+class CircuitOpenError(APIClientError):
+    """Raised without calling the API while an endpoint's circuit is open."""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        super().__init__(
+            f"Circuit for {endpoint} is open, retry in {retry_in:.1f} seconds"
+        )
+        self.endpoint = endpoint
+        self.retry_in = retry_in
@@ -1,36 +1,380 @@
 """Rate limiting utilities for external API clients."""
 
-import time
+import asyncio
+import math
+import os
 import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from diskcache import Cache
+
+from processing_engine.config.clear_config import ClearAPIConfig
+
+# Bucket state: (available tokens, time of last update)
+BucketState = Tuple[float, float]
+
+T = TypeVar("T")
+
+
+def reserve_tokens(
+    state: Optional[BucketState],
+    now: float,
+    cost: float,
+    rate: float,
+    capacity: float,
+) -> Tuple[BucketState, float]:
+    """
+    Reserve ``cost`` tokens from a token bucket.
+
+    The bucket is allowed to go negative: a caller that cannot be served
+    right away still takes its tokens now and is told how long to wait for
+    them to refill. Later callers see a deeper deficit and wait longer, which
+    makes the bucket first-come first-served without anyone sleeping while
+    holding the bucket.
+
+    Args:
+        state: Current bucket state, or None for a full bucket
+        now: Current time in seconds
+        cost: Number of tokens to take
+        rate: Refill rate in tokens per second
+        capacity: Maximum number of tokens (burst size)
+
+    Returns:
+        Tuple of the new bucket state and the seconds to wait before sending
+    """
+    tokens, updated_at = state if state is not None else (capacity, now)
+    tokens = min(capacity, tokens + max(0.0, now - updated_at) * rate) - cost
+    wait = 0.0 if tokens >= 0 else -tokens / rate
+    return (tokens, now), wait
+
+
+class BucketStore(ABC):
+    """Backend holding token bucket state, possibly shared between processes."""
+
+    # reservations do I/O (SQLite, network) and must not run on the event loop
+    blocking = True
+
+    @abstractmethod
+    def reserve(self, key: str, cost: float, rate: float, capacity: float) -> float:
+        """
+        Atomically reserve ``cost`` tokens from the bucket stored at ``key``.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request
+        """
+
+
+class MemoryBucketStore(BucketStore):
+    """Bucket state local to this process."""
+
+    blocking = False
+
+    def __init__(self):
+        self._states: Dict[str, BucketState] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, cost: float, rate: float, capacity: float) -> float:
+        with self._lock:
+            self._states[key], wait = reserve_tokens(
+                self._states.get(key), time.monotonic(), cost, rate, capacity
+            )
+        return wait
+
+
+class DiskCacheBucketStore(BucketStore):
+    """
+    Bucket state in a diskcache directory shared by every process on a host.
+
+    Each reservation is one SQLite transaction, so concurrent processes see
+    a single, consistent bucket.
+    """
+
+    def __init__(self, cache: Cache):
+        self.cache = cache
+
+    def reserve(self, key: str, cost: float, rate: float, capacity: float) -> float:
+        with self.cache.transact():
+            state, wait = reserve_tokens(
+                self.cache.get(key), time.time(), cost, rate, capacity
+            )
+            # Once the bucket has refilled its state no longer matters
+            self.cache.set(key, state, expire=capacity / rate + 60)
+        return wait
+
+
+class RedisBucketStore(BucketStore):
+    """
+    Bucket state in a Redis-compatible server shared by every host.
+
+    The reservation runs as a Lua script using the server clock, so it is
+    atomic and unaffected by clock skew between hosts. Any client exposing
+    redis-py's ``eval(script, numkeys, *keys_and_args)`` can be used.
+    """
+
+    SCRIPT = """
+local tokens_and_ts = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local cost = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local capacity = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local tokens = tonumber(tokens_and_ts[1]) or capacity
+local ts = tonumber(tokens_and_ts[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - cost
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[4]))
+if tokens >= 0 then
+    return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBucketStore":
+        """Connect to a Redis-compatible server; requires the redis package."""
+        try:
+            import redis  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "The redis rate limit backend requires the redis package"
+            ) from e
+        return cls(redis.Redis.from_url(url))
+
+    def reserve(self, key: str, cost: float, rate: float, capacity: float) -> float:
+        ttl = math.ceil(capacity / rate) + 60
+        return float(self.client.eval(self.SCRIPT, 1, key, cost, rate, capacity, ttl))
+
+
+def build_bucket_store(backend: str, location: str = "") -> BucketStore:
+    """
+    Create a bucket store from configuration.
+
+    Args:
+        backend: ``memory``, ``diskcache`` or ``redis``
+        location: Cache directory for diskcache, server URL for redis
+    """
+    if backend == "memory":
+        return MemoryBucketStore()
+    if backend == "diskcache":
+        directory = location or os.path.join("~", ".clear_api_ratelimit")
+        return DiskCacheBucketStore(Cache(os.path.expanduser(directory)))
+    if backend == "redis":
+        return RedisBucketStore.from_url(location or "redis://localhost:6379/0")
+    raise ValueError(f"Unknown rate limit backend: {backend}")
+
+
+async def _reserve_off_loop(
+    blocking: bool, reserve: Callable[[], T], refund: Callable[[T], None]
+) -> T:
+    """
+    Run a reservation, in a worker thread if its store blocks.
+
+    A caller cancelled while the thread runs cannot stop the reservation;
+    it is refunded once it lands.
+    """
+    if not blocking:
+        return reserve()
+    reservation = asyncio.ensure_future(asyncio.to_thread(reserve))
+    try:
+        return await asyncio.shield(reservation)
+    except asyncio.CancelledError:
+
+        def refund_when_reserved(done: asyncio.Future) -> None:
+            if not done.cancelled() and done.exception() is None:
+                _refund_off_loop(blocking, lambda: refund(done.result()))
+
+        reservation.add_done_callback(refund_when_reserved)
+        raise
+
+
+def _refund_off_loop(blocking: bool, refund: Callable[[], None]) -> Optional[Awaitable]:
+    """Start a refund without waiting for it, in a worker thread if it blocks."""
+    if not blocking:
+        refund()
+        return None
+    return asyncio.get_running_loop().run_in_executor(None, refund)
 
 
 class RateLimiter:
-    """Simple token bucket rate limiter."""
+    """Token bucket rate limiter with weighted, first-come first-served waits."""
 
-    def __init__(self, rate: int, per: int):
+    def __init__(
+        self,
+        rate: int,
+        per: int,
+        capacity: Optional[float] = None,
+        store: Optional[BucketStore] = None,
+        key: str = "default",
+    ):
         """
         Args:
             rate: number of requests allowed
             per: time window in seconds
+            capacity: burst size in tokens, defaults to ``rate``
+            store: where the bucket state lives, defaults to this process
+            key: name of the bucket within the store
         """
         self.rate = rate
         self.per = per
-        self.allowance = rate
-        self.last_check = time.monotonic()
-        self.lock = threading.Lock()
-
-    def acquire(self):
-        """Block until a request can be made."""
-        with self.lock:
-            now = time.monotonic()
-            elapsed = now - self.last_check
-            self.last_check = now
-            self.allowance += elapsed * (self.rate / self.per)
-            self.allowance = min(self.allowance, self.rate)
-
-            if self.allowance < 1.0:
-                sleep_time = (1.0 - self.allowance) * (self.per / self.rate)
-                time.sleep(sleep_time)
-                self.allowance = 0
-            else:
-                self.allowance -= 1.0
+        self.capacity = float(capacity if capacity is not None else rate)
+        self.store = store or MemoryBucketStore()
+        self.key = key
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Refill rate of the bucket."""
+        return self.rate / self.per
+
+    def _reserve(self, cost: float) -> float:
+        return self.store.reserve(self.key, cost, self.tokens_per_second, self.capacity)
+
+    def _refund(self, cost: float) -> None:
+        """Return tokens reserved by a caller that gave up waiting."""
+        self._reserve(-cost)
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """
+        Block until a request of the given cost can be made.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        wait = self._reserve(cost)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, cost: float = 1.0) -> float:
+        """
+        Wait without blocking the event loop until a request can be made.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        blocking = self.store.blocking
+        wait = await _reserve_off_loop(
+            blocking, lambda: self._reserve(cost), lambda _: self._refund(cost)
+        )
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                _refund_off_loop(blocking, lambda: self._refund(cost))
+                raise
+        return wait
+
+
+class EndpointRateLimiter:
+    """
+    Rate limiter for CLEAR that enforces a shared quota and per-endpoint limits.
+
+    Every request draws its endpoint's weighted cost from the shared bucket
+    (so a report can cost more than a search) and one token from the bucket
+    of its own endpoint, if that endpoint has a separate limit.
+    """
+
+    def __init__(
+        self,
+        shared: RateLimiter,
+        endpoint_limits: Optional[Dict[str, RateLimiter]] = None,
+        endpoint_costs: Optional[Dict[str, float]] = None,
+    ):
+        self.shared = shared
+        self.endpoint_limits = endpoint_limits or {}
+        self.endpoint_costs = endpoint_costs or {}
+
+    @classmethod
+    def from_config(cls, config: ClearAPIConfig) -> "EndpointRateLimiter":
+        """Build the limiter from the CLEAR API configuration."""
+        store = build_bucket_store(
+            config.rate_limit_backend, config.rate_limit_location
+        )
+        shared_rate = 1.0 / config.rate_limit_interval
+        return cls(
+            shared=RateLimiter(shared_rate, 1, store=store, key="clear:shared"),
+            endpoint_limits={
+                endpoint: RateLimiter(
+                    rate, 1, store=store, key=f"clear:endpoint:{endpoint}"
+                )
+                for endpoint, rate in config.endpoint_rate_limits.items()
+            },
+            endpoint_costs=dict(config.endpoint_costs),
+        )
+
+    def cost_of(self, endpoint: str) -> float:
+        """Weighted cost of one request to an endpoint."""
+        return self.endpoint_costs.get(endpoint, 1.0)
+
+    def _reserve(self, endpoint: str, cost: Optional[float]) -> Tuple[float, float]:
+        cost = self.cost_of(endpoint) if cost is None else cost
+        wait = self.shared._reserve(cost)
+        limiter = self.endpoint_limits.get(endpoint)
+        if limiter is not None:
+            wait = max(wait, limiter._reserve(1.0))
+        return cost, wait
+
+    def _refund(self, endpoint: str, cost: float) -> None:
+        """Return the tokens of a reservation whose caller gave up waiting."""
+        self.shared._refund(cost)
+        if endpoint in self.endpoint_limits:
+            self.endpoint_limits[endpoint]._refund(1.0)
+
+    def _blocking(self, endpoint: str) -> bool:
+        limiter = self.endpoint_limits.get(endpoint)
+        return self.shared.store.blocking or (
+            limiter is not None and limiter.store.blocking
+        )
+
+    def acquire(self, endpoint: str, cost: Optional[float] = None) -> float:
+        """
+        Block until a request to ``endpoint`` can be made.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        _, wait = self._reserve(endpoint, cost)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, endpoint: str, cost: Optional[float] = None) -> float:
+        """
+        Wait without blocking the event loop until ``endpoint`` can be called.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        blocking = self._blocking(endpoint)
+        cost, wait = await _reserve_off_loop(
+            blocking,
+            lambda: self._reserve(endpoint, cost),
+            lambda reserved: self._refund(endpoint, reserved[0]),
+        )
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                _refund_off_loop(blocking, lambda: self._refund(endpoint, cost))
+                raise
+        return wait
+
+
+# Global CLEAR rate limiter instance
+_endpoint_limiter: Optional[EndpointRateLimiter] = None
+_endpoint_limiter_lock = threading.Lock()
+
+
+def get_clear_rate_limiter() -> EndpointRateLimiter:
+    """Get the process-wide CLEAR rate limiter built from the environment."""
+    global _endpoint_limiter
+    with _endpoint_limiter_lock:
+        if _endpoint_limiter is None:
+            _endpoint_limiter = EndpointRateLimiter.from_config(
+                ClearAPIConfig.from_environment()
+            )
+        return _endpoint_limiter
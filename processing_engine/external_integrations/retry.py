@@ -0,0 +1,235 @@
+"""Retry policy for transient CLEAR API failures."""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional, Union
+
+import httpx
+
+from processing_engine.config.clear_config import ClearAPIConfig
+
+# Upstream answers that are worth sending again
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Transport failures that are worth sending again: connection resets,
+# refused connections and every kind of timeout
+RETRYABLE_EXCEPTIONS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+# Methods that can be sent twice without doing the work twice
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Transport failures where the request never reached the server: the only
+# ones a POST (which may buy a report) can be sent again after
+UNSENT_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header given in seconds or as an HTTP date.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is absent or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Retry transient failures with decorrelated jitter and a total time budget.
+
+    A request is sent at most ``max_retries + 1`` times. Between attempts the
+    policy waits for the server's ``Retry-After`` when one is given, otherwise
+    for a decorrelated-jitter delay between ``base_delay`` and three times
+    the previous delay, capped at ``max_delay``. No retry is started that
+    would end past ``budget`` seconds after the first attempt; the last
+    response (or exception) is then handed back to the caller.
+
+    Requests that are not idempotent are only sent again when the first
+    attempt cannot have been acted on: it never reached the server, was
+    throttled (429) or was turned away with a ``Retry-After`` (503).
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        budget: float = 60.0,
+        rng: Optional[random.Random] = None,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.rng = rng or random.Random()
+
+    @classmethod
+    def from_config(cls, config: ClearAPIConfig) -> "RetryPolicy":
+        """Build the policy from the CLEAR API configuration."""
+        return cls(
+            max_retries=config.max_retries,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay,
+            budget=config.retry_budget,
+        )
+
+    @staticmethod
+    def is_retryable(
+        outcome: Union[httpx.Response, BaseException], idempotent: bool = True
+    ) -> bool:
+        """
+        Return True if a response or exception is a transient failure that
+        is safe to send again.
+
+        Args:
+            outcome: The response or transport error of an attempt
+            idempotent: Whether sending the request twice is harmless
+        """
+        if isinstance(outcome, httpx.Response):
+            if idempotent:
+                return outcome.status_code in RETRYABLE_STATUS_CODES
+            return outcome.status_code == 429 or (
+                outcome.status_code == 503 and "Retry-After" in outcome.headers
+            )
+        if idempotent:
+            return isinstance(outcome, RETRYABLE_EXCEPTIONS)
+        return isinstance(outcome, UNSENT_EXCEPTIONS)
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: a random delay growing from the previous one."""
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, self.rng.uniform(self.base_delay, upper))
+
+    def _plan(
+        self,
+        outcome: Union[httpx.Response, BaseException],
+        attempt: int,
+        previous: float,
+        deadline: float,
+        idempotent: bool,
+    ) -> Optional[float]:
+        """Return the delay before the next attempt, or None to stop."""
+        if attempt >= self.max_retries or not self.is_retryable(outcome, idempotent):
+            return None
+
+        delay = self.next_delay(previous)
+        if isinstance(outcome, httpx.Response):
+            retry_after = parse_retry_after(outcome.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = retry_after
+
+        if time.monotonic() + delay > deadline:
+            return None
+
+        logger.warning(
+            "Retrying CLEAR request in %.2fs after %s (retry %d of %d)",
+            delay,
+            (
+                f"HTTP {outcome.status_code}"
+                if isinstance(outcome, httpx.Response)
+                else type(outcome).__name__
+            ),
+            attempt + 1,
+            self.max_retries,
+        )
+        return delay
+
+    def run(
+        self, send: Callable[[], httpx.Response], idempotent: bool = True
+    ) -> httpx.Response:
+        """
+        Call ``send`` until it succeeds, fails fatally or retries run out.
+
+        Args:
+            send: Sends the request once
+            idempotent: Whether the request may be sent again after it could
+                have reached the server (True for GET, False for POST)
+
+        Returns:
+            httpx.Response: The first non-retryable response, or the last one
+
+        Raises:
+            httpx.HTTPError: The last transport error once retries run out
+        """
+        deadline = time.monotonic() + self.budget
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            try:
+                outcome: Union[httpx.Response, BaseException] = send()
+            except RETRYABLE_EXCEPTIONS as e:
+                outcome = e
+
+            next_delay = self._plan(outcome, attempt, delay, deadline, idempotent)
+            if next_delay is None:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                return outcome
+
+            if isinstance(outcome, httpx.Response):
+                outcome.close()
+            time.sleep(next_delay)
+            delay = next_delay
+            attempt += 1
+
+    async def run_async(
+        self, send: Callable[[], Awaitable[httpx.Response]], idempotent: bool = True
+    ) -> httpx.Response:
+        """Async counterpart of ``run`` that sleeps without blocking the loop."""
+        deadline = time.monotonic() + self.budget
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            try:
+                outcome: Union[httpx.Response, BaseException] = await send()
+            except RETRYABLE_EXCEPTIONS as e:
+                outcome = e
+
+            next_delay = self._plan(outcome, attempt, delay, deadline, idempotent)
+            if next_delay is None:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                return outcome
+
+            if isinstance(outcome, httpx.Response):
+                await outcome.aclose()
+            await asyncio.sleep(next_delay)
+            delay = next_delay
+            attempt += 1
+
+
+# Global CLEAR retry policy instance
+_retry_policy: Optional[RetryPolicy] = None
+_retry_policy_lock = threading.Lock()
+
+
+def get_clear_retry_policy() -> RetryPolicy:
+    """Get the process-wide CLEAR retry policy built from the environment."""
+    global _retry_policy
+    with _retry_policy_lock:
+        if _retry_policy is None:
+            _retry_policy = RetryPolicy.from_config(ClearAPIConfig.from_environment())
+        return _retry_policy
@@ -0,0 +1,290 @@
+"""In-process OAuth token holder for the Thomson Reuters CLEAR API."""
+
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from diskcache import Cache
+
+from processing_engine.cache.tiered_cache import TieredCache
+
+from .transport import get_transport
+
+# Tokens are treated as expired this many seconds before their real expiry
+EXPIRY_BUFFER = 60
+
+# How long per-hour refresh counters are kept in the shared cache
+REFRESH_COUNTER_RETENTION = 48 * 3600
+
+
+class TokenProvider:
+    """
+    Serve CLEAR access tokens from memory with single-flight refresh.
+
+    The hot path is a single attribute read; diskcache is only consulted
+    when the in-memory token is missing or expired. Concurrent callers that
+    miss at the same time share one OAuth round trip, and a background
+    timer renews the token ``renew_ahead`` seconds before the expiry buffer
+    so requests never wait on the OAuth endpoint.
+
+    Across processes sharing the cache directory, refreshes are serialized
+    by a lease: an atomic ``Cache.add`` on ``<cache_key>:lease`` that expires
+    on its own if the holder dies. Only the lease holder calls the OAuth
+    endpoint; every other process waits for the new token to land on disk.
+    Lease, hand-off and counter reads therefore bypass the memory tier when
+    ``cache`` is a ``TieredCache``.
+    """
+
+    def __init__(
+        self,
+        auth_url: str,
+        client_key: str,
+        client_secret: str,
+        cache: Cache | TieredCache,
+        cache_key: str = "clear_api_token",
+        renew_ahead: float = 300.0,
+        timeout: float = 30.0,
+        lease_poll_interval: float = 0.05,
+    ):
+        self.auth_url = auth_url
+        self.client_key = client_key
+        self.client_secret = client_secret
+        self.cache = cache
+        self._disk = cache.disk if isinstance(cache, TieredCache) else cache
+        self.cache_key = cache_key
+        self.renew_ahead = renew_ahead
+        self.timeout = timeout
+        self.lease_key = f"{cache_key}:lease"
+        # A lease outlives the OAuth request it protects, then expires on its own
+        self.lease_ttl = timeout + 5
+        self.lease_poll_interval = lease_poll_interval
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.logger = logging.getLogger(__name__)
+
+        self._current: Optional[Tuple[str, float]] = None
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    @staticmethod
+    def _is_valid(current: Optional[Tuple[str, float]]) -> bool:
+        return current is not None and time.time() < current[1] - EXPIRY_BUFFER
+
+    def get_token(self) -> str:
+        """
+        Get a valid access token.
+
+        Returns:
+            str: access_token
+
+        Raises:
+            httpx.HTTPError: If the token request fails
+            KeyError: If the token response is malformed
+        """
+        current = self._current
+        if self._is_valid(current):
+            return current[0]
+
+        with self._lock:
+            # Another caller may have refreshed while we waited for the lock
+            current = self._current
+            if self._is_valid(current):
+                return current[0]
+
+            return self._obtain(newer_than=0.0)
+
+    async def get_token_async(self) -> str:
+        """Get a valid access token without blocking the event loop."""
+        current = self._current
+        if self._is_valid(current):
+            return current[0]
+        return await asyncio.to_thread(self.get_token)
+
+    def refresh(self) -> str:
+        """
+        Replace the current token with a newer one.
+
+        If another process already refreshed since our token was issued its
+        token is adopted; otherwise a new one is requested from OAuth.
+        """
+        with self._lock:
+            current = self._current
+            return self._obtain(newer_than=current[1] if current else 0.0)
+
+    def _obtain(self, newer_than: float) -> str:
+        """
+        Get a valid token expiring after ``newer_than`` from disk or OAuth.
+
+        The caller must hold ``self._lock``.
+        """
+        while True:
+            cached = self._disk.get(self.cache_key)
+            if self._is_valid(cached) and cached[1] > newer_than:
+                self._set(tuple(cached))
+                return cached[0]
+
+            if self._disk.add(self.lease_key, self.owner_id, expire=self.lease_ttl):
+                try:
+                    # The previous holder may have finished just before we won
+                    cached = self._disk.get(self.cache_key)
+                    if self._is_valid(cached) and cached[1] > newer_than:
+                        self._set(tuple(cached))
+                        return cached[0]
+                    return self._refresh()
+                finally:
+                    self._release_lease()
+
+            time.sleep(self.lease_poll_interval)
+
+    def _release_lease(self) -> None:
+        with self._disk.transact():
+            if self._disk.get(self.lease_key) == self.owner_id:
+                self._disk.delete(self.lease_key)
+
+    def _refresh(self) -> str:
+        """Request a new token; the caller must hold the lock and the lease."""
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+
+        data = {
+            "grant_type": "client_credentials",
+            "client_id": self.client_key,
+            "client_secret": self.client_secret,
+        }
+
+        response = get_transport().client.post(
+            self.auth_url, headers=headers, data=data, timeout=self.timeout
+        )
+        response.raise_for_status()
+
+        token_data = response.json()
+        access_token = token_data["access_token"]
+        expires_at = time.time() + token_data["expires_in"]
+
+        self.cache.set(self.cache_key, (access_token, expires_at))
+        self._set((access_token, expires_at))
+        self._count_refresh()
+        self.logger.info("Refreshed CLEAR API token")
+        return access_token
+
+    def _refresh_counter_key(self, hour: datetime) -> str:
+        return f"{self.cache_key}:refreshes:{hour.strftime('%Y-%m-%dT%H:00Z')}"
+
+    def _count_refresh(self) -> None:
+        hour = datetime.now(timezone.utc)
+        key = self._refresh_counter_key(hour)
+        self._disk.incr(key)
+        self._disk.touch(key, expire=REFRESH_COUNTER_RETENTION)
+
+    def refresh_counts(self, hours: int = 24) -> Dict[str, int]:
+        """
+        Get OAuth refreshes per UTC hour across every process on this cache.
+
+        Returns:
+            Dict mapping hour labels (newest first) to refresh counts
+        """
+        now = datetime.now(timezone.utc).timestamp()
+        counts = {}
+        for offset in range(hours):
+            hour = datetime.fromtimestamp(now - offset * 3600, timezone.utc)
+            key = self._refresh_counter_key(hour)
+            counts[key.rsplit(":refreshes:", 1)[1]] = self._disk.get(key, 0)
+        return counts
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get token state and fleet-wide refresh statistics."""
+        current = self.snapshot()
+        counts = self.refresh_counts()
+        return {
+            "is_valid": self._is_valid(current),
+            "expires_in": int(current[1] - time.time()) if current else None,
+            "refreshes_last_hour": next(iter(counts.values())),
+            "refreshes_per_hour": counts,
+            "lease_holder": self._disk.get(self.lease_key),
+            "cache": (
+                self.cache.get_stats() if isinstance(self.cache, TieredCache) else None
+            ),
+        }
+
+    def _set(self, current: Tuple[str, float]) -> None:
+        self._current = current
+        self._schedule_renewal(current[1])
+
+    def _schedule_renewal(self, expires_at: float) -> None:
+        usable = expires_at - EXPIRY_BUFFER - time.time()
+        # Short-lived tokens are renewed halfway through their usable life
+        lead = min(self.renew_ahead, usable / 2)
+        self._start_timer(max(0.0, usable - lead))
+
+    def _start_timer(self, delay: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._background_refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            current = self._current
+            self.logger.warning("Background CLEAR token renewal failed: %s", e)
+            if self._is_valid(current):
+                remaining = current[1] - EXPIRY_BUFFER - time.time()
+                self._start_timer(min(30.0, remaining / 2))
+
+    def clear(self) -> None:
+        """Forget the token in memory and on disk."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._current = None
+            self.cache.delete(self.cache_key)
+
+    def close(self) -> None:
+        """Stop background renewal."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def snapshot(self) -> Optional[Tuple[str, float]]:
+        """Return the known ``(token, expires_at)`` pair, loading it from disk."""
+        current = self._current
+        if current is None:
+            cached = self.cache.get(self.cache_key)
+            current = tuple(cached) if cached else None
+        return current
+
+
+# Providers shared by every caller in this process
+_providers: Dict[Tuple[str, str], TokenProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_token_provider(
+    auth_url: str,
+    client_key: str,
+    client_secret: str,
+    cache_dir: Optional[str] = None,
+) -> TokenProvider:
+    """
+    Get the process-wide token provider for a set of credentials.
+
+    Providers are keyed by cache directory and client key, the same scope
+    as the token stored on disk, so every caller in the process shares it.
+    """
+    cache_dir = os.path.expanduser(
+        cache_dir or os.path.join(os.path.expanduser("~"), ".clear_api_cache")
+    )
+    key = (cache_dir, client_key)
+    with _providers_lock:
+        if key not in _providers:
+            _providers[key] = TokenProvider(
+                auth_url, client_key, client_secret, TieredCache(Cache(cache_dir))
+            )
+        return _providers[key]
@@ -0,0 +1,389 @@
+"""Shared, pooled HTTP transport for every CLEAR API caller.
+
+The token endpoint, the search/report endpoints and the result URI fetches
+all go through one connection pool so keep-alive connections (and HTTP/2
+multiplexing when ``h2`` is installed) are reused instead of paying a new
+TCP+TLS handshake per call.
+"""
+
+import asyncio
+import importlib.util
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from processing_engine.config.transport_config import (
+    TransportConfig,
+    get_transport_config,
+)
+
+
+def http2_available() -> bool:
+    """Return True if the optional ``h2`` dependency is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class PoolStats:
+    """Thread-safe counters describing connection pool usage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.in_flight = 0
+
+    def begin(self) -> "_RequestTracker":
+        """Register a new request that is waiting for a connection."""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self.waiting)
+        return _RequestTracker(self)
+
+    def _update(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a point-in-time copy of the counters."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "connections_reused": self.connections_reused,
+                "waiting": self.waiting,
+                "peak_waiting": self.peak_waiting,
+                "in_flight": self.in_flight,
+            }
+
+
+class _RequestTracker:
+    """Follows a single request through the httpcore trace events."""
+
+    def __init__(self, stats: PoolStats):
+        self._stats = stats
+        self._acquired = False
+        self._connected = False
+        self._finished = False
+
+    def on_event(self, event_name: str) -> None:
+        """Update pool statistics from an httpcore trace event."""
+        if event_name.endswith("connect_tcp.started"):
+            self._connected = True
+            self._acquire()
+        elif event_name.endswith("connect_tcp.complete"):
+            self._stats._update(connections_opened=1)
+        elif event_name.endswith("send_request_headers.started"):
+            if not self._connected and not self._acquired:
+                self._stats._update(connections_reused=1)
+            self._acquire()
+
+    def _acquire(self) -> None:
+        if not self._acquired:
+            self._acquired = True
+            self._stats._update(waiting=-1)
+
+    def finish(self) -> None:
+        """Mark the request as complete, releasing any outstanding counters."""
+        if self._finished:
+            return
+        self._finished = True
+        if not self._acquired:
+            self._acquired = True
+            self._stats._update(waiting=-1, in_flight=-1)
+        else:
+            self._stats._update(in_flight=-1)
+
+    def sync_trace(self, chained: Optional[Callable] = None) -> Callable:
+        """Build a sync trace callback, chaining any caller supplied one."""
+
+        def trace(event_name: str, info: dict) -> None:
+            self.on_event(event_name)
+            if chained is not None:
+                chained(event_name, info)
+
+        return trace
+
+    def async_trace(self, chained: Optional[Callable] = None) -> Callable:
+        """Build an async trace callback, chaining any caller supplied one."""
+
+        async def trace(event_name: str, info: dict) -> None:
+            self.on_event(event_name)
+            if chained is not None:
+                await chained(event_name, info)
+
+        return trace
+
+
+def _host_key(url: httpx.URL) -> Tuple[str, str, Optional[int]]:
+    return (url.scheme, url.host, url.port)
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response stream that runs a callback once the body is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._on_close()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """Async response stream that runs a callback once the body is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._on_close()
+
+
+def _once(func: Callable[[], None]) -> Callable[[], None]:
+    called = False
+
+    def wrapper() -> None:
+        nonlocal called
+        if not called:
+            called = True
+            func()
+
+    return wrapper
+
+
+class _InstrumentedTransport(httpx.BaseTransport):
+    """Sync transport adding per-host limits and pool statistics."""
+
+    def __init__(self, transport: httpx.BaseTransport, stats: PoolStats, per_host: int):
+        self._transport = transport
+        self._stats = stats
+        self._per_host = per_host
+        self._slots: Dict[Tuple, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
+
+    def _slot(self, url: httpx.URL) -> threading.BoundedSemaphore:
+        key = _host_key(url)
+        with self._slots_lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self._per_host)
+            return self._slots[key]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        tracker = self._stats.begin()
+        request.extensions["trace"] = tracker.sync_trace(
+            request.extensions.get("trace")
+        )
+        slot = self._slot(request.url)
+        slot.acquire()
+
+        def release() -> None:
+            tracker.finish()
+            slot.release()
+
+        release = _once(release)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            release()
+            raise
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """Async transport adding per-host limits and pool statistics."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, stats: PoolStats, per_host: int
+    ):
+        self._transport = transport
+        self._stats = stats
+        self._per_host = per_host
+        self._slots: Dict[Tuple, asyncio.Semaphore] = {}
+
+    def _slot(self, url: httpx.URL) -> asyncio.Semaphore:
+        key = _host_key(url)
+        if key not in self._slots:
+            self._slots[key] = asyncio.Semaphore(self._per_host)
+        return self._slots[key]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        tracker = self._stats.begin()
+        request.extensions["trace"] = tracker.async_trace(
+            request.extensions.get("trace")
+        )
+        slot = self._slot(request.url)
+        try:
+            await slot.acquire()
+        except BaseException:
+            tracker.finish()
+            raise
+
+        def release() -> None:
+            tracker.finish()
+            slot.release()
+
+        release = _once(release)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        response.stream = _AsyncReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """View over the shared pool that ignores close() from individual clients."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        """The pool is owned by ClearTransport, not by the client using it."""
+
+
+class ClearTransport:
+    """
+    Owner of the pooled sync and async HTTP transports for CLEAR calls.
+
+    Sync callers share ``client`` (or a ``session()`` view when they need
+    their own default headers/auth); async callers share ``async_client``,
+    which is opened and closed with the application lifespan.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or get_transport_config()
+        self.http2 = self.config.http2 and http2_available()
+        self.stats = PoolStats()
+        self.async_stats = PoolStats()
+        self._lock = threading.Lock()
+        self._pool: Optional[_InstrumentedTransport] = None
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+
+    def _sync_pool(self) -> _InstrumentedTransport:
+        with self._lock:
+            if self._pool is None:
+                self._pool = _InstrumentedTransport(
+                    httpx.HTTPTransport(limits=self._limits(), http2=self.http2),
+                    self.stats,
+                    self.config.max_connections_per_host,
+                )
+            return self._pool
+
+    def session(self, **kwargs) -> httpx.Client:
+        """Create a client with its own headers/auth on top of the shared pool."""
+        kwargs.setdefault("timeout", self.config.request_timeout)
+        return httpx.Client(transport=_SharedTransport(self._sync_pool()), **kwargs)
+
+    @property
+    def client(self) -> httpx.Client:
+        """Shared sync client for callers that pass headers per request."""
+        if self._client is None:
+            client = self.session()
+            with self._lock:
+                if self._client is None:
+                    self._client = client
+        return self._client
+
+    def open_async(self) -> httpx.AsyncClient:
+        """Open (or return the already open) shared async client."""
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                transport=_AsyncInstrumentedTransport(
+                    httpx.AsyncHTTPTransport(limits=self._limits(), http2=self.http2),
+                    self.async_stats,
+                    self.config.max_connections_per_host,
+                ),
+                timeout=self.config.request_timeout,
+            )
+        return self._async_client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared async client; ``open_async()`` must have been called."""
+        if self._async_client is None or self._async_client.is_closed:
+            raise RuntimeError("Async CLEAR transport is not open")
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the shared async client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def close(self) -> None:
+        """Close the shared sync pool."""
+        with self._lock:
+            pool, self._pool, self._client = self._pool, None, None
+        if pool is not None:
+            pool.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool statistics for the sync and async sides."""
+        return {
+            "http2": self.http2,
+            "max_connections": self.config.max_connections,
+            "max_connections_per_host": self.config.max_connections_per_host,
+            "sync": self.stats.snapshot(),
+            "async": self.async_stats.snapshot(),
+        }
+
+
+# Global transport instance
+_transport_instance: Optional[ClearTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> ClearTransport:
+    """Get the process-wide CLEAR transport instance."""
+    global _transport_instance
+    with _transport_lock:
+        if _transport_instance is None:
+            _transport_instance = ClearTransport()
+        return _transport_instance
+
+
+def set_transport(transport: ClearTransport) -> None:
+    """Replace the process-wide CLEAR transport instance."""
+    global _transport_instance
+    with _transport_lock:
+        _transport_instance = transport
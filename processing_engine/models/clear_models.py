@@ -136,6 +136,10 @@ class ClearSearchResult(BaseModel):
     status_code: int = Field(description="HTTP status code")
     success: bool = Field(description="Whether the search was successful")
     error: Optional[str] = Field(default=None, description="Error message if failed")
+    no_match: bool = Field(
+        default=False,
+        description="The response parsed but CLEAR found nothing (no GroupId)",
+    )
 
 
 class ClearReportResult(BaseModel):
@@ -148,7 +152,10 @@ class ClearReportResult(BaseModel):
     timestamp: Optional[str] = Field(default=None, description="Report timestamp")
 
     # Risk flags and analysis
-    flags: Dict[str, str] = Field(default_factory=dict, description="Risk flags")
+    flags: Dict[str, Optional[str]] = Field(
+        default_factory=dict,
+        description="Risk flags; None when the parsed sections did not evaluate it",
+    )
     ucc_analysis: Dict[str, Any] = Field(
         default_factory=dict, description="UCC filings analysis"
     )
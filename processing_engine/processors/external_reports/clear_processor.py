@@ -1,13 +1,19 @@
 """Thomson Reuters CLEAR API processor for comprehensive background checks."""
 
 from asyncio.runners import Runner
-from typing import Any, Union
+from typing import Any, Callable, Union
 
+from processing_engine.cache.keys import request_fingerprint
+from processing_engine.cache.negative_cache import NO_MATCH, get_negative_cache
+from processing_engine.cache.report_cache import get_report_cache, view_name
+from processing_engine.config.clear_config import get_clear_config
 from processing_engine.external_integrations.clear_client import ClearAPIClient
 from processing_engine.processors.runners import ProcessRunner
+from processing_engine.utils.report_stream import parse_sections
 from processing_engine.utils.xml_builder import XMLTemplateBuilder
 from processing_engine.utils.xml_parser import ClearXMLParser
 from processing_engine.models.clear_models import (
+    ClearReportResult,
     BusinessSearchRequest,
     PersonSearchRequest,
     BusinessReportRequest,
@@ -34,6 +40,10 @@ class ClearProcessor(BaseProcessor):
         self.clear_client = ClearAPIClient()
         self.xml_builder = XMLTemplateBuilder()
         self.xml_parser = ClearXMLParser()
+        self.report_cache = get_report_cache()
+        self.negative_cache = get_negative_cache()
+        # only the configured report sections are parsed, all if none are
+        self.report_sections = parse_sections(get_clear_config().report_sections)
 
     def _validate(
         self, data: Union[ProcessorInput, list[ProcessorInput]]
@@ -129,6 +139,13 @@ class ClearProcessor(BaseProcessor):
             business=business,
         )
 
+        # Searches known to find nothing are not sent again for a while
+        negative_key = self._search_key("business", search_request)
+        no_match = self.negative_cache.get(negative_key)
+        if no_match is not None:
+            self.logger.info("Skipping business search with a recent empty result")
+            return no_match
+
         # Perform business search
         search_xml = self.xml_builder.build_business_search_xml(search_request)
         search_response = self.clear_client.business_search(search_xml)
@@ -138,12 +155,16 @@ class ClearProcessor(BaseProcessor):
 
         if not search_result.success or not search_result.group_id:
             self.logger.warning("Business search failed: %s", search_result.error)
-            return {
+            failed = {
                 "search_result": search_result.model_dump(),
                 "report_result": None,
                 "success": False,
                 "error": search_result.error,
             }
+            # a malformed or truncated response may hide a match, retry it
+            if search_result.no_match:
+                self.negative_cache.put(negative_key, NO_MATCH, failed)
+            return failed
 
         # Generate business report
         report_request = BusinessReportRequest(
@@ -151,17 +172,19 @@ class ClearProcessor(BaseProcessor):
             group_id=search_result.group_id,
         )
 
-        report_xml = self.xml_builder.build_business_report_xml(report_request)
-        report_response = self.clear_client.business_report(report_xml)
-        report_result = self.xml_parser.parse_business_report_response(
-            report_response["xml_response"]
+        report_result = self._get_report(
+            search_result.group_id,
+            lambda: self.clear_client.business_report(
+                self.xml_builder.build_business_report_xml(report_request)
+            )["xml_response"],
+            self.xml_parser.parse_business_report_response,
         )
 
         return {
             "search_result": search_result.model_dump(),
-            "report_result": report_result.model_dump(),
-            "success": report_result.success,
-            "error": report_result.error,
+            "report_result": report_result,
+            "success": report_result["success"],
+            "error": report_result["error"],
         }
 
     def _process_owner_check(self, form_data: dict[str, Any]) -> dict[str, Any]:
@@ -185,6 +208,13 @@ class ClearProcessor(BaseProcessor):
             address=self._extract_owner_address(form_data),
         )
 
+        # Searches known to find nothing are not sent again for a while
+        negative_key = self._search_key("person", search_request)
+        no_match = self.negative_cache.get(negative_key)
+        if no_match is not None:
+            self.logger.info("Skipping person search with a recent empty result")
+            return no_match
+
         # Perform person search
         search_xml = self.xml_builder.build_person_search_xml(search_request)
         search_response = self.clear_client.person_search(search_xml)
@@ -194,12 +224,16 @@ class ClearProcessor(BaseProcessor):
 
         if not search_result.success or not search_result.group_id:
             self.logger.warning("Person search failed: %s", search_result.error)
-            return {
+            failed = {
                 "search_result": search_result.model_dump(),
                 "report_result": None,
                 "success": False,
                 "error": search_result.error,
             }
+            # a malformed or truncated response may hide a match, retry it
+            if search_result.no_match:
+                self.negative_cache.put(negative_key, NO_MATCH, failed)
+            return failed
 
         # Generate person report
         report_request = PersonReportRequest(
@@ -207,19 +241,66 @@ class ClearProcessor(BaseProcessor):
             group_id=search_result.group_id,
         )
 
-        report_xml = self.xml_builder.build_person_report_xml(report_request)
-        report_response = self.clear_client.person_report(report_xml)
-        report_result = self.xml_parser.parse_person_report_response(
-            report_response["xml_response"]
+        report_result = self._get_report(
+            search_result.group_id,
+            lambda: self.clear_client.person_report(
+                self.xml_builder.build_person_report_xml(report_request)
+            )["xml_response"],
+            self.xml_parser.parse_person_report_response,
         )
 
         return {
             "search_result": search_result.model_dump(),
-            "report_result": report_result.model_dump(),
-            "success": report_result.success,
-            "error": report_result.error,
+            "report_result": report_result,
+            "success": report_result["success"],
+            "error": report_result["error"],
         }
 
+    @staticmethod
+    def _search_key(kind: str, search_request: Any) -> str:
+        """Cache key of a search request; the reference is only a label."""
+        fingerprint = request_fingerprint(
+            search_request.model_dump(), ignore=("reference",)
+        )
+        return f"clear_processor:{kind}_search:{fingerprint}"
+
+    def _get_report(
+        self,
+        group_id: str,
+        fetch_report: Callable[[], str],
+        parse_report: Callable[..., ClearReportResult],
+    ) -> dict[str, Any]:
+        """Get a parsed report from the shared cache, buying it only on a miss."""
+
+        view = view_name("processor", self.report_sections)
+
+        # the cache already keeps the report XML, the view leaves its copy out
+        def parse(xml_content: str) -> dict[str, Any]:
+            return parse_report(xml_content, self.report_sections).model_dump(
+                exclude={"xml_response"}
+            )
+
+        cached = self.report_cache.get_with_xml(
+            group_id, view, account_id=self.account_id, parse=parse
+        )
+        if cached is not None:
+            self.logger.info("Using cached CLEAR report for group %s", group_id)
+            report_result, report_xml = cached
+            return report_result | {"xml_response": report_xml}
+
+        report_xml = fetch_report()
+        report_result = parse(report_xml)
+        if report_result["success"]:
+            self.report_cache.put(
+                group_id,
+                report_xml,
+                view,
+                report_result,
+                account_id=self.account_id,
+                entity_id=report_result.get("entity_id") or "",
+            )
+        return report_result | {"xml_response": report_xml}
+
     def _extract_business_address(self, form_data: dict[str, Any]) -> Address:
         """Extract business address from form data."""
         return Address(
@@ -0,0 +1,112 @@
+"""
+Keyword classifiers for the categories the report analyzers assign.
+
+Each classifier puts a string (a criminal offense, a lien filing type, a
+lawsuit case type, ...) into every category whose rules it matches:
+
+- ``contains``: the string contains one of the keywords, in any case
+- ``equals``: the string is one of the values, exactly as written
+
+The rules are loaded from JSON (``keyword_rules.json`` next to this module,
+or the file named by ``CLEAR_KEYWORD_RULES``) and compiled once into a
+table of distinct keywords and a set of values, so classifying a string
+looks it up once, upper-cases it once and searches it once per keyword,
+returning every category together.
+"""
+
+import json
+import os
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(__file__), "keyword_rules.json")
+
+RULE_KINDS = ("contains", "equals")
+
+
+class KeywordClassifier:
+    """Categories of a string, from compiled ``contains``/``equals`` rules."""
+
+    def __init__(self, categories: Mapping[str, Mapping[str, Iterable[str]]]):
+        """
+        Compile the rules of each category.
+
+        Args:
+            categories: Category name -> ``{"contains": [...], "equals": [...]}``
+
+        Raises:
+            ValueError: If a category has a rule kind other than those above
+        """
+        self.categories = frozenset(categories)
+        keyword_categories: Dict[str, set] = {}
+        values: Dict[str, set] = {}
+        for category, rules in categories.items():
+            unknown = set(rules) - set(RULE_KINDS)
+            if unknown:
+                raise ValueError(
+                    f"Unknown rules {sorted(unknown)} for category {category!r}, "
+                    f"expected {RULE_KINDS}"
+                )
+            for keyword in rules.get("contains", ()):
+                if keyword:
+                    keyword_categories.setdefault(keyword.upper(), set()).add(category)
+            for value in rules.get("equals", ()):
+                values.setdefault(value, set()).add(category)
+
+        # a keyword listed under several categories is searched for once
+        self._keywords: Tuple[Tuple[str, FrozenSet[str]], ...] = tuple(
+            (keyword, frozenset(keyword_categories[keyword]))
+            for keyword in sorted(keyword_categories, key=len, reverse=True)
+        )
+        self._values = {value: frozenset(found) for value, found in values.items()}
+
+    def classify(self, text: Optional[str]) -> FrozenSet[str]:
+        """Every category ``text`` falls in (none for empty or missing text)."""
+        if not text:
+            return frozenset()
+        found = self._values.get(text, frozenset())
+        normalized = text.upper()
+        for keyword, categories in self._keywords:
+            if keyword in normalized:
+                found = found | categories
+                if len(found) == len(self.categories):
+                    break
+        return found
+
+
+def load_keyword_classifiers(
+    path: Optional[str] = None,
+) -> Dict[str, KeywordClassifier]:
+    """
+    Load and compile the classifiers defined in a JSON rules file.
+
+    Args:
+        path: Rules file (default ``keyword_rules.json`` next to this module),
+            mapping classifier name -> category name -> rules
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON or has unknown rules
+    """
+    with open(path or DEFAULT_RULES_PATH, encoding="utf-8") as f:
+        rules = json.load(f)
+    return {name: KeywordClassifier(categories) for name, categories in rules.items()}
+
+
+# Global classifiers
+_classifiers: Optional[Dict[str, KeywordClassifier]] = None
+
+
+def get_keyword_classifiers() -> Dict[str, KeywordClassifier]:
+    """Get the global classifiers, loaded from ``CLEAR_KEYWORD_RULES``."""
+    global _classifiers
+    if _classifiers is None:
+        _classifiers = load_keyword_classifiers(os.getenv("CLEAR_KEYWORD_RULES"))
+    return _classifiers
+
+
+def set_keyword_classifiers(
+    classifiers: Optional[Dict[str, KeywordClassifier]],
+) -> None:
+    """Set the global classifiers (None reloads them on next use)."""
+    global _classifiers
+    _classifiers = classifiers
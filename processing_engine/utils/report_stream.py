@@ -0,0 +1,135 @@
+"""Single-pass streaming access to the sections of a CLEAR report."""
+
+from typing import (
+    AbstractSet,
+    Any,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .xml_backend import get_xml_backend
+
+STATUS = "status"
+SECTION = "section"
+
+
+def section_key(section_name: str) -> str:
+    """
+    Name a section is selected by: ``"UCCSection"``, ``"UCC"`` and ``"ucc"``
+    all give ``"ucc"``.
+    """
+    return section_name.strip().replace("Section", "").lower()
+
+
+def parse_sections(
+    sections: Union[str, Iterable[str], None],
+) -> Optional[FrozenSet[str]]:
+    """
+    Normalise a section allow-list.
+
+    Args:
+        sections: Comma separated names (``"UCC,LienJudgment,Criminal"``) or
+            an iterable of names, with or without the ``Section`` suffix
+
+    Returns:
+        The section keys to keep, or None to keep every section
+    """
+    if sections is None:
+        return None
+    if isinstance(sections, str):
+        sections = sections.split(",")
+    keys = frozenset(section_key(name) for name in sections if name.strip())
+    return keys or None
+
+
+# risk flags the report parsers set from the analysis of a section
+FLAG_SECTIONS = {
+    "UCCFilings": "UCCSection",
+    "LiensAndJudgements": "LienJudgmentSection",
+    "CriminalHistory": "CriminalSection",
+    "Lawsuits": "LawsuitSection",
+    "Dockets": "DocketSection",
+}
+
+
+def unevaluated_flags(sections: Optional[AbstractSet[str]]) -> List[str]:
+    """Risk flags whose section is not in the allow-list (none without one)."""
+    if sections is None:
+        return []
+    return [
+        flag
+        for flag, section_name in FLAG_SECTIONS.items()
+        if section_key(section_name) not in sections
+    ]
+
+
+def iter_report_elements(
+    xml_content: Union[str, bytes],
+    sections: Optional[AbstractSet[str]] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Stream the Status and SectionResults elements of a report.
+
+    Yields ``(STATUS, element)`` for the first ``Status`` element and
+    ``(SECTION, element)`` for every ``SectionResults`` element, in the
+    order ``root.find(".//Status")`` and ``root.findall(".//SectionResults")``
+    would return them, each as soon as the element is complete. Once the
+    caller resumes iteration, a section (with any sections nested in it) is
+    cleared and detached from its parent, so the whole report is never held
+    in memory; read what you need from an element before moving on.
+
+    With ``sections`` (keys from ``parse_sections``), only sections whose
+    ``SectionName`` is listed are yielded; the others are dropped unread.
+
+    Raises:
+        ParseError: If the XML is malformed (see ``xml_backend.ParseError``);
+            with ElementTree, the same message as ``ET.fromstring`` would give
+    """
+    backend = get_xml_backend()
+    # ancestors of the current element, to detach consumed sections, for
+    # backends whose elements do not know their parent
+    stack = None if backend.has_parents else []
+    status = None
+    open_sections = 0
+
+    events = backend.iterparse(
+        xml_content, events=("start", "end"), tags=("Status", "SectionResults")
+    )
+    for event, element in events:
+        if event == "start":
+            if stack is not None:
+                stack.append(element)
+            if status is None and element.tag == "Status":
+                status = element
+            elif element.tag == "SectionResults":
+                open_sections += 1
+            continue
+
+        if stack is not None:
+            stack.pop()
+        if element is status:
+            yield STATUS, element
+        if element.tag != "SectionResults":
+            continue
+
+        open_sections -= 1
+        if open_sections:
+            # nested sections are yielded with the outermost one, in order
+            continue
+        for section in element.iter("SectionResults"):
+            if sections is None or (
+                section_key(section.findtext("SectionName") or "") in sections
+            ):
+                yield SECTION, section
+        element.clear()
+        if stack is None:
+            parent = element.getparent()
+        else:
+            parent = stack[-1] if stack else None
+        if parent is not None:
+            parent.remove(element)
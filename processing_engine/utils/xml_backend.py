@@ -0,0 +1,205 @@
+"""
+Pluggable XML parser backend.
+
+Uses lxml when it is installed and falls back to the standard library's
+ElementTree otherwise. Both backends build elements with the same
+ElementTree API (``find``, ``findall``, ``findtext``, ``iter``, ``text``),
+with comments and processing instructions dropped, so the parsers produce
+the same output on either. Only the wording of parse errors differs.
+
+Set ``CLEAR_XML_BACKEND`` to ``lxml`` or ``etree`` to force a backend
+(default ``auto``).
+"""
+
+import io
+import os
+import xml.etree.ElementTree as ET
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - lxml is optional
+    lxml_etree = None
+
+BACKENDS = ("auto", "lxml", "etree")
+
+# Exceptions raised for malformed XML by either backend
+ParseError: Tuple[type, ...] = (ET.ParseError,) + (
+    (lxml_etree.XMLSyntaxError,) if lxml_etree is not None else ()
+)
+
+
+class _StringReader:
+    """
+    File-like view of a string for ``ET.iterparse``.
+
+    ``io.StringIO`` copies the whole report into its own buffer (four bytes
+    per character for most reports); this hands out slices of the string
+    instead.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.position = 0
+
+    def read(self, size: int = -1) -> str:
+        """Return the next ``size`` characters (all remaining if negative)."""
+        end = len(self.text) if size < 0 else self.position + size
+        chunk = self.text[self.position : end]
+        self.position = end
+        return chunk
+
+
+class EtreeBackend:
+    """The standard library's ``xml.etree.ElementTree``."""
+
+    name = "etree"
+    # elements do not know their parent, callers track ancestors themselves
+    has_parents = False
+
+    def fromstring(self, xml_content: Union[str, bytes]) -> Any:
+        """Parse a document into its root element."""
+        return ET.fromstring(xml_content)
+
+    def iterparse(
+        self,
+        xml_content: Union[str, bytes],
+        events: Tuple[str, ...] = ("end",),
+        tags: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Parse a document incrementally, yielding ``(event, element)`` pairs.
+
+        ``tags`` is a hint: this backend reports events for every element.
+        """
+        del tags
+        source = (
+            io.BytesIO(xml_content)
+            if isinstance(xml_content, bytes)
+            else _StringReader(xml_content)
+        )
+        return ET.iterparse(source, events=events)
+
+
+class LxmlBackend:
+    """
+    ``lxml.etree``, with C-level XPath and tree building.
+
+    Strings are parsed as UTF-8 whatever their XML declaration says and
+    bytes are decoded as declared, like ElementTree does. ``huge_tree`` lifts
+    libxml2's limits on text size and depth for very large reports. Internal
+    entities are expanded like ElementTree does; external ones and network
+    access are refused.
+    """
+
+    name = "lxml"
+    has_parents = True
+
+    _options = {
+        "huge_tree": True,
+        "remove_comments": True,
+        "remove_pis": True,
+        "resolve_entities": "internal",
+        "no_network": True,
+    }
+
+    def __init__(self):
+        self.parsers = {
+            encoding: lxml_etree.XMLParser(encoding=encoding, **self._options)
+            for encoding in ("utf-8", None)
+        }
+
+    @staticmethod
+    def _encode(xml_content: Union[str, bytes]) -> Tuple[bytes, Optional[str]]:
+        """The document as bytes and the encoding to force, if any."""
+        if isinstance(xml_content, str):
+            return xml_content.encode("utf-8"), "utf-8"
+        return xml_content, None
+
+    def fromstring(self, xml_content: Union[str, bytes]) -> Any:
+        """Parse a document into its root element."""
+        data, encoding = self._encode(xml_content)
+        return lxml_etree.fromstring(data, self.parsers[encoding])
+
+    def iterparse(
+        self,
+        xml_content: Union[str, bytes],
+        events: Tuple[str, ...] = ("end",),
+        tags: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Parse a document incrementally, yielding ``(event, element)`` pairs.
+
+        Only elements named in ``tags`` are reported, if given.
+        """
+        data, encoding = self._encode(xml_content)
+        return lxml_etree.iterparse(
+            io.BytesIO(data),
+            events=events,
+            encoding=encoding,
+            tag=list(tags) if tags is not None else None,
+            **self._options,
+        )
+
+
+def iter_descendants(element: Any, tag: str) -> Iterator[Any]:
+    """
+    Descendants of ``element`` named ``tag``, in document order.
+
+    Same elements as ``element.iterfind(".//" + tag)``, but walked by the
+    backend's own tag iterator instead of the ElementPath engine, which
+    costs a compiled-path lookup and several generator layers per call.
+    """
+    descendants = element.iter(tag)
+    if element.tag == tag:
+        # iter() starts with the element itself, ".//" does not
+        next(descendants)
+    return descendants
+
+
+def find_descendant(element: Any, tag: str) -> Optional[Any]:
+    """First descendant named ``tag``, like ``element.find(".//" + tag)``."""
+    return next(iter_descendants(element, tag), None)
+
+
+def find_descendants(element: Any, tag: str) -> List[Any]:
+    """Descendants named ``tag``, like ``element.findall(".//" + tag)``."""
+    return list(iter_descendants(element, tag))
+
+
+def create_xml_backend(name: str = "auto"):
+    """
+    Create a backend by name.
+
+    Args:
+        name: ``lxml``, ``etree``, or ``auto`` for lxml when installed
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If ``lxml`` is requested but not installed
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown XML backend {name!r}, expected one of {BACKENDS}")
+    if name == "etree" or (name == "auto" and lxml_etree is None):
+        return EtreeBackend()
+    if lxml_etree is None:
+        raise ImportError("The lxml XML backend requires the lxml package")
+    return LxmlBackend()
+
+
+# Global backend instance
+_backend = None
+
+
+def get_xml_backend():
+    """Get the global XML backend, chosen from ``CLEAR_XML_BACKEND``."""
+    global _backend
+    if _backend is None:
+        _backend = create_xml_backend(os.getenv("CLEAR_XML_BACKEND", "auto").lower())
+    return _backend
+
+
+def set_xml_backend(backend) -> None:
+    """Set the global XML backend (a backend instance or its name)."""
+    global _backend
+    _backend = create_xml_backend(backend) if isinstance(backend, str) else backend
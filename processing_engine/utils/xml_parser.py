@@ -1,10 +1,24 @@
 """XML response parser for Thomson Reuters CLEAR API responses."""
 
 import xml.etree.ElementTree as ET
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Union
 
 from processing_engine.models.clear_models import ClearSearchResult, ClearReportResult
 
+from .keyword_classifier import get_keyword_classifiers
+from .report_stream import (
+    STATUS,
+    iter_report_elements,
+    parse_sections,
+    unevaluated_flags,
+)
+from .xml_backend import (
+    ParseError,
+    find_descendant,
+    find_descendants,
+    get_xml_backend,
+)
+
 
 class ClearXMLParser:
     """Parser for CLEAR API XML responses."""
@@ -13,10 +27,10 @@ class ClearXMLParser:
     def parse_business_search_response(xml_content: str) -> ClearSearchResult:
         """Parse business search response XML and extract GroupId."""
         try:
-            root = ET.fromstring(xml_content)
+            root = get_xml_backend().fromstring(xml_content)
 
             # Extract GroupId from search results
-            group_id_element = root.find(".//GroupId")
+            group_id_element = find_descendant(root, "GroupId")
             group_id = group_id_element.text if group_id_element is not None else None
 
             if not group_id:
@@ -26,6 +40,7 @@ class ClearXMLParser:
                     status_code=200,
                     success=False,
                     error="No GroupId found in search results",
+                    no_match=True,
                 )
 
             return ClearSearchResult(
@@ -35,7 +50,7 @@ class ClearXMLParser:
                 success=True,
             )
 
-        except ET.ParseError as e:
+        except ParseError as e:
             return ClearSearchResult(
                 group_id=None,
                 xml_response=xml_content,
@@ -51,11 +66,44 @@ class ClearXMLParser:
         return ClearXMLParser.parse_business_search_response(xml_content)
 
     @staticmethod
-    def parse_business_report_response(xml_content: str) -> ClearReportResult:
-        """Parse business report XML and convert to structured format."""
+    def parse_business_report_response(
+        xml_content: str, sections: Union[str, Iterable[str], None] = None
+    ) -> ClearReportResult:
+        """
+        Parse business report XML and convert to structured format.
+
+        The XML is read in a single streaming pass: each section is converted
+        and analysed as soon as it has been read, then dropped. With
+        ``sections``, only the listed sections are converted and analysed
+        (see ``api.parser.parse_business_report_xml``).
+        """
+        sections = parse_sections(sections)
+        status_fields = None
+        flags = {
+            "UCCFilings": "None",
+            "LiensAndJudgements": "None",
+            "CriminalHistory": "None",
+            "Lawsuits": "None",
+            "Dockets": "None",
+        }
+        analyses: Dict[str, Any] = {}
+        parsed_results = {}
+
         try:
-            root = ET.fromstring(xml_content)
-        except ET.ParseError as e:
+            for kind, element in iter_report_elements(xml_content, sections):
+                if kind == STATUS:
+                    status_fields = {
+                        "reference": ClearXMLParser._get_text(element, "Reference"),
+                        "report_type": ClearXMLParser._get_text(element, "ReportType"),
+                        "subject": ClearXMLParser._get_text(element, "ReportSubject"),
+                        "entity_id": ClearXMLParser._get_text(element, "EntityId"),
+                        "timestamp": ClearXMLParser._get_text(element, "TimeStamp"),
+                    }
+                else:
+                    flags = ClearXMLParser._add_section(
+                        element, parsed_results, flags, analyses
+                    )
+        except ParseError as e:
             return ClearReportResult(
                 xml_response=xml_content,
                 status_code=200,
@@ -63,9 +111,7 @@ class ClearXMLParser:
                 error=f"Invalid XML: {str(e)}",
             )
 
-        # Extract status information
-        status = root.find(".//Status")
-        if status is None:
+        if status_fields is None:
             return ClearReportResult(
                 xml_response=xml_content,
                 status_code=200,
@@ -73,81 +119,77 @@ class ClearXMLParser:
                 error="No Status section found in XML",
             )
 
+        for flag in unevaluated_flags(sections):
+            flags[flag] = None
         result = ClearReportResult(
-            reference=ClearXMLParser._get_text(status, "Reference"),
-            report_type=ClearXMLParser._get_text(status, "ReportType"),
-            subject=ClearXMLParser._get_text(status, "ReportSubject"),
-            entity_id=ClearXMLParser._get_text(status, "EntityId"),
-            timestamp=ClearXMLParser._get_text(status, "TimeStamp"),
-            flags={
-                "UCCFilings": "None",
-                "LiensAndJudgements": "None",
-                "CriminalHistory": "None",
-                "Lawsuits": "None",
-                "Dockets": "None",
-            },
+            **status_fields,
+            flags=flags,
             xml_response=xml_content,
             status_code=200,
             success=True,
         )
-
-        # Extract section results
-        parsed_results = {}
-        section_results = root.findall(".//SectionResults")
-
-        for section in section_results:
-            section_name = ClearXMLParser._get_text(section, "SectionName")
-            clean_section_name = section_name.replace("Section", "")
-
-            section_data = {
-                "Description": ClearXMLParser._get_text(
-                    section, "CLEARReportDescription"
-                ),
-                "Status": ClearXMLParser._get_text(section, "SectionStatus"),
-                "RecordCount": ClearXMLParser._get_text(section, "SectionRecordCount"),
-                "Details": ClearXMLParser._parse_section_details(section),
-            }
-            parsed_results[clean_section_name] = section_data
-
-            # Handle special sections for analysis
-            if section_name == "QuickAnalysisFlagSection":
-                extracted_flags = ClearXMLParser._extract_risk_flags(section)
-                result.flags = {**result.flags, **extracted_flags}
-            elif section_name == "UCCSection":
-                ucc_analysis = ClearXMLParser._analyze_ucc_filings(section)
-                result.ucc_analysis = ucc_analysis
-                result.flags["UCCFilings"] = ucc_analysis.get("risk_assessment", "None")
-            elif section_name == "LienJudgmentSection":
-                liens_analysis = ClearXMLParser._analyze_liens_and_judgments(section)
-                result.liens_analysis = liens_analysis
-                result.flags["LiensAndJudgements"] = liens_analysis.get(
-                    "risk_assessment", "None"
-                )
-            elif section_name == "CriminalSection":
-                criminal_analysis = ClearXMLParser._analyze_criminal_history(section)
-                result.criminal_analysis = criminal_analysis
-                result.flags["CriminalHistory"] = criminal_analysis.get(
-                    "risk_assessment", "None"
-                )
-            elif section_name == "LawsuitSection":
-                lawsuit_analysis = ClearXMLParser._analyze_lawsuits(section)
-                result.lawsuit_analysis = lawsuit_analysis
-                result.flags["Lawsuits"] = lawsuit_analysis.get(
-                    "risk_assessment", "None"
-                )
-            elif section_name == "DocketSection":
-                docket_analysis = ClearXMLParser._analyze_docket_records(section)
-                result.docket_analysis = docket_analysis
-                result.flags["Dockets"] = docket_analysis.get("risk_assessment", "None")
-
+        for field, analysis in analyses.items():
+            setattr(result, field, analysis)
         result.parsed_results = parsed_results
         return result
 
     @staticmethod
-    def parse_person_report_response(xml_content: str) -> ClearReportResult:
+    def _add_section(
+        section: ET.Element,
+        parsed_results: Dict[str, Any],
+        flags: Dict[str, str],
+        analyses: Dict[str, Any],
+    ) -> Dict[str, str]:
+        """
+        Convert one SectionResults element and run its analysis, if any.
+
+        Returns:
+            Dict: The updated flags
+        """
+        section_name = ClearXMLParser._get_text(section, "SectionName")
+        clean_section_name = section_name.replace("Section", "")
+
+        section_data = {
+            "Description": ClearXMLParser._get_text(section, "CLEARReportDescription"),
+            "Status": ClearXMLParser._get_text(section, "SectionStatus"),
+            "RecordCount": ClearXMLParser._get_text(section, "SectionRecordCount"),
+            "Details": ClearXMLParser._parse_section_details(section),
+        }
+        parsed_results[clean_section_name] = section_data
+
+        # Handle special sections for analysis
+        if section_name == "QuickAnalysisFlagSection":
+            extracted_flags = ClearXMLParser._extract_risk_flags(section)
+            flags = {**flags, **extracted_flags}
+        elif section_name == "UCCSection":
+            ucc_analysis = ClearXMLParser._analyze_ucc_filings(section)
+            analyses["ucc_analysis"] = ucc_analysis
+            flags["UCCFilings"] = ucc_analysis.get("risk_assessment", "None")
+        elif section_name == "LienJudgmentSection":
+            liens_analysis = ClearXMLParser._analyze_liens_and_judgments(section)
+            analyses["liens_analysis"] = liens_analysis
+            flags["LiensAndJudgements"] = liens_analysis.get("risk_assessment", "None")
+        elif section_name == "CriminalSection":
+            criminal_analysis = ClearXMLParser._analyze_criminal_history(section)
+            analyses["criminal_analysis"] = criminal_analysis
+            flags["CriminalHistory"] = criminal_analysis.get("risk_assessment", "None")
+        elif section_name == "LawsuitSection":
+            lawsuit_analysis = ClearXMLParser._analyze_lawsuits(section)
+            analyses["lawsuit_analysis"] = lawsuit_analysis
+            flags["Lawsuits"] = lawsuit_analysis.get("risk_assessment", "None")
+        elif section_name == "DocketSection":
+            docket_analysis = ClearXMLParser._analyze_docket_records(section)
+            analyses["docket_analysis"] = docket_analysis
+            flags["Dockets"] = docket_analysis.get("risk_assessment", "None")
+        return flags
+
+    @staticmethod
+    def parse_person_report_response(
+        xml_content: str, sections: Union[str, Iterable[str], None] = None
+    ) -> ClearReportResult:
         """Parse person report XML and convert to structured format."""
         # Similar logic to business report with person-specific sections
-        return ClearXMLParser.parse_business_report_response(xml_content)
+        return ClearXMLParser.parse_business_report_response(xml_content, sections)
 
     @staticmethod
     def _get_text(element: ET.Element, tag: str) -> str:
@@ -158,7 +200,7 @@ class ClearXMLParser:
     @staticmethod
     def _parse_section_details(section: ET.Element) -> Dict[str, Any]:
         """Parse the SectionDetails content."""
-        section_details = section.find(".//SectionDetails")
+        section_details = find_descendant(section, "SectionDetails")
         if section_details is None:
             return {}
 
@@ -214,7 +256,7 @@ class ClearXMLParser:
         flags = {}
 
         # Find the RiskFlagsWithDocguids element
-        risk_flags = section.find(".//RiskFlagsWithDocguids")
+        risk_flags = find_descendant(section, "RiskFlagsWithDocguids")
         if risk_flags is None:
             return flags
 
@@ -234,7 +276,7 @@ class ClearXMLParser:
     @staticmethod
     def _analyze_ucc_filings(section: ET.Element) -> Dict[str, Any]:
         """Analyze UCC filings to determine active vs inactive status."""
-        ucc_records = section.findall(".//UCCRecord")
+        ucc_records = find_descendants(section, "UCCRecord")
         if not ucc_records:
             return {
                 "active_count": 0,
@@ -248,7 +290,7 @@ class ClearXMLParser:
         inactive_count = 0
 
         for record in ucc_records:
-            filing_info = record.find(".//UCCFilingInfo")
+            filing_info = find_descendant(record, "UCCFilingInfo")
             if filing_info is not None:
                 filing_type = ClearXMLParser._get_text(filing_info, "FilingType")
                 if filing_type == "TERMINATION":
@@ -275,7 +317,7 @@ class ClearXMLParser:
     @staticmethod
     def _analyze_liens_and_judgments(section: ET.Element) -> Dict[str, Any]:
         """Analyze liens and judgments for risk assessment."""
-        lien_records = section.findall(".//LienJudgeRecord")
+        lien_records = find_descendants(section, "LienJudgeRecord")
         if not lien_records:
             return {"total_count": 0, "risk_assessment": "None"}
 
@@ -284,14 +326,14 @@ class ClearXMLParser:
         total_amount = 0
 
         for record in lien_records:
-            filing_info = record.find(".//FilingInfo")
+            filing_info = find_descendant(record, "FilingInfo")
             if filing_info is not None:
                 release_date = ClearXMLParser._get_text(filing_info, "ReleaseDate")
                 if not release_date.strip():
                     active_liens += 1
 
                 # Try to extract amount
-                debtor_info = record.find(".//Debtor")
+                debtor_info = find_descendant(record, "Debtor")
                 if debtor_info is not None:
                     owed_amount = ClearXMLParser._get_text(
                         debtor_info, "DebtorOwedAmount"
@@ -324,7 +366,7 @@ class ClearXMLParser:
     @staticmethod
     def _analyze_criminal_history(section: ET.Element) -> Dict[str, Any]:
         """Analyze criminal records for risk assessment."""
-        criminal_records = section.findall(".//CriminalExpansionRecord")
+        criminal_records = find_descendants(section, "CriminalExpansionRecord")
         if not criminal_records:
             return {"total_count": 0, "risk_assessment": "None"}
 
@@ -333,27 +375,23 @@ class ClearXMLParser:
         financial_crimes = 0
         felony_charges = 0
 
+        # the processor's rules are narrower than api.parser's criminal_offense
+        classifiers = get_keyword_classifiers()
+        classify_offense = classifiers["processor_criminal_offense"].classify
+
         for record in criminal_records:
-            offender_infos = record.findall(".//OffenderInfo")
+            offender_infos = find_descendants(record, "OffenderInfo")
             for offender_info in offender_infos:
-                criminal_offense = ClearXMLParser._get_text(
-                    offender_info, "CriminalOffense"
-                ).upper()
+                categories = classify_offense(
+                    ClearXMLParser._get_text(offender_info, "CriminalOffense")
+                )
 
                 # Categorize crimes
-                if any(
-                    violent in criminal_offense
-                    for violent in ["ASSAULT", "BATTERY", "MURDER", "ROBBERY"]
-                ):
+                if "violent" in categories:
                     violent_crimes += 1
-                if any(
-                    financial in criminal_offense
-                    for financial in ["FRAUD", "THEFT", "EMBEZZLEMENT"]
-                ):
+                if "financial" in categories:
                     financial_crimes += 1
-                if any(
-                    felony in criminal_offense for felony in ["FELONY", "AGGRAVATED"]
-                ):
+                if "felony" in categories:
                     felony_charges += 1
 
         # Risk assessment
@@ -401,7 +439,7 @@ class ClearXMLParser:
     @staticmethod
     def _analyze_docket_records(section: ET.Element) -> Dict[str, Any]:
         """Analyze docket records for risk assessment."""
-        docket_records = section.findall(".//CompanyDocketRecord")
+        docket_records = find_descendants(section, "CompanyDocketRecord")
         if not docket_records:
             return {"total_count": 0, "risk_assessment": "None"}
 
@@ -409,7 +447,7 @@ class ClearXMLParser:
         federal_count = 0
 
         for record in docket_records:
-            docket_info = record.find(".//DocketInfo")
+            docket_info = find_descendant(record, "DocketInfo")
             if docket_info is not None:
                 source = ClearXMLParser._get_text(docket_info, "Source")
                 if source == "Federal Docket Record":
@@ -0,0 +1,3 @@
+"""
+Tests for the Clear API adapter package.
+"""
@@ -0,0 +1,166 @@
+"""
+Tests for JSONL batch parsing and execution.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from api.batch import iter_batch, parse_jsonl, run_batch
+from models import BusinessSearchRequest
+
+
+def business_line(name: str) -> bytes:
+    """JSONL row of a business search by name."""
+    return b'{"business": {"business_name": "%s"}}' % name.encode()
+
+
+class TestParseJsonl:
+    """Test reading one request body per line."""
+
+    def test_valid_invalid_and_blank_lines(self):
+        """Valid rows are parsed, invalid rows kept as errors, blanks skipped."""
+        body = b"\n".join(
+            [business_line("Acme"), b"", b"{not json", b'{"business": 5}']
+        )
+        rows = parse_jsonl(body, BusinessSearchRequest)
+
+        assert [row["line"] for row in rows] == [1, 3, 4]
+        assert rows[0]["request"].business.business_name == "Acme"
+        assert "error" in rows[1] and "error" in rows[2]
+
+
+class TestRunBatch:
+    """Test deduplication, ordering and the concurrency cap."""
+
+    def run(self, rows, call, concurrency=2):
+        return asyncio.run(
+            run_batch(
+                rows,
+                lambda request: request.business.business_name.lower(),
+                call,
+                concurrency,
+            )
+        )
+
+    def test_results_in_input_order_with_duplicates_run_once(self):
+        """Each distinct key is called once and rows keep their order."""
+        body = b"\n".join(
+            business_line(name) for name in ["Slow", "Fast", "slow", "Other"]
+        )
+        rows = parse_jsonl(body, BusinessSearchRequest)
+        calls = []
+
+        async def call(request):
+            name = request.business.business_name
+            calls.append(name)
+            await asyncio.sleep(0.05 if name == "Slow" else 0)
+            return {"name": name}
+
+        results = self.run(rows, call, concurrency=4)
+
+        assert sorted(calls) == ["Fast", "Other", "Slow"]
+        assert [row["line"] for row in results] == [1, 2, 3, 4]
+        assert [row["result"] for row in results] == [
+            {"name": "Slow"},
+            {"name": "Fast"},
+            {"name": "Slow"},
+            {"name": "Other"},
+        ]
+        assert results[2]["duplicate_of"] == 1
+
+    def test_concurrency_is_capped(self):
+        """No more than ``concurrency`` calls run at once."""
+        rows = parse_jsonl(
+            b"\n".join(business_line(f"B{i}") for i in range(10)),
+            BusinessSearchRequest,
+        )
+        running = []
+        peak = []
+
+        async def call(request):
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return {}
+
+        self.run(rows, call, concurrency=3)
+        assert max(peak) == 3
+
+    def test_failures_only_affect_their_rows(self):
+        """A call that raises is reported on its rows, others still succeed."""
+        rows = parse_jsonl(
+            b"\n".join([business_line("Bad"), b"{}", business_line("Good")]),
+            BusinessSearchRequest,
+        )
+
+        async def call(request):
+            if request.business.business_name == "Bad":
+                raise RuntimeError("upstream down")
+            return {"ok": True}
+
+        results = self.run(rows, call)
+
+        assert results[0]["error"] == "upstream down"
+        assert results[0]["error_type"] == "RuntimeError"
+        assert "error" in results[1] and "key" not in results[1]
+        assert results[2]["result"] == {"ok": True}
+
+
+class TestIterBatch:
+    """Test yielding rows as their calls complete."""
+
+    def test_rows_arrive_in_completion_order(self):
+        """Fast rows are yielded before slow ones, duplicates with their call."""
+        body = b"\n".join(
+            [business_line("Slow"), business_line("Fast"), b"{}", business_line("slow")]
+        )
+        rows = parse_jsonl(body, BusinessSearchRequest)
+
+        async def call(request):
+            name = request.business.business_name
+            await asyncio.sleep(0.05 if name == "Slow" else 0)
+            return name
+
+        async def collect():
+            return [
+                row
+                async for row in iter_batch(
+                    rows, lambda r: r.business.business_name.lower(), call, 4
+                )
+            ]
+
+        results = asyncio.run(collect())
+        assert [row["line"] for row in results] == [3, 2, 1, 4]
+        assert results[-1]["result"] == "Slow"
+
+    def test_stopping_early_cancels_pending_calls(self):
+        """Calls still running when the consumer stops are cancelled."""
+        rows = parse_jsonl(
+            b"\n".join([business_line("Fast"), business_line("Slow")]),
+            BusinessSearchRequest,
+        )
+        cancelled = []
+
+        async def call(request):
+            if request.business.business_name == "Slow":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(1)
+                    raise
+            return {}
+
+        async def first():
+            batch = iter_batch(rows, lambda r: r.business.business_name, call, 2)
+            row = await batch.__anext__()
+            await batch.aclose()
+            await asyncio.sleep(0)
+            return row
+
+        assert asyncio.run(first())["line"] == 1
+        assert cancelled == [1]
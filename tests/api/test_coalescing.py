@@ -0,0 +1,103 @@
+"""
+Tests for in-flight request coalescing.
+"""
+
+import asyncio
+import sys
+import os
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from api.coalescing import RequestCoalescer
+
+
+class TestRequestCoalescer:
+    """Test sharing of in-flight calls."""
+
+    def test_concurrent_identical_calls_share_one_run(self):
+        """Callers arriving while a call runs get the same result."""
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def search():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"result": len(calls)}
+
+        async def run():
+            return await asyncio.gather(
+                *(coalescer.run("key", search) for _ in range(5))
+            )
+
+        results = asyncio.run(run())
+        assert len(calls) == 1
+        assert results == [{"result": 1}] * 5
+        assert coalescer.get_stats() == {"in_flight": 0, "started": 1, "coalesced": 4}
+
+    def test_is_running_tracks_in_flight_keys(self):
+        """A key is running only while its shared call is in flight."""
+        coalescer = RequestCoalescer()
+
+        async def run():
+            task = asyncio.ensure_future(
+                coalescer.run("key", lambda: asyncio.sleep(0.01))
+            )
+            await asyncio.sleep(0)
+            running = coalescer.is_running("key")
+            await task
+            return running, coalescer.is_running("key")
+
+        assert asyncio.run(run()) == (True, False)
+
+    def test_finished_calls_are_not_reused(self):
+        """Once a call has finished the next caller starts a new one."""
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def search():
+            calls.append(1)
+            return len(calls)
+
+        async def run():
+            return [await coalescer.run("key", search) for _ in range(2)]
+
+        assert asyncio.run(run()) == [1, 2]
+
+    def test_failures_reach_every_waiter(self):
+        """An exception in the shared call is raised to each caller."""
+        coalescer = RequestCoalescer()
+
+        async def search():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream failed")
+
+        async def run():
+            return await asyncio.gather(
+                *(coalescer.run("key", search) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_cancelled_caller_does_not_cancel_the_others(self):
+        """A disconnecting client leaves the shared call running."""
+        coalescer = RequestCoalescer()
+
+        async def search():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def run():
+            first = asyncio.ensure_future(coalescer.run("key", search))
+            second = asyncio.ensure_future(coalescer.run("key", search))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(run()) == "done"
@@ -0,0 +1,219 @@
+"""
+Tests for the durable job queue and its worker pool.
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+from diskcache import Cache
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from api.jobs import (
+    FAILED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    JobQueue,
+    JobWorkerPool,
+    watch_job,
+)
+
+
+class TestJobQueue:
+    """Test job records, claiming and recovery."""
+
+    def test_jobs_are_claimed_in_order(self, tmp_path):
+        """Claims return queued jobs first in, first out, and mark them running."""
+        queue = JobQueue(Cache(str(tmp_path)))
+        first = queue.submit({"n": 1})
+        second = queue.submit({"n": 2})
+
+        claimed = queue.claim()
+        assert claimed["id"] == first["id"]
+        assert claimed["status"] == RUNNING and claimed["attempts"] == 1
+        assert queue.claim()["id"] == second["id"]
+        assert queue.claim() is None
+
+    def test_jobs_survive_reopening_the_store(self, tmp_path):
+        """Queued jobs are still there for a new process."""
+        job = JobQueue(Cache(str(tmp_path))).submit({"n": 1}, account_id="acct")
+
+        reopened = JobQueue(Cache(str(tmp_path)))
+        assert reopened.get(job["id"])["status"] == QUEUED
+        claimed = reopened.claim()
+        assert claimed["id"] == job["id"] and claimed["account_id"] == "acct"
+
+    def test_finish_records_result_or_error(self, tmp_path):
+        """Finished jobs are succeeded with a result or failed with an error."""
+        queue = JobQueue(Cache(str(tmp_path)))
+        ok = queue.submit({})
+        bad = queue.submit({})
+
+        queue.finish(ok["id"], {"report": 1})
+        queue.finish(bad["id"], error="boom")
+
+        assert queue.get(ok["id"])["status"] == SUCCEEDED
+        assert queue.get(ok["id"])["result"] == {"report": 1}
+        assert queue.get(bad["id"])["status"] == FAILED
+        assert queue.get(bad["id"])["error"] == "boom"
+
+    def test_expired_leases_are_requeued_then_failed(self, tmp_path):
+        """Interrupted jobs run again until they reach max_attempts."""
+        queue = JobQueue(Cache(str(tmp_path)), lease=0.01, max_attempts=2)
+        job = queue.submit({})
+
+        queue.claim()
+        time.sleep(0.02)
+        assert queue.recover() == 1
+        assert queue.get(job["id"])["status"] == QUEUED
+
+        assert queue.claim()["attempts"] == 2
+        time.sleep(0.02)
+        assert queue.recover() == 1
+        assert queue.get(job["id"])["status"] == FAILED
+        assert queue.claim() is None
+
+    def test_live_leases_are_left_alone(self, tmp_path):
+        """Running jobs with a valid lease are not recovered."""
+        queue = JobQueue(Cache(str(tmp_path)), lease=60)
+        queue.submit({})
+        queue.claim()
+        assert queue.recover() == 0
+
+    def test_stats_follow_every_change(self, tmp_path):
+        """Queued and running counts are kept without scanning the records."""
+        queue = JobQueue(Cache(str(tmp_path)), lease=0.01, max_attempts=1)
+        queue.cache.iterkeys = None  # any scan of the store fails
+        first, second, third = (queue.submit({}) for _ in range(3))
+
+        assert queue.get_stats() == {"queued": 3, "running": 0}
+        queue.claim()
+        queue.claim()
+        assert queue.get_stats() == {"queued": 1, "running": 2}
+        queue.finish(first["id"], {"report": 1})
+        queue.finish(third["id"], error="cancelled")
+        assert queue.get_stats() == {"queued": 0, "running": 1}
+        time.sleep(0.02)
+        assert queue.recover() == 1
+        assert queue.get(second["id"])["status"] == FAILED
+        assert queue.get_stats() == {"queued": 0, "running": 0}
+
+    def test_status_leaves_out_the_result(self, tmp_path):
+        """The polled status copy follows the record without its result."""
+        queue = JobQueue(Cache(str(tmp_path)))
+        job = queue.submit({"n": 1})
+        queue.claim()
+        queue.finish(job["id"], {"report": "x" * 1000})
+
+        status = queue.get_status(job["id"])
+        assert status["status"] == SUCCEEDED and "result" not in status
+        assert status == {
+            key: value for key, value in queue.get(job["id"]).items() if key != "result"
+        }
+
+
+class TestJobWorkerPool:
+    """Test running jobs with asyncio workers."""
+
+    def test_workers_run_jobs_and_record_outcomes(self, tmp_path):
+        """Results and exception messages end up on the job records."""
+        queue = JobQueue(Cache(str(tmp_path)))
+
+        async def handler(job):
+            if job["request"]["fail"]:
+                raise RuntimeError("upstream down")
+            return {"ok": job["request"]["n"]}
+
+        async def run():
+            pool = JobWorkerPool(queue, handler, workers=2, poll_interval=0.01)
+            await pool.start()
+            ok = queue.submit({"n": 1, "fail": False})
+            bad = queue.submit({"n": 2, "fail": True})
+            pool.notify()
+            updates = [job async for job in watch_job(queue, ok["id"], 5, 0.01)]
+            async for _ in watch_job(queue, bad["id"], 5, 0.01):
+                pass
+            await pool.stop()
+            return updates, queue.get(bad["id"]), pool.get_stats()
+
+        updates, bad, stats = asyncio.run(run())
+        assert updates[-1]["status"] == SUCCEEDED
+        assert updates[-1]["result"] == {"ok": 1}
+        assert bad["status"] == FAILED and bad["error"] == "upstream down"
+        assert stats["succeeded"] == 1 and stats["failed"] == 1
+
+    def test_stopping_requeues_running_jobs(self, tmp_path):
+        """Jobs cut off by shutdown go back on the queue."""
+        queue = JobQueue(Cache(str(tmp_path)))
+        started = []
+
+        async def handler(job):
+            started.append(job["id"])
+            await asyncio.sleep(10)
+
+        async def run():
+            pool = JobWorkerPool(queue, handler, workers=1, poll_interval=0.01)
+            job = queue.submit({})
+            await pool.start()
+            while not started:
+                await asyncio.sleep(0.01)
+            await pool.stop()
+            return job
+
+        job = asyncio.run(run())
+        assert queue.get(job["id"])["status"] == QUEUED
+        assert queue.claim()["id"] == job["id"]
+
+
+class TestWatchJob:
+    """Test following a job's status."""
+
+    def test_unknown_job_yields_nothing(self, tmp_path):
+        """Watching a missing job ends at once."""
+        queue = JobQueue(Cache(str(tmp_path)))
+
+        async def collect():
+            return [job async for job in watch_job(queue, "missing", 1)]
+
+        assert asyncio.run(collect()) == []
+
+    def test_timeout_returns_current_state(self, tmp_path):
+        """A job that does not finish is reported once until the timeout."""
+        queue = JobQueue(Cache(str(tmp_path)))
+        job = queue.submit({})
+
+        async def collect():
+            return [update async for update in watch_job(queue, job["id"], 0.05, 0.01)]
+
+        assert [update["status"] for update in asyncio.run(collect())] == [QUEUED]
+
+    def test_full_record_is_read_once_finished(self, tmp_path):
+        """Polls read the small status copy; the result is read once."""
+        queue = JobQueue(Cache(str(tmp_path)))
+        job = queue.submit({})
+        full_reads = []
+        get = queue.get
+        queue.get = lambda job_id: full_reads.append(job_id) or get(job_id)
+
+        async def collect():
+            async def finish_later():
+                await asyncio.sleep(0.02)
+                queue.claim()
+                await asyncio.sleep(0.02)
+                queue.finish(job["id"], {"report": 1})
+
+            finishing = asyncio.ensure_future(finish_later())
+            updates = [u async for u in watch_job(queue, job["id"], 5, 0.005)]
+            await finishing
+            return updates
+
+        updates = asyncio.run(collect())
+
+        assert [u["status"] for u in updates] == [QUEUED, RUNNING, SUCCEEDED]
+        assert [u["result"] for u in updates] == [None, None, {"report": 1}]
+        # claim and finish read the record too; the watcher read it once
+        assert len(full_reads) == 3
@@ -0,0 +1,91 @@
+"""
+Tests for converting CLEAR report XML to JSON.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from api.parser import parse_person_report_xml
+
+PERSON_REPORT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<ns2:PersonReportDetails xmlns:ns2="http://clear.thomsonreuters.com/api/report/2.0"
+    xmlns:ns3="com/thomsonreuters/schemas/person-report">
+  <Status>
+    <StatusCode>200</StatusCode>
+    <Reference>S2S Person Report</Reference>
+    <ReportType>Person Report</ReportType>
+    <ReportSubject>DOE, JANE</ReportSubject>
+    <EntityId>P1__RG9lSmFuZQ</EntityId>
+    <TimeStamp>05/12/2025 08:57:24</TimeStamp>
+  </Status>
+  <SectionResults>
+    <SectionName>CriminalSection</SectionName>
+    <CLEARReportDescription>Criminal Records</CLEARReportDescription>
+    <SectionStatus>COMPLETE</SectionStatus>
+    <SectionRecordCount>1</SectionRecordCount>
+    <SectionDetails>
+      <ns3:CriminalSection>
+        <CriminalExpansionRecord>
+          <DefendantInfo>
+            <PersonInfo>
+              <PersonName><FullName>DOE, JANE</FullName></PersonName>
+            </PersonInfo>
+          </DefendantInfo>
+          <OffenderInfo>
+            <CriminalOffense>AGGRAVATED ASSAULT</CriminalOffense>
+            <CrimeDate>03/02/2019</CrimeDate>
+            <CaseDispositionDecisionCategoryText>CONVICTED</CaseDispositionDecisionCategoryText>
+            <DocketNumber>CR-19-0042</DocketNumber>
+          </OffenderInfo>
+        </CriminalExpansionRecord>
+      </ns3:CriminalSection>
+    </SectionDetails>
+  </SectionResults>
+</ns2:PersonReportDetails>
+"""
+
+
+class TestParsePersonReport:
+    """Test person reports, which share the business report layout."""
+
+    def test_status_and_sections(self):
+        """The subject and each section are read as for business reports."""
+        report = parse_person_report_xml(PERSON_REPORT)
+
+        assert report["Type"] == "Person Report"
+        assert report["Subject"] == "DOE, JANE"
+        assert report["ID"] == "P1__RG9lSmFuZQ"
+        assert report["Results"]["Criminal"]["RecordCount"] == "1"
+
+    def test_criminal_history_is_analysed(self):
+        """The person's offenses are classified and flagged."""
+        report = parse_person_report_xml(PERSON_REPORT)
+
+        analysis = report["CriminalHistoryAnalysis"]
+        assert report["Flags"]["CriminalHistory"] == "High"
+        assert analysis["total_criminal_records"] == 1
+        assert analysis["unique_individuals"] == 1
+        assert analysis["violent_crimes"] == analysis["felony_charges"] == 1
+        assert analysis["financial_crimes"] == 0
+        (record,) = analysis["criminal_records"]
+        assert record["defendant_name"] == "DOE, JANE"
+        assert record["is_recent"] and not record["is_active"]
+
+    def test_sections_limit_the_report(self):
+        """Sections outside the allow-list are skipped and their flags unknown."""
+        report = parse_person_report_xml(PERSON_REPORT, "UCC")
+
+        assert report["Results"] == {}
+        assert report["Flags"]["CriminalHistory"] is None
+        assert report["ID"] == "P1__RG9lSmFuZQ"
+
+    def test_missing_status_is_an_error(self):
+        """A report without a Status section is rejected."""
+        report = parse_person_report_xml(
+            "<PersonReportDetails><SectionResults/></PersonReportDetails>"
+        )
+
+        assert report == {"error": "No Status section found in XML"}
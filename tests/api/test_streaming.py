@@ -0,0 +1,62 @@
+"""
+Tests for NDJSON streaming helpers.
+"""
+
+import asyncio
+import json
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from api.streaming import ndjson_line, ndjson_stream, report_parts
+
+
+class TestNdjson:
+    """Test NDJSON encoding."""
+
+    def test_one_compact_line_per_item(self):
+        """Each item is one line of JSON ending in a newline."""
+        assert ndjson_line({"a": [1, 2]}) == b'{"a":[1,2]}\n'
+
+    def test_stream_encodes_items_as_produced(self):
+        """Items from an async iterable are encoded one by one."""
+
+        async def items():
+            yield {"line": 1}
+            yield {"line": 2}
+
+        async def collect():
+            return [chunk async for chunk in ndjson_stream(items())]
+
+        assert asyncio.run(collect()) == [b'{"line":1}\n', b'{"line":2}\n']
+
+
+class TestReportParts:
+    """Test splitting a parsed report into parts."""
+
+    def test_header_then_one_part_per_section(self):
+        """The report can be rebuilt from its parts."""
+        report = {
+            "Reference": "ref",
+            "Flags": {"Lawsuits": "None"},
+            "Results": {"Lawsuit": {"RecordCount": "2"}, "UCC": {"RecordCount": "0"}},
+        }
+        parts = [json.loads(ndjson_line(part)) for part in report_parts(report)]
+
+        assert parts[0] == {
+            "part": "header",
+            "data": {"Reference": "ref", "Flags": {"Lawsuits": "None"}},
+        }
+        assert [part["name"] for part in parts[1:]] == ["Lawsuit", "UCC"]
+        rebuilt = parts[0]["data"] | {
+            "Results": {part["name"]: part["data"] for part in parts[1:]}
+        }
+        assert rebuilt == report
+
+    def test_error_body_is_a_single_header(self):
+        """Results without sections are sent as one part."""
+        assert list(report_parts({"error": "No matches"})) == [
+            {"part": "header", "data": {"error": "No matches"}}
+        ]
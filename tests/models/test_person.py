@@ -0,0 +1,85 @@
+"""
+Tests for the person request models.
+"""
+
+import sys
+import os
+
+import pytest
+from pydantic import ValidationError
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from models.business import BusinessWithPrincipalsRequest
+from models.person import PersonCriteria, PersonSearchRequest
+
+
+class TestPersonSearchRequest:
+    """Test person search defaults and validation."""
+
+    def test_defaults(self):
+        """Only the name is required; the rest defaults to blank."""
+        request = PersonSearchRequest.model_validate(
+            {"person": {"first_name": "Jane", "last_name": "Doe"}}
+        )
+
+        assert request.reference == "S2S Person Search"
+        assert request.address is None
+        assert request.person.ssn == "" and request.person.middle_initial == ""
+        assert request.permissible_purpose.model_dump() == {
+            "glb": "I",
+            "dppa": 3,
+            "voter": 7,
+        }
+
+    def test_name_is_required(self):
+        """A person without a last name is rejected."""
+        with pytest.raises(ValidationError):
+            PersonCriteria.model_validate({"first_name": "Jane"})
+
+    def test_permissible_purpose_codes_are_checked(self):
+        """Codes outside the allowed GLB values are rejected."""
+        with pytest.raises(ValidationError):
+            PersonSearchRequest.model_validate(
+                {
+                    "person": {"first_name": "Jane", "last_name": "Doe"},
+                    "permissible_purpose": {"glb": "Z"},
+                }
+            )
+
+
+class TestBusinessWithPrincipalsRequest:
+    """Test the business-and-principals request."""
+
+    def test_principals_default_to_empty(self):
+        """Principals are optional; the business principal is kept apart."""
+        request = BusinessWithPrincipalsRequest.model_validate(
+            {
+                "business": {
+                    "business_name": "Thomson Reuters",
+                    "principal": {"first_name": "Jane", "last_name": "Doe"},
+                }
+            }
+        )
+
+        assert request.principals == []
+        assert request.business.principal.last_name == "Doe"
+
+    def test_principals_are_person_searches(self):
+        """Each principal is a full person search request."""
+        request = BusinessWithPrincipalsRequest.model_validate(
+            {
+                "business": {"business_name": "Thomson Reuters"},
+                "principals": [
+                    {
+                        "person": {"first_name": "Jane", "last_name": "Doe"},
+                        "address": {"city": "Eagan", "state": "MN"},
+                    }
+                ],
+            }
+        )
+
+        (principal,) = request.principals
+        assert isinstance(principal, PersonSearchRequest)
+        assert principal.address.city == "Eagan"
@@ -0,0 +1,35 @@
+"""
+Tests for canonical request keys.
+"""
+
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.cache.keys import request_fingerprint
+
+
+class TestRequestFingerprint:
+    """Test the canonical request hash."""
+
+    def test_cosmetic_differences_hash_the_same(self):
+        """Case, whitespace, key order and empty fields do not matter."""
+        first = {
+            "reference": "underwriter A",
+            "business": {"business_name": "Acme  Corp ", "fein": "", "address": None},
+        }
+        second = {
+            "business": {"fein": "", "business_name": "ACME corp"},
+            "reference": "underwriter B",
+        }
+        assert request_fingerprint(first, ignore=("reference",)) == (
+            request_fingerprint(second, ignore=("reference",))
+        )
+
+    def test_different_searches_hash_differently(self):
+        """A different search criterion gives a different fingerprint."""
+        first = {"business": {"business_name": "Acme", "fein": "123"}}
+        second = {"business": {"business_name": "Acme", "fein": "124"}}
+        assert request_fingerprint(first) != request_fingerprint(second)
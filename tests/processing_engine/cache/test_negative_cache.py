@@ -0,0 +1,74 @@
+"""
+Tests for the negative search result cache.
+"""
+
+import sys
+import os
+import time
+
+from diskcache import Cache
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.cache.negative_cache import (
+    INVALID_REQUEST,
+    NO_MATCH,
+    NegativeCache,
+)
+
+
+class TestNegativeCache:
+    """Test storage, expiry and counters of negative outcomes."""
+
+    def test_put_then_get(self, tmp_path):
+        """A stored outcome returns the stored result."""
+        cache = NegativeCache(Cache(str(tmp_path)), ttl=60)
+        assert cache.get("search_req:abc") is None
+
+        cache.put("search_req:abc", NO_MATCH, {"error": "No matches found"})
+        assert cache.get("search_req:abc") == {"error": "No matches found"}
+
+    def test_namespace_is_separate_from_positive_entries(self, tmp_path):
+        """Negative entries do not overwrite positive ones under the same key."""
+        disk = Cache(str(tmp_path))
+        disk.set("search_req:abc", {"report": 1})
+        cache = NegativeCache(disk, ttl=60)
+
+        cache.put("search_req:abc", NO_MATCH, {"error": "No matches found"})
+        assert disk.get("search_req:abc") == {"report": 1}
+
+    def test_entries_expire_after_ttl(self, tmp_path):
+        """Outcomes are forgotten after the TTL."""
+        cache = NegativeCache(Cache(str(tmp_path)), ttl=0.05)
+        cache.put("key", NO_MATCH, {"error": "No matches found"})
+
+        time.sleep(0.1)
+        assert cache.get("key") is None
+
+    def test_delete(self, tmp_path):
+        """Deleted outcomes are misses."""
+        cache = NegativeCache(Cache(str(tmp_path)), ttl=60)
+        cache.put("key", INVALID_REQUEST, {"error": "Bad request"})
+
+        assert cache.delete("key") is True
+        assert cache.get("key") is None
+        assert cache.delete("key") is False
+
+    def test_stats_are_kept_per_outcome(self, tmp_path):
+        """Hits and stores are counted separately for each outcome."""
+        cache = NegativeCache(Cache(str(tmp_path)), ttl=60)
+        cache.put("a", NO_MATCH, {})
+        cache.put("b", INVALID_REQUEST, {})
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.get("missing")
+
+        assert cache.get_stats() == {
+            "ttl": 60,
+            "outcomes": {
+                NO_MATCH: {"hits": 2, "stored": 1},
+                INVALID_REQUEST: {"hits": 1, "stored": 1},
+            },
+        }
@@ -0,0 +1,154 @@
+"""
+Tests for the CLEAR report cache.
+"""
+
+import sys
+import os
+import time
+
+import pytest
+from diskcache import Cache
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.cache.tiered_cache import TieredCache
+from processing_engine.cache.report_cache import (
+    ReportCache,
+    report_entity_id,
+    view_name,
+)
+
+REPORT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<BusinessReportDetails>
+  <Status>
+    <Reference>S2S Business Report</Reference>
+    <EntityId>C1__ENTITY</EntityId>
+  </Status>
+  <ReportId>report-1</ReportId>
+</BusinessReportDetails>"""
+
+
+@pytest.fixture(name="report_cache")
+def fixture_report_cache(tmp_path):
+    """Report cache with a one hour default window and two account overrides."""
+    return ReportCache(
+        Cache(str(tmp_path)),
+        max_age=3600,
+        account_max_age={"strict": 0.05, "relaxed": 7200},
+    )
+
+
+class TestReportCache:
+    """Test lookups by GroupId and EntityId."""
+
+    def test_entity_id_is_read_from_status(self):
+        """The report's own EntityId comes from its Status section."""
+        assert report_entity_id(REPORT_XML) == "C1__ENTITY"
+        assert report_entity_id("not xml") is None
+
+    def test_put_then_get_by_group_and_entity(self, report_cache):
+        """A stored view is found by GroupId and through the EntityId index."""
+        info = report_cache.put("group-1", REPORT_XML, "api", {"ID": "C1__ENTITY"})
+
+        assert info["entity_id"] == "C1__ENTITY"
+        assert info["raw_size"] == len(REPORT_XML)
+        assert report_cache.get("group-1", "api") == {"ID": "C1__ENTITY"}
+        assert report_cache.get_by_entity("C1__ENTITY", "api") == {"ID": "C1__ENTITY"}
+        assert report_cache.get("group-2", "api") is None
+
+    def test_put_uses_the_parsed_entity_id(self, report_cache):
+        """An EntityId the caller already read is used without parsing the XML."""
+        info = report_cache.put(
+            "group-1", "<truncated", "api", {"ID": "C1__X"}, entity_id=" C1__X "
+        )
+
+        assert info["entity_id"] == "C1__X"
+        assert report_cache.get_by_entity("C1__X", "api") == {"ID": "C1__X"}
+        assert (
+            report_cache.put("group-2", REPORT_XML, "api", {}, entity_id="")[
+                "entity_id"
+            ]
+            is None
+        )
+
+    def test_missing_view_is_derived_from_raw_xml(self, report_cache):
+        """Another caller's parser runs on the stored XML instead of a new report."""
+        report_cache.put("group-1", REPORT_XML, "api", {"ID": "C1__ENTITY"})
+
+        assert report_cache.get("group-1", "processor") is None
+        derived = report_cache.get("group-1", "processor", parse=len)
+        assert derived == len(REPORT_XML)
+        assert report_cache.info("group-1")["views"] == ["api", "processor"]
+
+    def test_freshness_is_per_account(self, report_cache):
+        """An entry can be stale for one account and fresh for the others."""
+        report_cache.put("group-1", REPORT_XML, "api", {"ID": "C1__ENTITY"})
+        time.sleep(0.1)
+
+        assert report_cache.get("group-1", "api", account_id="strict") is None
+        assert report_cache.get("group-1", "api", account_id="other") is not None
+        assert report_cache.retention == 7200
+
+    def test_lookup_returns_the_fetch_time(self, report_cache):
+        """``lookup`` gives the view with the time the report was bought."""
+        info = report_cache.put("group-1", REPORT_XML, "api", {"ID": "C1__ENTITY"})
+
+        assert report_cache.lookup("group-1", "api") == (
+            {"ID": "C1__ENTITY"},
+            info["fetched_at"],
+        )
+        assert report_cache.lookup_by_entity("C1__ENTITY", "other", parse=len) == (
+            len(REPORT_XML),
+            info["fetched_at"],
+        )
+        assert report_cache.is_fresh(info["fetched_at"], "strict")
+        time.sleep(0.1)
+        assert not report_cache.is_fresh(info["fetched_at"], "strict")
+        assert report_cache.is_fresh(info["fetched_at"])
+
+    def test_get_with_xml_returns_the_stored_report(self, report_cache):
+        """Views that leave the XML out get it back from the entry."""
+        report_cache.put("group-1", REPORT_XML, "api", {"ID": "C1__ENTITY"})
+
+        assert report_cache.get_with_xml("group-1", "api") == (
+            {"ID": "C1__ENTITY"},
+            REPORT_XML,
+        )
+        assert report_cache.get_with_xml("group-1", "other", parse=len) == (
+            len(REPORT_XML),
+            REPORT_XML,
+        )
+        assert report_cache.get_with_xml("group-2", "api") is None
+
+    def test_invalidate_drops_entity_index(self, report_cache):
+        """Invalidating a GroupId also forgets its EntityId."""
+        report_cache.put("group-1", REPORT_XML, "api", {"ID": "C1__ENTITY"})
+
+        assert report_cache.invalidate("group-1") is True
+        assert report_cache.get_by_entity("C1__ENTITY", "api") is None
+        assert report_cache.invalidate("group-1") is False
+
+    def test_views_per_section_allow_list(self, report_cache):
+        """Reports parsed for different sections are stored side by side."""
+        assert view_name("api") == "api"
+        assert view_name("api", frozenset({"ucc", "criminal"})) == "api[criminal,ucc]"
+
+        report_cache.put("group-1", REPORT_XML, "api", {"full": True})
+        ucc_view = view_name("api", frozenset({"ucc"}))
+        assert report_cache.get("group-1", ucc_view) is None
+        parsed = report_cache.get(
+            "group-1", ucc_view, parse=lambda xml_content: {"ucc": True}
+        )
+        assert parsed == {"ucc": True}
+        assert report_cache.get("group-1", "api") == {"full": True}
+
+    def test_deriving_a_view_leaves_shared_entries_alone(self, tmp_path):
+        """Entries held by readers of the memory tier are never modified."""
+        cache = ReportCache(TieredCache(Cache(str(tmp_path))))
+        cache.put("group-1", REPORT_XML, "api", {"ID": "C1__ENTITY"})
+        held = cache.cache.get("report:group:group-1")
+
+        assert cache.get("group-1", "processor", parse=len) == len(REPORT_XML)
+        assert list(held["views"]) == ["api"]
+        assert cache.info("group-1")["views"] == ["api", "processor"]
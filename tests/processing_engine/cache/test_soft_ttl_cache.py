@@ -0,0 +1,42 @@
+"""
+Tests for the stale-while-revalidate cache view.
+"""
+
+import sys
+import os
+import time
+
+import pytest
+from diskcache import Cache
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.cache.soft_ttl_cache import SoftTTLCache
+
+
+class TestSoftTTLCache:
+    """Test the fresh, stale and expired phases of an entry."""
+
+    def test_fresh_then_stale_then_expired(self, tmp_path):
+        """Values are fresh, then stale but served, then gone."""
+        cache = SoftTTLCache(Cache(str(tmp_path)), soft_ttl=0.05, hard_ttl=0.2)
+        cache.set("key", {"report": 1})
+        assert cache.get("key") == ({"report": 1}, False)
+
+        time.sleep(0.1)
+        assert cache.get("key") == ({"report": 1}, True)
+
+        time.sleep(0.15)
+        assert cache.get("key") == (None, False)
+
+    def test_unwrapped_values_are_misses(self, tmp_path):
+        """Entries written without timestamps are ignored."""
+        disk = Cache(str(tmp_path))
+        disk.set("key", {"report": 1})
+        assert SoftTTLCache(disk, 1, 2).get("key") == (None, False)
+
+    def test_hard_ttl_must_cover_soft_ttl(self, tmp_path):
+        """A hard TTL shorter than the soft TTL is a configuration error."""
+        with pytest.raises(ValueError):
+            SoftTTLCache(Cache(str(tmp_path)), soft_ttl=10, hard_ttl=5)
@@ -0,0 +1,121 @@
+"""
+Tests for the two-tier memory/disk cache.
+"""
+
+import sys
+import os
+import pickle
+import time
+
+import pytest
+from diskcache import Cache
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.cache.tiered_cache import TieredCache
+
+
+@pytest.fixture(name="disk")
+def fixture_disk(tmp_path):
+    """Empty diskcache directory."""
+    return Cache(str(tmp_path))
+
+
+class TestTieredCache:
+    """Test reads, expiry and eviction across the two tiers."""
+
+    def test_repeat_reads_are_served_from_memory(self, disk):
+        """Only the first read of a key goes to disk."""
+        cache = TieredCache(disk)
+        disk.set("key", {"value": 1})
+
+        assert cache.get("key") == {"value": 1}
+        assert cache.get("key") == {"value": 1}
+        stats = cache.get_stats()
+        assert stats["disk_hits"] == 1
+        assert stats["memory_hits"] == 1
+
+    def test_disk_expiry_is_respected(self, disk):
+        """A value is not served from memory past its disk expiry."""
+        cache = TieredCache(disk)
+        cache.set("key", "value", expire=0.05)
+        assert cache.get("key") == "value"
+
+        time.sleep(0.1)
+        assert cache.get("key") is None
+        assert cache.get_stats()["disk_misses"] == 1
+
+    def test_local_age_bounds_staleness(self, disk):
+        """Another process's write is picked up once the local copy ages out."""
+        cache = TieredCache(disk, max_local_age=0.05)
+        cache.set("key", "old")
+        disk.set("key", "new")
+        assert cache.get("key") == "old"
+
+        time.sleep(0.1)
+        assert cache.get("key") == "new"
+
+    def test_lru_eviction_by_item_count(self, disk):
+        """The least recently used key is evicted first."""
+        cache = TieredCache(disk, max_items=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        stats = cache.get_stats()
+        assert stats["memory_items"] == 2
+        assert stats["evictions"] == 1
+        cache.get("b")
+        assert cache.get_stats()["disk_hits"] == 1
+
+    def test_byte_budget(self, disk):
+        """Values beyond the byte budget stay on disk only."""
+        cache = TieredCache(disk, max_bytes=1024)
+        cache.set("small", "x" * 100)
+        cache.set("large", "x" * 4096)
+
+        assert cache.get_stats()["memory_items"] == 1
+        assert cache.get("large") == "x" * 4096
+        assert cache.get_stats()["memory_bytes"] <= 1024
+
+    def test_sizes_are_estimated_from_the_value(self, disk):
+        """Values are sized by their pickle when stored and when read from disk."""
+        cache = TieredCache(disk)
+        small = {"flags": ["None"] * 10}
+        large = {"sections": [{"name": f"section {i}"} for i in range(5000)]}
+        cache.set("small", small)
+        cache.set("large", large)
+        cache.set("raw", b"x" * 100)
+
+        expected = 100 + sum(
+            len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            for value in (small, large)
+        )
+        assert cache.get_stats()["memory_bytes"] == expected
+        cache.clear_memory()
+        assert cache.get("large") == large and cache.get("small") == small
+        assert cache.get("raw") == b"x" * 100
+        assert cache.get_stats()["memory_bytes"] == expected
+
+    def test_custom_sizeof(self, disk):
+        """A caller-supplied ``sizeof`` decides what fits in the byte budget."""
+        cache = TieredCache(disk, max_bytes=10, sizeof=lambda value: value["size"])
+        cache.set("fits", {"size": 4})
+        cache.set("too big", {"size": 11})
+
+        stats = cache.get_stats()
+        assert stats["memory_items"] == 1 and stats["memory_bytes"] == 4
+        assert cache.get("too big") == {"size": 11}
+
+    def test_delete_and_clear_reach_both_tiers(self, disk):
+        """Removing a key drops it from memory and disk."""
+        cache = TieredCache(disk)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.delete("a") is True
+        assert cache.get("a") is None
+        assert cache.clear() == 1
+        assert "b" not in cache
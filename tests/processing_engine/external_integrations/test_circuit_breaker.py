@@ -0,0 +1,119 @@
+"""
+Tests for the per-endpoint circuit breakers.
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+import httpx
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.external_integrations.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from processing_engine.external_integrations.exceptions import (
+    APIClientError,
+    CircuitOpenError,
+)
+
+
+def _respond(status_code: int):
+    return lambda: httpx.Response(status_code)
+
+
+def _time_out():
+    raise httpx.ReadTimeout("upstream is slow")
+
+
+class TestCircuitBreaker:
+    """Test the closed, open and half-open transitions."""
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        """Repeated failures open the circuit and later calls skip the network."""
+        breaker = CircuitBreaker("business-search", failure_threshold=3)
+        for _ in range(3):
+            with pytest.raises(httpx.ReadTimeout):
+                breaker.call(_time_out)
+
+        assert breaker.state is CircuitState.OPEN
+        calls = []
+        with pytest.raises(CircuitOpenError) as excinfo:
+            breaker.call(lambda: calls.append(1))
+        assert calls == []
+        assert excinfo.value.endpoint == "business-search"
+        assert isinstance(excinfo.value, APIClientError)
+
+    def test_failures_outside_the_window_are_forgotten(self):
+        """Only failures within the window count towards the threshold."""
+        breaker = CircuitBreaker("results", failure_threshold=2, failure_window=0.05)
+        breaker.call(_respond(503))
+        time.sleep(0.1)
+        breaker.call(_respond(503))
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_client_errors_do_not_trip_the_circuit(self):
+        """A 4xx answer means the endpoint is up."""
+        breaker = CircuitBreaker("business-report", failure_threshold=1)
+        breaker.call(_respond(404))
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_successful_probe_closes_the_circuit(self):
+        """After the recovery timeout one probe is let through."""
+        breaker = CircuitBreaker("results", failure_threshold=1, recovery_timeout=0.05)
+        breaker.call(_respond(502))
+        time.sleep(0.06)
+        assert breaker.state is CircuitState.HALF_OPEN
+
+        breaker.call(_respond(200))
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_admits_a_single_probe(self):
+        """Concurrent callers fail fast while the probe is in flight."""
+        breaker = CircuitBreaker("results", failure_threshold=1, recovery_timeout=0.05)
+        breaker.call(_respond(502))
+        time.sleep(0.06)
+
+        async def slow_probe():
+            await asyncio.sleep(0.05)
+            return httpx.Response(200)
+
+        async def run():
+            probe = asyncio.ensure_future(breaker.call_async(slow_probe))
+            await asyncio.sleep(0.01)
+            with pytest.raises(CircuitOpenError):
+                await breaker.call_async(slow_probe)
+            return await probe
+
+        assert asyncio.run(run()).status_code == 200
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_probe_reopens_the_circuit(self):
+        """A failing probe sends the circuit back to open."""
+        breaker = CircuitBreaker("results", failure_threshold=1, recovery_timeout=0.05)
+        breaker.call(_respond(502))
+        time.sleep(0.06)
+        with pytest.raises(httpx.ReadTimeout):
+            breaker.call(_time_out)
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_in() > 0
+
+
+class TestCircuitBreakerRegistry:
+    """Test breakers keyed by endpoint."""
+
+    def test_endpoints_trip_independently(self):
+        """A failing report endpoint leaves searches alone."""
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        registry.get("business-report").call(_respond(500))
+
+        registry.get("business-search").call(_respond(200))
+        snapshot = registry.snapshot()
+        assert snapshot["business-report"]["state"] == "open"
+        assert snapshot["business-search"]["state"] == "closed"
@@ -0,0 +1,392 @@
+"""
+Tests for the token bucket rate limiters.
+"""
+
+import asyncio
+import math
+import multiprocessing
+import sys
+import os
+import threading
+import time
+
+import pytest
+from diskcache import Cache
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.external_integrations.rate_limiter import (
+    BucketStore,
+    DiskCacheBucketStore,
+    EndpointRateLimiter,
+    MemoryBucketStore,
+    RateLimiter,
+    RedisBucketStore,
+    build_bucket_store,
+    reserve_tokens,
+)
+
+try:
+    from lupa import lua51
+except ImportError:
+    lua51 = None
+
+requires_lupa = pytest.mark.skipif(lua51 is None, reason="lupa not installed")
+
+
+class SlowBucketStore(MemoryBucketStore):
+    """A memory store that blocks like a slow SQLite lock or network call."""
+
+    blocking = True
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def reserve(self, key: str, cost: float, rate: float, capacity: float) -> float:
+        time.sleep(self.delay)
+        return super().reserve(key, cost, rate, capacity)
+
+
+class StandInRedis:
+    """
+    The few Redis commands the bucket script uses, with a manual clock.
+
+    ``eval`` runs the script's documented behaviour, ``reserve_tokens``, on
+    the stored hash; ``LuaRedis`` runs the script itself.
+    """
+
+    def __init__(self):
+        self.now = 1_700_000_000.25
+        self.hashes = {}
+        self.expires_at = {}
+
+    def advance(self, seconds: float) -> None:
+        """Move the server clock, dropping the keys that expire meanwhile."""
+        self.now += seconds
+        for key, expires_at in list(self.expires_at.items()):
+            if expires_at <= self.now:
+                del self.hashes[key], self.expires_at[key]
+
+    def ttl(self, key: str) -> float:
+        """Seconds until ``key`` expires."""
+        return self.expires_at[key] - self.now
+
+    def call(self, command: str, key=None, *args):
+        """Run one Redis command, with Redis's reply types."""
+        command = command.upper()
+        if command == "TIME":
+            seconds = math.floor(self.now)
+            return [str(seconds), str(round((self.now - seconds) * 1_000_000))]
+        if command == "HMGET":
+            fields = self.hashes.get(key, {})
+            return [fields.get(field) for field in args]
+        if command == "HSET":
+            fields = self.hashes.setdefault(key, {})
+            for field, value in zip(args[::2], args[1::2]):
+                fields[field] = str(value)
+            return len(args) // 2
+        if command == "EXPIRE":
+            self.expires_at[key] = self.now + int(args[0])
+            return 1
+        raise NotImplementedError(command)
+
+    def eval(self, script: str, numkeys: int, *keys_and_args):
+        assert script == RedisBucketStore.SCRIPT
+        (key,), (cost, rate, capacity, ttl) = (
+            keys_and_args[:numkeys],
+            keys_and_args[numkeys:],
+        )
+        tokens, ts = self.call("HMGET", key, "tokens", "ts")
+        seconds, microseconds = self.call("TIME")
+        (tokens, now), wait = reserve_tokens(
+            (float(tokens), float(ts)) if tokens is not None else None,
+            int(seconds) + int(microseconds) / 1_000_000,
+            float(cost),
+            float(rate),
+            float(capacity),
+        )
+        self.call("HSET", key, "tokens", repr(tokens), "ts", repr(now))
+        self.call("EXPIRE", key, ttl)
+        return repr(wait).encode()
+
+
+class LuaRedis(StandInRedis):
+    """The stand-in running scripts in Lua 5.1, as Redis does."""
+
+    def eval(self, script: str, numkeys: int, *keys_and_args):
+        lua = lua51.LuaRuntime()
+
+        def call(*args):
+            reply = self.call(*args)
+            if isinstance(reply, list):
+                # a missing hash field is false in Lua, as in Redis
+                return lua.table(*(False if v is None else v for v in reply))
+            return reply
+
+        run = lua.eval(
+            "function(call, script, keys, args) "
+            "redis = {call = call}; KEYS = keys; ARGV = args; "
+            "return loadstring(script)() end"
+        )
+        keys = [str(v) for v in keys_and_args[:numkeys]]
+        args = [str(v) for v in keys_and_args[numkeys:]]
+        return run(call, script, lua.table(*keys), lua.table(*args)).encode()
+
+
+def _reserve_in_process(directory: str) -> list:
+    """Reserve five tokens from a bucket shared through diskcache."""
+    limiter = RateLimiter(
+        10, 1, capacity=1, store=DiskCacheBucketStore(Cache(directory)), key="shared"
+    )
+    return [limiter._reserve(1) for _ in range(5)]
+
+
+class TestReserveTokens:
+    """Test the pure bucket arithmetic."""
+
+    def test_full_bucket_serves_immediately(self):
+        """A request within capacity does not wait."""
+        state, wait = reserve_tokens(None, 0.0, 1, rate=1.0, capacity=2)
+        assert wait == 0
+        assert state == (1.0, 0.0)
+
+    def test_waits_grow_in_arrival_order(self):
+        """Each caller past the burst waits one refill interval longer."""
+        state = None
+        waits = []
+        for _ in range(4):
+            state, wait = reserve_tokens(state, 0.0, 1, rate=2.0, capacity=1)
+            waits.append(wait)
+        assert waits == [0.0, 0.5, 1.0, 1.5]
+
+    def test_bucket_refills_up_to_capacity(self):
+        """Idle time refills the bucket but never beyond its capacity."""
+        state, _ = reserve_tokens(None, 0.0, 2, rate=1.0, capacity=2)
+        state, wait = reserve_tokens(state, 100.0, 2, rate=1.0, capacity=2)
+        assert wait == 0
+        assert state == (0.0, 100.0)
+
+
+class TestRateLimiter:
+    """Test the sync and async limiter behaviour."""
+
+    def test_weighted_cost(self):
+        """A heavier request waits for proportionally more tokens."""
+        limiter = RateLimiter(10, 1, capacity=1)
+        assert limiter.acquire() == 0
+        assert limiter._reserve(3) == pytest.approx(0.3, abs=0.02)
+
+    def test_waiters_do_not_hold_the_lock(self):
+        """A sleeping waiter does not block other callers from reserving."""
+        limiter = RateLimiter(2, 1, capacity=1)
+        limiter.acquire()
+        sleeper = threading.Thread(target=limiter.acquire, args=(1,))
+        sleeper.start()
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        wait = limiter._reserve(1)
+        elapsed = time.monotonic() - started
+        sleeper.join()
+
+        assert elapsed < 0.05
+        assert wait == pytest.approx(1.0, abs=0.1)
+
+    def test_async_acquire_does_not_block_the_loop(self):
+        """Async waiters are spaced by the rate while the loop keeps running."""
+        limiter = RateLimiter(20, 1, capacity=1)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+
+        async def run():
+            started = time.monotonic()
+            await asyncio.gather(ticker(), *(limiter.acquire_async() for _ in range(5)))
+            return time.monotonic() - started
+
+        elapsed = asyncio.run(run())
+
+        assert elapsed == pytest.approx(0.2, abs=0.08)
+        assert len(ticks) == 5
+
+    def test_cancelled_waiter_returns_its_tokens(self):
+        """Cancelling a waiting coroutine refunds its reservation."""
+        limiter = RateLimiter(1, 1, capacity=1)
+
+        async def run():
+            await limiter.acquire_async()
+            waiter = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        asyncio.run(run())
+        assert limiter._reserve(1) == pytest.approx(1.0, abs=0.1)
+
+    def test_cancelled_during_slow_reservation_returns_its_tokens(self):
+        """A reservation still running in its thread is refunded once it lands."""
+        store = SlowBucketStore(0.1)
+        limiter = RateLimiter(1, 1, capacity=1, store=store)
+
+        async def run():
+            waiter = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0.02)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            await asyncio.sleep(0.2)
+
+        asyncio.run(run())
+        store.delay = 0
+        assert limiter._reserve(1) == 0
+
+
+class TestEndpointRateLimiter:
+    """Test per-endpoint limits and weighted shared costs."""
+
+    def test_report_costs_more_of_the_shared_quota(self):
+        """Weighted endpoints draw more from the shared bucket."""
+        limiter = EndpointRateLimiter(
+            shared=RateLimiter(10, 1, capacity=2),
+            endpoint_costs={"business-report": 2.0},
+        )
+        assert limiter.acquire("business-report") == 0
+        _, wait = limiter._reserve("business-search", None)
+        assert wait == pytest.approx(0.1, abs=0.02)
+
+    def test_endpoint_limit_applies_separately(self):
+        """An endpoint with its own limit is throttled even if the quota is free."""
+        limiter = EndpointRateLimiter(
+            shared=RateLimiter(1000, 1),
+            endpoint_limits={"business-report": RateLimiter(1, 1)},
+        )
+        assert limiter.acquire("business-report") == 0
+        assert limiter.acquire("business-search") == 0
+        _, wait = limiter._reserve("business-report", None)
+        assert wait == pytest.approx(1.0, abs=0.05)
+
+
+class TestBucketStores:
+    """Test where bucket state lives."""
+
+    def test_limiters_share_a_store_by_key(self):
+        """Limiters with the same key draw from the same bucket."""
+        store = MemoryBucketStore()
+        first = RateLimiter(1, 1, store=store, key="clear:shared")
+        second = RateLimiter(1, 1, store=store, key="clear:shared")
+        other = RateLimiter(1, 1, store=store, key="clear:endpoint:results")
+        assert first.acquire() == 0
+        assert other._reserve(1) == 0
+        assert second._reserve(1) == pytest.approx(1.0, abs=0.05)
+
+    def test_diskcache_bucket_is_shared_across_processes(self, tmp_path):
+        """Processes on one host queue behind a single bucket."""
+        context = multiprocessing.get_context("fork")
+        with context.Pool(processes=3) as pool:
+            results = pool.map(_reserve_in_process, [str(tmp_path)] * 3)
+
+        waits = sorted(wait for result in results for wait in result)
+        assert waits[0] == 0
+        # Fifteen requests at 10/s: the last one waits for fourteen refills
+        assert waits[-1] == pytest.approx(1.4, abs=0.3)
+        assert all(b > a for a, b in zip(waits[1:], waits[2:]))
+
+    def test_redis_buckets_are_shared_by_key(self):
+        """Limiters on a Redis store draw from the bucket named by their key."""
+        store = RedisBucketStore(StandInRedis())
+        first = RateLimiter(1, 1, store=store, key="clear:shared")
+        second = RateLimiter(1, 1, store=store, key="clear:shared")
+        other = RateLimiter(1, 1, store=store, key="clear:endpoint:results")
+        assert first._reserve(1) == 0
+        assert other._reserve(1) == 0
+        assert second._reserve(1) == pytest.approx(1.0)
+
+    def test_unknown_backend_is_rejected(self):
+        """A typo in the backend name fails loudly."""
+        with pytest.raises(ValueError):
+            build_bucket_store("memcached")
+
+    def test_slow_store_does_not_block_the_loop(self):
+        """Reservations against a blocking store run off the event loop."""
+        store = SlowBucketStore(0.2)
+        assert isinstance(store, BucketStore) and store.blocking
+        limiter = EndpointRateLimiter(
+            shared=RateLimiter(1000, 1, store=store, key="clear:shared")
+        )
+        ticks = []
+
+        async def ticker():
+            for _ in range(8):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+
+        async def run():
+            started = time.monotonic()
+            await asyncio.gather(
+                ticker(), *(limiter.acquire_async("business-search") for _ in range(2))
+            )
+            return time.monotonic() - started
+
+        elapsed = asyncio.run(run())
+
+        # both reservations ran in worker threads while the ticker kept going
+        assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.1
+        assert elapsed < 0.35
+
+
+@pytest.fixture(
+    name="redis", params=["stand-in", pytest.param("lua", marks=requires_lupa)]
+)
+def fixture_redis(request):
+    """A stand-in Redis server, running the bucket script itself with lupa."""
+    return StandInRedis() if request.param == "stand-in" else LuaRedis()
+
+
+class TestRedisBucketStore:
+    """Test the Redis bucket script against a stand-in server."""
+
+    def test_deficit_waits_grow_in_arrival_order(self, redis):
+        """Past the burst, each reservation waits for one more refill."""
+        store = RedisBucketStore(redis)
+        waits = [store.reserve("bucket", 1, 10, 2) for _ in range(4)]
+
+        assert waits[:2] == [0, 0]
+        assert waits[2:] == pytest.approx([0.1, 0.2])
+
+    def test_bucket_refills_up_to_capacity(self, redis):
+        """Tokens come back at the rate, never beyond the burst size."""
+        store = RedisBucketStore(redis)
+        store.reserve("bucket", 3, 10, 2)
+        redis.advance(0.1)
+        assert store.reserve("bucket", 1, 10, 2) == pytest.approx(0.1)
+
+        redis.advance(60)
+        assert store.reserve("bucket", 2, 10, 2) == 0
+        assert store.reserve("bucket", 1, 10, 2) == pytest.approx(0.1)
+
+    def test_refund_returns_tokens(self, redis):
+        """A negative cost gives reserved tokens back to later callers."""
+        store = RedisBucketStore(redis)
+        limiter = RateLimiter(10, 1, capacity=1, store=store, key="bucket")
+        assert limiter._reserve(1) == 0
+        assert limiter._reserve(1) == pytest.approx(0.1)
+        limiter._refund(1)
+        assert limiter._reserve(1) == pytest.approx(0.1)
+
+    def test_state_expires_once_refilled(self, redis):
+        """The bucket's key lives as long as a full refill plus a minute."""
+        store = RedisBucketStore(redis)
+        store.reserve("bucket", 2, 0.5, 2)
+        assert redis.ttl("bucket") == math.ceil(2 / 0.5) + 60
+
+        redis.advance(63)
+        assert "bucket" in redis.hashes
+        redis.advance(2)
+        assert "bucket" not in redis.hashes
+        assert store.reserve("bucket", 2, 0.5, 2) == 0
@@ -0,0 +1,201 @@
+"""
+Tests for the CLEAR retry policy.
+"""
+
+import asyncio
+import random
+import sys
+import os
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.external_integrations.retry import (
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+class _Upstream:
+    """Replays a scripted sequence of responses or exceptions."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def _next(self, request: httpx.Request) -> httpx.Response:
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def client(self) -> httpx.Client:
+        """Sync client backed by the script."""
+        return httpx.Client(transport=httpx.MockTransport(self._next))
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Async client backed by the script."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return self._next(request)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _policy(**kwargs) -> RetryPolicy:
+    kwargs.setdefault("base_delay", 0.001)
+    kwargs.setdefault("max_delay", 0.01)
+    return RetryPolicy(rng=random.Random(0), **kwargs)
+
+
+class TestParseRetryAfter:
+    """Test Retry-After header parsing."""
+
+    def test_seconds(self):
+        """Delta-seconds values are used as given."""
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self):
+        """HTTP dates are converted to a delay from now."""
+        value = formatdate(time.time() + 10, usegmt=True)
+        assert parse_retry_after(value) == pytest.approx(10, abs=1.5)
+
+    def test_invalid(self):
+        """Missing or garbage values are ignored."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRetryPolicy:
+    """Test which failures are retried and for how long."""
+
+    def test_retries_transient_status_then_succeeds(self):
+        """502/503 answers are retried until a success comes back."""
+        upstream = _Upstream(
+            httpx.Response(502), httpx.Response(503), httpx.Response(200, text="ok")
+        )
+        client = upstream.client()
+        response = _policy().run(lambda: client.get("http://clear.test/"))
+        assert response.status_code == 200
+        assert upstream.calls == 3
+
+    def test_fatal_status_is_not_retried(self):
+        """Client errors such as 400 are returned after one attempt."""
+        upstream = _Upstream(httpx.Response(400))
+        client = upstream.client()
+        response = _policy().run(lambda: client.get("http://clear.test/"))
+        assert response.status_code == 400
+        assert upstream.calls == 1
+
+    def test_connection_errors_are_retried_then_raised(self):
+        """Transport errors are retried and re-raised once retries run out."""
+        upstream = _Upstream(httpx.ConnectError("reset"))
+        client = upstream.client()
+        with pytest.raises(httpx.ConnectError):
+            _policy(max_retries=2).run(lambda: client.get("http://clear.test/"))
+        assert upstream.calls == 3
+
+    def test_retry_after_is_honoured(self, monkeypatch):
+        """A 429 waits exactly as long as the server asks."""
+        sleeps = []
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        upstream = _Upstream(
+            httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200)
+        )
+        client = upstream.client()
+        response = _policy().run(lambda: client.get("http://clear.test/"))
+        assert response.status_code == 200
+        assert sleeps == [2.0]
+
+    def test_budget_stops_retries(self):
+        """A Retry-After beyond the budget returns the failure immediately."""
+        upstream = _Upstream(httpx.Response(503, headers={"Retry-After": "120"}))
+        client = upstream.client()
+        response = _policy(budget=5).run(lambda: client.get("http://clear.test/"))
+        assert response.status_code == 503
+        assert upstream.calls == 1
+
+    def test_decorrelated_jitter_stays_in_bounds(self):
+        """Delays grow from the previous one but never exceed the cap."""
+        policy = RetryPolicy(base_delay=0.5, max_delay=4, rng=random.Random(1))
+        delay = 0.5
+        for _ in range(50):
+            upper = max(0.5, delay * 3)
+            delay = policy.next_delay(delay)
+            assert 0.5 <= delay <= min(4, upper)
+
+    def test_async_retries(self):
+        """The async runner retries timeouts the same way."""
+        upstream = _Upstream(httpx.ReadTimeout("slow"), httpx.Response(200))
+
+        async def run():
+            async with upstream.async_client() as client:
+                return await _policy().run_async(
+                    lambda: client.get("http://clear.test/")
+                )
+
+        assert asyncio.run(run()).status_code == 200
+        assert upstream.calls == 2
+
+
+class TestPostRetries:
+    """Test that a POST is only sent again when it cannot have been acted on."""
+
+    def test_read_timeout_is_not_retried(self):
+        """A POST that may have reached the server is not sent twice."""
+        upstream = _Upstream(httpx.ReadTimeout("slow"), httpx.Response(200))
+        client = upstream.client()
+        with pytest.raises(httpx.ReadTimeout):
+            _policy().run(lambda: client.post("http://clear.test/"), idempotent=False)
+        assert upstream.calls == 1
+
+    def test_async_dropped_connection_is_not_retried(self):
+        """A dropped connection on an async POST is not retried either."""
+        upstream = _Upstream(httpx.RemoteProtocolError("dropped"), httpx.Response(200))
+
+        async def run():
+            async with upstream.async_client() as client:
+                return await _policy().run_async(
+                    lambda: client.post("http://clear.test/"), idempotent=False
+                )
+
+        with pytest.raises(httpx.RemoteProtocolError):
+            asyncio.run(run())
+        assert upstream.calls == 1
+
+    def test_unsent_request_is_retried(self):
+        """A POST that never connected is sent again."""
+        upstream = _Upstream(httpx.ConnectError("refused"), httpx.Response(200))
+        client = upstream.client()
+        response = _policy().run(
+            lambda: client.post("http://clear.test/"), idempotent=False
+        )
+        assert response.status_code == 200
+        assert upstream.calls == 2
+
+    def test_unavailable_needs_retry_after(self, monkeypatch):
+        """A 503 is only retried when the server says when to come back."""
+        monkeypatch.setattr("time.sleep", lambda delay: None)
+        upstream = _Upstream(httpx.Response(503), httpx.Response(200))
+        client = upstream.client()
+        response = _policy().run(
+            lambda: client.post("http://clear.test/"), idempotent=False
+        )
+        assert response.status_code == 503
+        assert upstream.calls == 1
+
+        upstream = _Upstream(
+            httpx.Response(503, headers={"Retry-After": "1"}), httpx.Response(200)
+        )
+        client = upstream.client()
+        response = _policy().run(
+            lambda: client.post("http://clear.test/"), idempotent=False
+        )
+        assert response.status_code == 200
+        assert upstream.calls == 2
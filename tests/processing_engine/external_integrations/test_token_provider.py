@@ -0,0 +1,179 @@
+"""
+Tests for the in-process CLEAR token provider.
+"""
+
+import multiprocessing
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from diskcache import Cache
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.cache.tiered_cache import TieredCache
+from processing_engine.external_integrations import token_provider
+from processing_engine.external_integrations.token_provider import TokenProvider
+
+
+class _FakeOAuth:
+    """Counts OAuth calls and hands out numbered tokens."""
+
+    def __init__(self, expires_in: int = 3600, delay: float = 0.0):
+        self.calls = 0
+        self.expires_in = expires_in
+        self.delay = delay
+        self._lock = threading.Lock()
+        self.client = httpx.Client(transport=httpx.MockTransport(self.handle))
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Return a fresh token, optionally after a delay."""
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            calls = self.calls
+        return httpx.Response(
+            200, json={"access_token": f"token-{calls}", "expires_in": self.expires_in}
+        )
+
+
+def _get_token_in_process(cache_dir: str) -> str:
+    """Fetch a token from a fresh provider, as a separate worker would."""
+    oauth = _FakeOAuth(delay=0.3)
+    token_provider.get_transport = lambda: oauth
+    # workers get a memory tier over the shared directory, as in production
+    provider = TokenProvider(
+        "http://oauth.test/token", "key", "secret", TieredCache(Cache(cache_dir))
+    )
+    try:
+        return provider.get_token()
+    finally:
+        provider.close()
+
+
+@pytest.fixture(name="provider_factory")
+def fixture_provider_factory(tmp_path, monkeypatch):
+    """Build providers backed by a temporary cache and a fake OAuth endpoint."""
+    providers = []
+
+    def build(oauth: _FakeOAuth, **kwargs) -> TokenProvider:
+        monkeypatch.setattr(token_provider, "get_transport", lambda: oauth)
+        provider = TokenProvider(
+            "http://oauth.test/token", "key", "secret", Cache(str(tmp_path)), **kwargs
+        )
+        providers.append(provider)
+        return provider
+
+    yield build
+    for provider in providers:
+        provider.close()
+
+
+class TestTokenProvider:
+    """Test the memory fast path, single-flight refresh and renewal."""
+
+    def test_concurrent_misses_share_one_refresh(self, provider_factory):
+        """Many threads missing at once trigger a single OAuth request."""
+        oauth = _FakeOAuth(delay=0.2)
+        provider = provider_factory(oauth)
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            tokens = list(executor.map(lambda _: provider.get_token(), range(20)))
+
+        assert oauth.calls == 1
+        assert set(tokens) == {"token-1"}
+
+    def test_hot_path_does_not_touch_disk(self, provider_factory):
+        """Once loaded, tokens are served without reading diskcache."""
+        oauth = _FakeOAuth()
+        provider = provider_factory(oauth)
+        provider.get_token()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("disk read on the hot path")
+
+        provider.cache.get = fail
+        assert provider.get_token() == "token-1"
+
+    def test_token_is_loaded_from_disk_before_oauth(self, provider_factory):
+        """A valid token persisted on disk is reused without an OAuth call."""
+        oauth = _FakeOAuth()
+        provider = provider_factory(oauth)
+        provider.cache.set(provider.cache_key, ("from-disk", time.time() + 3600))
+
+        assert provider.get_token() == "from-disk"
+        assert oauth.calls == 0
+
+    def test_background_renewal_before_expiry(self, provider_factory):
+        """The token is renewed in the background ahead of the expiry buffer."""
+        oauth = _FakeOAuth(expires_in=token_provider.EXPIRY_BUFFER + 2)
+        provider = provider_factory(oauth)
+        assert provider.get_token() == "token-1"
+
+        deadline = time.time() + 3
+        while provider.get_token() == "token-1" and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert oauth.calls >= 2
+        assert provider.get_token() != "token-1"
+
+    def test_clear_forgets_memory_and_disk(self, provider_factory):
+        """Clearing the provider forces the next call to refresh."""
+        oauth = _FakeOAuth()
+        provider = provider_factory(oauth)
+        provider.get_token()
+        provider.clear()
+
+        assert provider.cache.get(provider.cache_key) is None
+        assert provider.get_token() == "token-2"
+
+
+class TestTokenLease:
+    """Test refresh coordination between processes sharing a cache."""
+
+    def test_only_one_process_refreshes(self, tmp_path):
+        """Workers starting together share the token of a single refresh."""
+        context = multiprocessing.get_context("fork")
+        with context.Pool(processes=4) as pool:
+            tokens = pool.map(_get_token_in_process, [str(tmp_path)] * 4)
+
+        provider = TokenProvider(
+            "http://oauth.test/token", "key", "secret", Cache(str(tmp_path))
+        )
+        assert len(set(tokens)) == 1
+        assert sum(provider.refresh_counts().values()) == 1
+        assert provider.get_stats()["lease_holder"] is None
+
+    def test_refresh_adopts_newer_token_from_another_process(self, provider_factory):
+        """A forced refresh reuses a token another process already renewed."""
+        oauth = _FakeOAuth()
+        provider = provider_factory(oauth)
+        provider.get_token()
+        provider.cache.set(
+            provider.cache_key, ("renewed-elsewhere", time.time() + 7200)
+        )
+
+        assert provider.refresh() == "renewed-elsewhere"
+        assert oauth.calls == 1
+
+    def test_waits_for_lease_holder(self, provider_factory):
+        """A process that loses the lease waits for the holder's token."""
+        oauth = _FakeOAuth()
+        provider = provider_factory(oauth)
+        provider.cache.add(provider.lease_key, "other-process", expire=5)
+
+        def holder():
+            time.sleep(0.3)
+            provider.cache.set(provider.cache_key, ("from-holder", time.time() + 3600))
+            provider.cache.delete(provider.lease_key)
+
+        thread = threading.Thread(target=holder)
+        thread.start()
+        assert provider.get_token() == "from-holder"
+        thread.join()
+        assert oauth.calls == 0
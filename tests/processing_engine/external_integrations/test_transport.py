@@ -0,0 +1,110 @@
+"""
+Tests for the shared, pooled CLEAR HTTP transport.
+"""
+
+import asyncio
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.config.transport_config import TransportConfig
+from processing_engine.external_integrations.transport import ClearTransport
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 handler that keeps connections open."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Return a small XML body."""
+        body = b"<ok/>"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Silence request logging."""
+
+
+@pytest.fixture(name="server_url")
+def fixture_server_url():
+    """Start a local keep-alive HTTP server for the duration of a test."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestClearTransport:
+    """Test connection reuse and pool statistics."""
+
+    def test_sync_requests_reuse_connections(self, server_url):
+        """Sequential requests through different sessions share one connection."""
+        transport = ClearTransport(TransportConfig(http2=False))
+        try:
+            for _ in range(3):
+                assert transport.client.get(f"{server_url}/a").text == "<ok/>"
+            with transport.session() as session:
+                assert session.get(f"{server_url}/b").status_code == 200
+
+            stats = transport.get_stats()["sync"]
+            assert stats["requests"] == 4
+            assert stats["connections_opened"] == 1
+            assert stats["connections_reused"] == 3
+            assert stats["waiting"] == 0
+            assert stats["in_flight"] == 0
+        finally:
+            transport.close()
+
+    def test_closing_a_session_keeps_the_pool_open(self, server_url):
+        """Closing a session view does not close the shared pool."""
+        transport = ClearTransport(TransportConfig(http2=False))
+        try:
+            session = transport.session()
+            session.get(f"{server_url}/a")
+            session.close()
+            assert transport.client.get(f"{server_url}/a").status_code == 200
+        finally:
+            transport.close()
+
+    def test_async_requests_respect_per_host_limit(self, server_url):
+        """Concurrent async requests never exceed the per-host connection cap."""
+        transport = ClearTransport(
+            TransportConfig(http2=False, max_connections_per_host=2)
+        )
+
+        async def run():
+            client = transport.open_async()
+            try:
+                responses = await asyncio.gather(
+                    *(client.get(f"{server_url}/a") for _ in range(10))
+                )
+            finally:
+                await transport.aclose()
+            return responses
+
+        responses = asyncio.run(run())
+
+        stats = transport.get_stats()["async"]
+        assert all(r.status_code == 200 for r in responses)
+        assert stats["requests"] == 10
+        assert stats["connections_opened"] <= 2
+        assert stats["connections_opened"] + stats["connections_reused"] == 10
+        assert stats["in_flight"] == 0
+
+    def test_async_client_requires_open(self):
+        """Accessing the async client before opening it is an error."""
+        transport = ClearTransport(TransportConfig(http2=False))
+        with pytest.raises(RuntimeError):
+            _ = transport.async_client
@@ -0,0 +1,141 @@
+"""
+Tests for the CLEAR processor's search handling.
+"""
+
+import sys
+import os
+
+import pytest
+from diskcache import Cache
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.cache import negative_cache, report_cache
+from processing_engine.cache.negative_cache import NegativeCache
+from processing_engine.cache.report_cache import ReportCache
+from processing_engine.cache.tiered_cache import TieredCache
+from processing_engine.config import clear_config
+from processing_engine.config.clear_config import ClearAPIConfig
+from processing_engine.processors.external_reports.clear_processor import (
+    ClearProcessor,
+)
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "output")
+
+NO_GROUP_ID = "<BusinessResultsPage><StartIndex>0</StartIndex></BusinessResultsPage>"
+TRUNCATED = "<BusinessResultsPage><Result><GroupId>"
+
+FORM = {
+    "business_name": "Thomson Reuters",
+    "owner_first_name": "Jane",
+    "owner_last_name": "Doe",
+}
+
+
+def _sample(name: str) -> str:
+    with open(os.path.join(SAMPLES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class FakeClearClient:
+    """Answers every search and report with the same bodies, counting the calls."""
+
+    def __init__(self, body: str, report: str = ""):
+        self.body = body
+        self.report = report
+        self.searches = 0
+        self.reports = 0
+
+    def business_search(self, _search_xml: str) -> dict:
+        self.searches += 1
+        return {"xml_response": self.body}
+
+    def business_report(self, _report_xml: str) -> dict:
+        self.reports += 1
+        return {"xml_response": self.report}
+
+    person_search = business_search
+    person_report = business_report
+
+
+class ConcreteClearProcessor(ClearProcessor):
+    """ClearProcessor with the factor extraction it does not implement yet."""
+
+    def _extract_factors(self, data):
+        return {}
+
+
+@pytest.fixture(name="processor")
+def fixture_processor(tmp_path, monkeypatch):
+    """A processor with its negative cache in a temporary directory."""
+    monkeypatch.setenv("CLEAR_CLIENT_KEY", "key")
+    monkeypatch.setenv("CLEAR_CLIENT_SECRET", "secret")
+    monkeypatch.setattr(
+        clear_config,
+        "_config_instance",
+        ClearAPIConfig(client_key="key", client_secret="secret"),
+    )
+    monkeypatch.setattr(
+        negative_cache,
+        "_negative_cache",
+        NegativeCache(Cache(str(tmp_path / "negative"))),
+    )
+    monkeypatch.setattr(
+        report_cache,
+        "_report_cache",
+        ReportCache(TieredCache(Cache(str(tmp_path / "reports")))),
+    )
+    return ConcreteClearProcessor("account", "underwriting")
+
+
+class TestNegativeCaching:
+    """Test which failed searches are remembered as no-match."""
+
+    @pytest.mark.parametrize(
+        "check", ["_process_business_check", "_process_owner_check"]
+    )
+    def test_no_group_id_is_remembered(self, processor, check):
+        """A well-formed response without a GroupId is not searched again."""
+        processor.clear_client = FakeClearClient(NO_GROUP_ID)
+
+        first = getattr(processor, check)(FORM)
+        second = getattr(processor, check)(FORM)
+
+        assert first["success"] is False and second == first
+        assert first["search_result"]["no_match"] is True
+        assert processor.clear_client.searches == 1
+
+    @pytest.mark.parametrize(
+        "check", ["_process_business_check", "_process_owner_check"]
+    )
+    def test_malformed_response_is_retried(self, processor, check):
+        """A truncated response is a failure but may hide a match."""
+        processor.clear_client = FakeClearClient(TRUNCATED)
+
+        first = getattr(processor, check)(FORM)
+        getattr(processor, check)(FORM)
+
+        assert first["error"].startswith("Invalid XML")
+        assert first["search_result"]["no_match"] is False
+        assert processor.clear_client.searches == 2
+
+
+class TestReportCaching:
+    """Test how the processor shares bought reports."""
+
+    def test_cached_view_leaves_out_the_report_xml(self, processor):
+        """The XML is stored once, compressed, and put back on every read."""
+        report = _sample("business-report.xml")
+        processor.clear_client = FakeClearClient(_sample("business-search.xml"), report)
+
+        first = processor._process_business_check(FORM)
+        second = processor._process_business_check(FORM)
+
+        assert first["success"] is True and second == first
+        assert first["report_result"]["xml_response"] == report
+        assert processor.clear_client.reports == 1
+        group_id = first["search_result"]["group_id"]
+        entry = processor.report_cache.cache.get(f"report:group:{group_id}")
+        (view,) = entry["views"].values()
+        assert "xml_response" not in view
@@ -0,0 +1,112 @@
+"""
+Tests for the keyword classifiers.
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from processing_engine.utils.keyword_classifier import (
+    KeywordClassifier,
+    get_keyword_classifiers,
+    load_keyword_classifiers,
+    set_keyword_classifiers,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_classifiers():
+    """Leave the global classifiers as the tests found them."""
+    yield
+    set_keyword_classifiers(None)
+
+
+class TestKeywordClassifier:
+    """Test classification against compiled rules."""
+
+    classifier = KeywordClassifier(
+        {
+            "tax": {"contains": ["TAX", "State Tax", "IRS"]},
+            "state": {"contains": ["state"]},
+            "fraud": {"equals": ["FRAUD"], "contains": ["class action"]},
+        }
+    )
+
+    def test_every_category_in_one_call(self):
+        """All matching ``contains`` categories are returned, whatever the case."""
+        assert self.classifier.classify("State tax lien") == {"tax", "state"}
+        assert self.classifier.classify("irs levy") == {"tax"}
+
+    def test_equals_is_exact(self):
+        """``equals`` values match the whole string, case included."""
+        assert self.classifier.classify("FRAUD") == {"fraud"}
+        assert self.classifier.classify("fraud") == frozenset()
+        assert self.classifier.classify("FRAUD - WIRE") == frozenset()
+        assert self.classifier.classify("Securities class action") == {"fraud"}
+
+    def test_missing_text(self):
+        """Empty or missing text falls in no category."""
+        assert self.classifier.classify("") == frozenset()
+        assert self.classifier.classify(None) == frozenset()
+
+    def test_unknown_rule(self):
+        """Misspelt rule kinds are rejected."""
+        with pytest.raises(ValueError):
+            KeywordClassifier({"tax": {"contain": ["TAX"]}})
+
+
+class TestLoadKeywordClassifiers:
+    """Test loading the rules from configuration."""
+
+    def test_default_rules(self):
+        """The bundled rules cover the report analyzers."""
+        classifiers = load_keyword_classifiers()
+        offense = classifiers["criminal_offense"].classify("Aggravated Assault")
+        assert offense == {"violent", "felony"}
+        assert classifiers["lien_filing_type"].classify("FEDERAL TAX LIEN") == {
+            "tax_lien"
+        }
+        assert classifiers["lawsuit_case_type"].classify("BREACH OF CONTRACT") == {
+            "contract"
+        }
+        assert classifiers["lawsuit_party"].classify("Thomson Reuters Inc") == {
+            "company"
+        }
+
+    def test_each_parser_keeps_its_offense_rules(self):
+        """The processor flags fewer offenses than ``api.parser``."""
+        classifiers = load_keyword_classifiers()
+        for offense, api, processor in [
+            ("BURGLARY", {"violent"}, set()),
+            ("FORGERY", {"financial"}, set()),
+            ("MURDER FIRST DEGREE", {"violent", "felony"}, {"violent"}),
+            ("AGGRAVATED ROBBERY", {"violent", "felony"}, {"violent", "felony"}),
+        ]:
+            assert classifiers["criminal_offense"].classify(offense) == api
+            assert (
+                classifiers["processor_criminal_offense"].classify(offense) == processor
+            )
+
+    def test_case_types_match_exactly(self):
+        """Lawsuit case types are only recognised as CLEAR writes them."""
+        classify = load_keyword_classifiers()["lawsuit_case_type"].classify
+        assert classify("BREACH OF CONTRACT") == {"contract"}
+        assert classify("Breach of Contract") == frozenset()
+        assert classify("fraud") == frozenset()
+
+    def test_environment(self, tmp_path, monkeypatch):
+        """``CLEAR_KEYWORD_RULES`` points the global classifiers at a file."""
+        rules = tmp_path / "rules.json"
+        rules.write_text(
+            json.dumps({"criminal_offense": {"traffic": {"contains": ["DUI"]}}})
+        )
+        monkeypatch.setenv("CLEAR_KEYWORD_RULES", str(rules))
+        set_keyword_classifiers(None)
+        assert get_keyword_classifiers()["criminal_offense"].classify("dui") == {
+            "traffic"
+        }
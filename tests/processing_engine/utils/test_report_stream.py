@@ -0,0 +1,189 @@
+"""
+Tests for the streaming report parser.
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from api import parser as api_parser
+from processing_engine.utils.report_stream import (
+    SECTION,
+    STATUS,
+    iter_report_elements,
+    parse_sections,
+)
+from processing_engine.utils.xml_backend import (
+    ParseError,
+    get_xml_backend,
+    lxml_etree,
+    set_xml_backend,
+)
+from processing_engine.utils.xml_parser import ClearXMLParser
+from tools.bench_report_parser import tree_parse_api, tree_parse_processor
+
+SAMPLE_REPORT = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "output", "business-report.xml"
+)
+
+NESTED = (
+    "<Report><SectionResults><SectionName>Outer</SectionName>"
+    "<SectionResults><SectionName>Inner</SectionName></SectionResults>"
+    "</SectionResults><Status><StatusCode>200</StatusCode></Status>"
+    "<SectionResults><SectionName>Last</SectionName>"
+    "<Status><StatusCode>500</StatusCode></Status></SectionResults></Report>"
+)
+
+
+def _names(xml_content):
+    return [
+        (kind, element.findtext("SectionName") or element.findtext("StatusCode"))
+        for kind, element in iter_report_elements(xml_content)
+    ]
+
+
+BACKENDS = ["etree"] + (["lxml"] if lxml_etree is not None else [])
+
+
+@pytest.fixture(autouse=True, params=BACKENDS)
+def backend(request):
+    """Run every test on each installed XML backend."""
+    set_xml_backend(request.param)
+    yield get_xml_backend()
+    set_xml_backend(None)
+
+
+@pytest.fixture(scope="module")
+def report_xml():
+    """The sample business report."""
+    with open(SAMPLE_REPORT, encoding="utf-8") as f:
+        return f.read()
+
+
+class TestIterReportElements:
+    """Test the order and contents of streamed elements."""
+
+    def test_same_elements_as_find_and_findall(self, backend):
+        """Sections come in document order, Status is the first one."""
+        root = backend.fromstring(NESTED)
+        expected_sections = [
+            section.findtext("SectionName")
+            for section in root.findall(".//SectionResults")
+        ]
+        names = _names(NESTED)
+        assert [name for kind, name in names if kind == SECTION] == (expected_sections)
+        assert [name for kind, name in names if kind == STATUS] == ["200"]
+
+    def test_bytes_input(self):
+        """Encoded reports stream the same way."""
+        assert _names(NESTED.encode("utf-8")) == _names(NESTED)
+
+    def test_consumed_sections_are_released(self):
+        """Outermost sections are emptied once the caller moves on."""
+        sections = [
+            element for kind, element in iter_report_elements(NESTED) if kind == SECTION
+        ]
+        outer, _, last = sections
+        assert len(outer) == 0 and len(last) == 0
+
+    def test_parse_error_matches_fromstring(self, backend):
+        """Malformed XML raises the same error as building the tree."""
+        bad = NESTED.replace("</Report>", "</Rep>")
+        with pytest.raises(ParseError) as expected:
+            backend.fromstring(bad)
+        with pytest.raises(ParseError) as streamed:
+            list(iter_report_elements(bad))
+        assert str(streamed.value) == str(expected.value)
+        assert streamed.value.position == expected.value.position
+
+
+class TestSectionFilter:
+    """Test section allow-lists."""
+
+    def test_parse_sections_normalises_names(self):
+        """Names match with or without the suffix, in any case."""
+        assert parse_sections(" UCC,lienjudgmentSection, ,Criminal") == {
+            "ucc",
+            "lienjudgment",
+            "criminal",
+        }
+        assert parse_sections(["UCCSection"]) == parse_sections("ucc")
+
+    def test_empty_allow_list_keeps_everything(self):
+        """No names means no filter."""
+        assert parse_sections(None) is None
+        assert parse_sections(" , ") is None
+
+    def test_only_listed_sections_are_yielded(self):
+        """Unlisted sections are skipped, nested ones are matched by name."""
+        names = [
+            element.findtext("SectionName")
+            for kind, element in iter_report_elements(
+                NESTED, parse_sections("Inner,Last")
+            )
+            if kind == SECTION
+        ]
+        assert names == ["Inner", "Last"]
+
+    def test_selected_sections_match_full_parse(self, report_xml):
+        """Listed sections and their flags are parsed as without a filter."""
+        full = api_parser.parse_business_report_xml(report_xml)
+        listed = ("UCC", "LienJudgment", "Criminal", "QuickAnalysisFlag")
+        selected = api_parser.parse_business_report_xml(report_xml, ",".join(listed))
+        assert list(selected["Results"]) == [
+            name for name in full["Results"] if name in listed
+        ]
+        for name in listed:
+            assert selected["Results"][name] == full["Results"][name]
+        assert selected["Flags"] == {
+            **full["Flags"],
+            "Lawsuits": None,
+            "Dockets": None,
+        }
+        assert selected["UCCFilingsAnalysis"] == full["UCCFilingsAnalysis"]
+
+    def test_flags_of_unparsed_sections_are_none(self, report_xml):
+        """Flags nothing in the allow-list evaluates are None, not "None"."""
+        selected = api_parser.parse_business_report_xml(report_xml, "UCC")
+        assert list(selected["Results"]) == ["UCC"]
+        assert selected["Flags"]["UCCFilings"] == "High"
+        assert selected["Flags"]["CriminalHistory"] is None
+        assert selected["CriminalHistoryAnalysis"] == {}
+
+        result = ClearXMLParser.parse_business_report_response(report_xml, "Criminal")
+        assert list(result.parsed_results) == ["Criminal"]
+        assert result.flags["CriminalHistory"] == "High"
+        assert result.flags["UCCFilings"] is None
+
+
+class TestStreamingParsers:
+    """Test that the streaming parsers match the tree-based ones."""
+
+    def test_api_parser_output_unchanged(self, report_xml):
+        """``parse_business_report_xml`` gives the same dict, key order too."""
+        assert json.dumps(api_parser.parse_business_report_xml(report_xml)) == (
+            json.dumps(tree_parse_api(report_xml))
+        )
+
+    def test_processor_parser_output_unchanged(self, report_xml):
+        """``parse_business_report_response`` gives the same results."""
+        result = ClearXMLParser.parse_business_report_response(report_xml)
+        assert result.success
+        assert json.dumps(result.parsed_results, default=str) == (
+            json.dumps(tree_parse_processor(report_xml), default=str)
+        )
+
+    def test_missing_status(self):
+        """Reports without a Status are still rejected."""
+        result = api_parser.parse_business_report_xml("<Report></Report>")
+        assert result == {"error": "No Status section found in XML"}
+
+    def test_invalid_xml(self):
+        """Malformed reports give the usual error."""
+        result = api_parser.parse_business_report_xml("<Report>")
+        assert result["error"].startswith("Invalid XML: ")
@@ -0,0 +1,160 @@
+"""
+Tests for the XML parser backends.
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+from api.parser import parse_business_report_xml, parse_business_search_response
+from processing_engine.utils.xml_backend import (
+    EtreeBackend,
+    ParseError,
+    create_xml_backend,
+    find_descendant,
+    find_descendants,
+    get_xml_backend,
+    iter_descendants,
+    lxml_etree,
+    set_xml_backend,
+)
+from processing_engine.utils.xml_parser import ClearXMLParser
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "output")
+
+UNUSUAL = (
+    "<!DOCTYPE Report [<!ENTITY name 'Acme'>]><Report><!-- generated -->"
+    "<Status><Reference>&name; Corp</Reference></Status><?render fast?>"
+    "<SectionResults><SectionName>Business</SectionName>"
+    "<Details><Name>A<!-- x -->B</Name><Name>C</Name></Details>"
+    "</SectionResults></Report>"
+)
+
+LATIN_1 = (
+    "<?xml version='1.0' encoding='ISO-8859-1'?>"
+    "<Report><Status><Reference>Société</Reference></Status></Report>"
+)
+
+NESTED = (
+    "<Record><Name>outer</Name><Record><Name>inner</Name></Record>"
+    "<Filing><Record><Name>deep</Name></Record></Filing></Record>"
+)
+
+requires_lxml = pytest.mark.skipif(lxml_etree is None, reason="lxml not installed")
+
+
+@pytest.fixture(autouse=True)
+def reset_backend():
+    """Leave the global backend as the tests found it."""
+    yield
+    set_xml_backend(None)
+
+
+def _outputs(backend_name, documents):
+    set_xml_backend(backend_name)
+    outputs = []
+    for document in documents:
+        outputs.append(json.dumps(parse_business_report_xml(document)))
+        if isinstance(document, str):
+            result = ClearXMLParser.parse_business_report_response(document)
+            outputs.append(result.model_dump_json(exclude={"xml_response"}))
+    return outputs
+
+
+class TestCreateXMLBackend:
+    """Test backend selection."""
+
+    def test_etree_by_name(self):
+        """The standard library backend is always available."""
+        assert isinstance(create_xml_backend("etree"), EtreeBackend)
+
+    def test_auto_prefers_lxml(self):
+        """``auto`` uses lxml when it is installed."""
+        expected = "lxml" if lxml_etree is not None else "etree"
+        assert create_xml_backend("auto").name == expected
+
+    def test_unknown_name(self):
+        """Unknown backends are rejected."""
+        with pytest.raises(ValueError):
+            create_xml_backend("expat")
+
+    def test_environment(self, monkeypatch):
+        """``CLEAR_XML_BACKEND`` picks the global backend."""
+        monkeypatch.setenv("CLEAR_XML_BACKEND", "ETREE")
+        set_xml_backend(None)
+        assert get_xml_backend().name == "etree"
+
+
+@requires_lxml
+class TestBackendEquivalence:
+    """Test that both backends produce the same output."""
+
+    def test_sample_report(self):
+        """The sample report parses identically, key order included."""
+        with open(
+            os.path.join(SAMPLES_DIR, "business-report.xml"), encoding="utf-8"
+        ) as f:
+            report = f.read()
+        assert _outputs("lxml", [report]) == _outputs("etree", [report])
+
+    def test_sample_search(self):
+        """Search responses give the same GroupId."""
+        with open(
+            os.path.join(SAMPLES_DIR, "business-search.xml"), encoding="utf-8"
+        ) as f:
+            search = f.read()
+        results = []
+        for name in ("etree", "lxml"):
+            set_xml_backend(name)
+            results.append(parse_business_search_response(search))
+        assert results[0] == results[1]
+        assert "GroupId" in results[0]["ResultGroup"]
+
+    def test_comments_instructions_and_entities(self):
+        """Comments and processing instructions are dropped, entities expanded."""
+        outputs = _outputs("lxml", [UNUSUAL])
+        assert outputs == _outputs("etree", [UNUSUAL])
+        assert json.loads(outputs[0])["Reference"] == "Acme Corp"
+
+    def test_declared_encodings(self):
+        """Strings ignore their declared encoding, bytes honour it."""
+        documents = [LATIN_1, LATIN_1.encode("iso-8859-1")]
+        outputs = _outputs("lxml", documents)
+        assert outputs == _outputs("etree", documents)
+        assert json.loads(outputs[-1])["Reference"] == "Société"
+
+    def test_parse_errors(self):
+        """Malformed XML is reported as invalid on both backends."""
+        for name in ("etree", "lxml"):
+            set_xml_backend(name)
+            with pytest.raises(ParseError):
+                get_xml_backend().fromstring("<Report>")
+            assert parse_business_report_xml("<Report>")["error"].startswith(
+                "Invalid XML: "
+            )
+
+
+@pytest.mark.parametrize(
+    "backend_name", ["etree", pytest.param("lxml", marks=requires_lxml)]
+)
+class TestDescendants:
+    """Test the descendant lookups against their ElementPath equivalents."""
+
+    def test_matches_element_path(self, backend_name):
+        """Same elements as ``.//tag``, in the same order."""
+        root = create_xml_backend(backend_name).fromstring(NESTED)
+        for tag in ("Name", "Filing", "Missing"):
+            assert find_descendants(root, tag) == root.findall(".//" + tag)
+            assert find_descendant(root, tag) is root.find(".//" + tag)
+
+    def test_excludes_the_element_itself(self, backend_name):
+        """An element is not its own descendant, like with ``.//tag``."""
+        root = create_xml_backend(backend_name).fromstring(NESTED)
+        records = list(iter_descendants(root, "Record"))
+        assert records == root.findall(".//Record")
+        assert [record.findtext("Name") for record in records] == ["inner", "deep"]
@@ -0,0 +1,420 @@
+"""
+Tests for the FastAPI application's search pipeline and caches.
+
+CLEAR is replaced by the local stand-in (``tools.clear_standin``), reached
+through an ASGI transport, with failures injected per route.
+"""
+
+import asyncio
+import json
+import re
+import sys
+import os
+import time
+from collections import Counter
+
+import httpx
+import pytest
+from diskcache import Cache
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import main
+from api.jobs import FAILED, SUCCEEDED, JobQueue, JobWorkerPool, watch_job
+from processing_engine.cache import negative_cache, report_cache
+from processing_engine.cache.negative_cache import NegativeCache
+from processing_engine.cache.report_cache import ReportCache
+from processing_engine.cache.soft_ttl_cache import SoftTTLCache
+from processing_engine.cache.tiered_cache import TieredCache
+from processing_engine.external_integrations.rate_limiter import (
+    EndpointRateLimiter,
+    RateLimiter,
+)
+from api.coalescing import RequestCoalescer
+from tools.clear_standin import ROUTES, StandInSettings, create_app
+
+NO_LATENCY = {"auth": 0, "search": 0, "results": 0, "report": 0, "report-results": 0}
+
+BUSINESS = {"business": {"business_name": "Thomson Reuters"}}
+
+JANE = {"first_name": "Jane", "last_name": "Doe"}
+JOHN = {"first_name": "John", "last_name": "Roe"}
+
+
+class FakeClear(httpx.AsyncBaseTransport):
+    """The CLEAR stand-in, counting calls and failing chosen routes."""
+
+    def __init__(self, **settings):
+        # mutable, so a test can add latency after the app is built
+        self.settings = StandInSettings(latency=dict(NO_LATENCY), **settings)
+        self.standin = httpx.ASGITransport(app=create_app(self.settings))
+        self.patterns = {
+            name: (method, re.compile(pattern + "$"))
+            for name, (method, pattern) in ROUTES.items()
+        }
+        # route or (route, kind) -> (status code, body) to answer with instead
+        # of the stand-in
+        self.failures = {}
+        # calls per route and per (route, kind)
+        self.calls = Counter()
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def route(self, request: httpx.Request) -> tuple:
+        """Stand-in route a request is for, and its business/person kind."""
+        path = "/" + re.sub(r"/+", "/", request.url.path).strip("/")
+        for name, (method, pattern) in self.patterns.items():
+            match = pattern.match(path)
+            if request.method == method and match:
+                return name, match.groupdict().get("kind")
+        return "unknown", None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        route, kind = self.route(request)
+        self.calls[route] += 1
+        self.calls[route, kind] += 1
+        self.requests.append((route, kind, request))
+        failure = self.failures.get((route, kind), self.failures.get(route))
+        if failure is not None:
+            status_code, text = failure
+            return httpx.Response(status_code, text=text)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await self.standin.handle_async_request(request)
+        finally:
+            self.in_flight -= 1
+
+
+async def _headers(content_type: str = "application/xml") -> dict:
+    headers = {"Authorization": "Bearer token", "Accept": "application/xml"}
+    if content_type:
+        headers["Content-Type"] = content_type
+    return headers
+
+
+@pytest.fixture
+def clear(tmp_path, monkeypatch):
+    """Point main's caches at a temporary directory and CLEAR at the stand-in."""
+    search_cache = TieredCache(Cache(str(tmp_path / "search")))
+    monkeypatch.setattr(main, "_search_cache", search_cache)
+    monkeypatch.setattr(
+        main,
+        "_search_results",
+        SoftTTLCache(
+            search_cache,
+            main.SEARCH_REQUEST_CACHE_TTL,
+            main.SEARCH_REQUEST_CACHE_HARD_TTL,
+        ),
+    )
+    monkeypatch.setattr(main, "_search_coalescer", RequestCoalescer())
+    monkeypatch.setattr(
+        report_cache,
+        "_report_cache",
+        ReportCache(TieredCache(Cache(str(tmp_path / "reports")))),
+    )
+    monkeypatch.setattr(
+        negative_cache,
+        "_negative_cache",
+        NegativeCache(TieredCache(Cache(str(tmp_path / "negative")))),
+    )
+    limiter = EndpointRateLimiter(shared=RateLimiter(1000, 1))
+    monkeypatch.setattr(main, "get_clear_rate_limiter", lambda: limiter)
+    monkeypatch.setattr(main, "get_headers", _headers)
+
+    fake = FakeClear()
+    main.app.state.http_client = httpx.AsyncClient(transport=fake)
+    return fake
+
+
+def call(*requests):
+    """
+    Send ``(method, url, kwargs)`` requests to the app one after another,
+    then wait for the background refreshes they started.
+    """
+
+    async def run():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        ) as client:
+            responses = [
+                await client.request(method, url, **kwargs)
+                for method, url, kwargs in requests
+            ]
+        await asyncio.gather(*main._revalidations)
+        return responses
+
+    return asyncio.run(run())
+
+
+def search(**kwargs):
+    """A ``POST /search`` request for the sample business."""
+    return ("POST", "/search", {"json": BUSINESS, **kwargs})
+
+
+class TestSearchCaching:
+    """Test the request-keyed and results-keyed search caches."""
+
+    def test_repeat_search_is_served_from_the_request_tier(self, clear):
+        """A repeated search makes no CLEAR calls."""
+        first, second = call(search(), search())
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert "error" not in first.json()
+        assert clear.calls["search"] == 1 and clear.calls["report-results"] == 1
+
+    def test_sections_are_cached_separately(self, clear):
+        """A section allow-list is a separate cache entry."""
+        full, ucc, ucc_again = call(
+            search(),
+            search(params={"sections": "UCC"}),
+            search(params={"sections": "UCC"}),
+        )
+
+        assert ucc.json() == ucc_again.json() != full.json()
+        assert clear.calls["search"] == 2
+
+    def test_invalidate_drops_one_request(self, clear):
+        """``/search/invalidate`` forgets one request; the next search calls CLEAR."""
+        _, invalidated, _ = call(
+            search(),
+            ("POST", "/search/invalidate", {"json": BUSINESS}),
+            search(),
+        )
+
+        assert invalidated.json()["invalidated"] is True
+        assert invalidated.json()["key"] == main.search_request_key(
+            main.BusinessSearchRequest.model_validate(BUSINESS)
+        )
+        # the results-keyed tier still holds the parsed report
+        assert clear.calls["search"] == clear.calls["results"] == 2
+        assert clear.calls["report-results"] == 1
+
+    def test_clearing_the_cache_drops_every_tier(self, clear):
+        """``DELETE /search/cache`` empties both tiers; the next search calls CLEAR."""
+        _, cleared, _ = call(search(), ("DELETE", "/search/cache", {}), search())
+
+        assert cleared.json()["removed"] >= 2
+        assert clear.calls["search"] == 2
+        # the bought report is still reused from the report cache
+        assert clear.calls["report"] == 1
+
+    def test_stale_refresh_reuses_the_cached_report(self, clear, monkeypatch):
+        """Past the soft TTL, the refresh searches again but buys no report."""
+        monkeypatch.setattr(
+            main, "_search_results", SoftTTLCache(main._search_cache, 0.05, 3600)
+        )
+        (first,) = call(search())
+        time.sleep(0.1)
+        (stale,) = call(search())
+        (refreshed,) = call(search())
+
+        assert first.json() == stale.json() == refreshed.json()
+        assert clear.calls["search"] == 2
+        assert clear.calls["report"] == clear.calls["report-results"] == 1
+
+    def test_each_account_applies_its_own_window(self, clear, monkeypatch, tmp_path):
+        """A cached report too old for an account is bought again for it only."""
+        monkeypatch.setattr(
+            report_cache,
+            "_report_cache",
+            ReportCache(
+                TieredCache(Cache(str(tmp_path / "windows"))),
+                max_age=3600,
+                account_max_age={"strict": 0.5},
+            ),
+        )
+        as_account = {"headers": {"X-Account-Id": "strict"}}
+        call(search(), search(**as_account))
+        assert clear.calls["report"] == 1
+        time.sleep(0.6)
+        (strict,) = call(search(**as_account))
+        (lenient,) = call(search())
+
+        assert "error" not in strict.json()
+        assert strict.json() == lenient.json()
+        # the strict account bought a fresh report, the default account reuses it
+        assert clear.calls["report"] == 2
+        assert clear.calls["search"] == 2
+
+    def test_failed_report_results_are_not_cached(self, clear):
+        """A failing report download is an error and is retried next time."""
+        clear.failures["report-results"] = (404, "gone")
+        (failed,) = call(search())
+        clear.failures["report-results"] = (200, "<Report><Status>")
+        (truncated,) = call(search())
+        del clear.failures["report-results"]
+        (retried,) = call(search())
+
+        assert failed.json()["error"].startswith(
+            "Report results request failed with status 404"
+        )
+        assert truncated.json()["error"].startswith("Invalid XML")
+        assert "error" not in retried.json()
+        assert clear.calls["report-results"] == 3
+
+
+def batch(*businesses, **params):
+    """A ``POST /search/batch`` request with one business name per line."""
+    body = "\n".join(
+        json.dumps({"business": {"business_name": name}}) for name in businesses
+    )
+    return ("POST", "/search/batch", {"content": body, "params": params})
+
+
+class TestSearchBatch:
+    """Test how ``/search/batch`` reports rows."""
+
+    def test_rows_clear_rejects_are_failed(self, clear):
+        """A search Clear fails is counted and reported as the row's error."""
+        call(search())
+        clear.failures["search"] = (404, "not found")
+        (response,) = call(batch("Thomson Reuters", "Initech"))
+
+        body = response.json()
+        ok, failed = body["results"]
+        assert body["failed"] == 1
+        assert "error" not in ok and "error" not in ok["result"]
+        assert "result" not in failed
+        assert failed["error"] == "Search request failed with status 404"
+        assert failed["error_type"] == "RuntimeError"
+
+    def test_streamed_rows_carry_the_error(self, clear):
+        """Streamed NDJSON rows report a failed search the same way."""
+        clear.failures["search"] = (404, "not found")
+        (response,) = call(batch("Initech", stream="true"))
+
+        (row,) = [json.loads(line) for line in response.text.splitlines()]
+        assert row["line"] == 1
+        assert row["error"] == "Search request failed with status 404"
+        assert "result" not in row
+
+
+def with_principals(*principals, **business):
+    """A ``POST /business-with-principals`` request for the sample business."""
+    body = {
+        "business": {**BUSINESS["business"], **business},
+        "principals": [{"person": person} for person in principals],
+    }
+    return ("POST", "/business-with-principals", {"json": body})
+
+
+class TestPersonSearch:
+    """Test ``/person/search`` and ``/business-with-principals``."""
+
+    def test_person_search_uses_the_person_endpoints(self, clear):
+        """A person search runs the person pipeline and is cached like ``/search``."""
+        first, second = call(
+            ("POST", "/person/search", {"json": {"person": JANE}}),
+            ("POST", "/person/search", {"json": {"person": JANE}}),
+        )
+
+        assert first.status_code == 200 and "error" not in first.json()
+        assert first.json() == second.json()
+        assert clear.calls["search", "person"] == clear.calls["search"] == 1
+        assert clear.calls["report-results", "person"] == 1
+        (search_request,) = [r for route, _, r in clear.requests if route == "search"]
+        assert b"<LastName>Doe</LastName>" in search_request.content
+
+    def test_person_search_requires_a_name(self, clear):
+        """A request without the person's last name is rejected before CLEAR."""
+        (response,) = call(
+            ("POST", "/person/search", {"json": {"person": {"first_name": "Jane"}}})
+        )
+
+        assert response.status_code == 422
+        assert not clear.calls
+
+    def test_principals_are_searched_concurrently(self, clear):
+        """The business and every principal are looked up at the same time."""
+        clear.settings.latency = {route: 0.05 for route in NO_LATENCY}
+        clear.settings.latency_sigma = 0
+        clear.settings.synthetic = True
+        (response,) = call(with_principals(JANE, JOHN))
+
+        body = response.json()
+        assert "error" not in body["business"]
+        assert [p["request"]["last_name"] for p in body["principals"]] == [
+            "Doe",
+            "Roe",
+        ]
+        assert all("error" not in p["result"] for p in body["principals"])
+        assert clear.calls["search", "business"] == 1
+        assert clear.calls["search", "person"] == 2
+        assert clear.max_in_flight == 3
+
+    def test_business_principal_is_the_default(self, clear):
+        """Without principals, the business principal is searched at its address."""
+        (response,) = call(
+            with_principals(principal=JANE, address={"city": "Eagan", "state": "MN"})
+        )
+
+        (principal,) = response.json()["principals"]
+        assert principal["request"]["first_name"] == "Jane"
+        assert "error" not in principal["result"]
+        person_search = next(
+            r
+            for route, kind, r in clear.requests
+            if (route, kind) == ("search", "person")
+        )
+        assert b"<City>Eagan</City>" in person_search.content
+
+    def test_no_principals_searches_only_the_business(self, clear):
+        """Without principals or a business principal, only the business is searched."""
+        (response,) = call(with_principals())
+
+        assert response.json()["principals"] == []
+        assert clear.calls["search", "person"] == 0
+
+    def test_failing_principal_keeps_the_business_report(self, clear):
+        """A failed principal lookup is reported in its place."""
+        clear.failures["search", "person"] = (404, "not found")
+        (response,) = call(with_principals(JANE))
+
+        body = response.json()
+        assert response.status_code == 200
+        assert "error" not in body["business"]
+        assert body["principals"][0]["result"]["error"] == (
+            "Search request failed with status 404"
+        )
+
+
+def run_jobs(tmp_path, *requests):
+    """Run business search jobs through ``main.run_search_job``; the finished jobs."""
+    queue = JobQueue(Cache(str(tmp_path / "jobs")))
+
+    async def run():
+        pool = JobWorkerPool(queue, main.run_search_job, poll_interval=0.01)
+        await pool.start()
+        jobs = [queue.submit(request) for request in requests]
+        pool.notify()
+        for job in jobs:
+            async for _ in watch_job(queue, job["id"], 5, 0.01):
+                pass
+        await pool.stop()
+        return [queue.get(job["id"]) for job in jobs]
+
+    return asyncio.run(run())
+
+
+class TestSearchJobs:
+    """Test the outcome recorded for queued searches."""
+
+    def test_search_result_succeeds(self, clear, tmp_path):
+        """A parsed report is the job's result."""
+        (job,) = run_jobs(tmp_path, BUSINESS)
+
+        assert job["status"] == SUCCEEDED
+        assert "error" not in job["result"]
+
+    def test_error_result_fails_the_job(self, clear, tmp_path):
+        """A search that comes back as an error body is a failed job."""
+        clear.failures["search"] = (404, "not found")
+        (job,) = run_jobs(tmp_path, BUSINESS)
+
+        assert job["status"] == FAILED and job["result"] is None
+        assert job["error"] == "Search request failed with status 404"
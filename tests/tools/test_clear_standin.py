@@ -0,0 +1,86 @@
+"""
+Tests for the local CLEAR stand-in server.
+"""
+
+import sys
+import os
+import xml.etree.ElementTree as ET
+
+from fastapi.testclient import TestClient
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from tools.clear_standin import StandInSettings, create_app
+
+NO_LATENCY = {"auth": 0, "search": 0, "results": 0, "report": 0, "report-results": 0}
+AUTH = {"Authorization": "Bearer token"}
+
+
+def standin(**settings) -> TestClient:
+    """Client for a stand-in without latency."""
+    return TestClient(create_app(StandInSettings(latency=NO_LATENCY, **settings)))
+
+
+def uri(response) -> str:
+    """Path of the Uri in a searchResults or reportResults response."""
+    return ET.fromstring(response.text).findtext(".//Uri").split("testserver", 1)[1]
+
+
+class TestClearStandIn:
+    """Test the token, search and report flow and the injected failures."""
+
+    def test_token_search_and_report_flow(self):
+        """A search leads to the sample results and report through result URIs."""
+        client = standin()
+        token = client.post("http://testserver//tr-oauth/v1/token").json()
+        assert token["expires_in"] == 3600 and token["access_token"]
+
+        search = client.post(
+            "http://testserver//v2/business/searchResults", headers=AUTH, content="x"
+        )
+        results = client.get(uri(search), headers=AUTH)
+        group_id = ET.fromstring(results.text).findtext(".//GroupId")
+        assert group_id == "3d8d359bdee548ce9ff96a3edd4b67f6"
+
+        report = client.post(
+            "/v2/businessReport/reportResults",
+            headers=AUTH,
+            content=f"<GroupID>{group_id}</GroupID>",
+        )
+        report_xml = client.get(uri(report), headers=AUTH).text
+        assert "<EntityId>C1__NDc2MzE3NTU</EntityId>" in report_xml
+
+        stats = client.get("/_standin/stats").json()
+        assert stats["search"] == {"200": 1} and stats["report-results"] == {"200": 1}
+
+    def test_synthetic_ids_follow_the_request(self):
+        """Synthetic mode gives each distinct search its own GroupId."""
+        client = standin(synthetic=True)
+
+        def group_id(body):
+            search = client.post("/v3/person/searchResults", headers=AUTH, content=body)
+            results = client.get(uri(search), headers=AUTH).text
+            return ET.fromstring(results).findtext(".//GroupId")
+
+        assert group_id("a") == group_id("a") != group_id("b")
+
+    def test_s2s_requires_a_bearer_token(self):
+        """S2S calls without a token are rejected."""
+        assert standin().post("/v2/business/searchResults").status_code == 401
+
+    def test_errors_bursts_and_no_matches(self):
+        """Injected 503s, 429 bursts and empty results are served."""
+        assert (
+            standin(error_rate=1).post("/v2/business/searchResults", headers=AUTH)
+        ).status_code == 503
+
+        burst = standin(burst_interval=60, burst_duration=30).post(
+            "/v2/business/searchResults", headers=AUTH
+        )
+        assert burst.status_code == 429 and burst.headers["Retry-After"] == "30"
+
+        client = standin(no_match_rate=1)
+        search = client.post("/v2/business/searchResults", headers=AUTH)
+        results = client.get(uri(search), headers=AUTH).text
+        assert ET.fromstring(results).find(".//GroupId") is None
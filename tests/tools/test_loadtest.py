@@ -0,0 +1,116 @@
+"""
+Tests for the load-test harness.
+"""
+
+import asyncio
+import sys
+import os
+
+import httpx
+from fastapi import FastAPI
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from tools.loadtest import LoadTest, cache_hit_ratio, check_thresholds, percentile
+
+
+def toy_app() -> FastAPI:
+    """App with a /search that fails for one body and a /metrics endpoint."""
+    app = FastAPI()
+    stats = {"memory_hits": 0, "disk_hits": 0, "disk_misses": 0}
+    seen = set()
+
+    @app.post("/search")
+    async def search(body: dict):
+        name = body["business"]["business_name"]
+        if name.endswith(" 0"):
+            return {"error": "No matches"}
+        stats["memory_hits" if name in seen else "disk_misses"] += 1
+        seen.add(name)
+        await asyncio.sleep(0.001)
+        return {"Reference": name}
+
+    @app.get("/metrics")
+    def metrics():
+        return {"caches": {"search": dict(stats)}}
+
+    return app
+
+
+def run(**kwargs):
+    """Run a load test against the toy app."""
+
+    async def go():
+        transport = httpx.ASGITransport(app=toy_app())
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://app"
+        ) as client:
+            return await LoadTest(client, **kwargs).run()
+
+    return asyncio.run(go())
+
+
+class TestPercentile:
+    """Test nearest-rank percentiles."""
+
+    def test_nearest_rank(self):
+        """Percentiles pick an observed value."""
+        values = list(range(1, 101))
+        assert percentile(values, 0.5) == 50
+        assert percentile(values, 0.95) == 95
+        assert percentile(values, 0.99) == 99
+        assert percentile([7], 0.99) == 7
+        assert percentile([], 0.5) is None
+
+
+class TestLoadTest:
+    """Test closed and open loop runs and the report."""
+
+    def test_closed_loop_report(self):
+        """Every request is timed and errors are broken down."""
+        report = run(
+            scenario="search",
+            bodies=[{"business": {"business_name": f"B {n}"}} for n in range(4)],
+            requests=20,
+            concurrency=5,
+        )
+        assert report["completed"] == 20
+        assert report["errors"] == {"search_error": 5}
+        assert report["error_rate"] == 0.25
+        assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"]
+        # 3 distinct bodies reach the cache: 3 misses, then 12 hits
+        assert report["cache_hit_ratio"] == 12 / 15
+
+    def test_open_loop_paces_requests(self):
+        """At a target rate the run lasts about requests / rps."""
+        report = run(scenario="search", requests=10, rps=100)
+        assert report["completed"] == 10
+        assert report["elapsed_s"] >= 0.09
+
+
+class TestThresholds:
+    """Test failing a run on limits and regressions."""
+
+    def report(self, p95, error_rate=0.0):
+        return {
+            "latency_ms": {"p50": p95 / 2, "p95": p95, "p99": p95},
+            "error_rate": error_rate,
+        }
+
+    def test_absolute_limits(self):
+        """Latency and error rate limits are enforced."""
+        assert check_thresholds(self.report(100), max_p95_ms=150) == []
+        assert len(check_thresholds(self.report(200), max_p95_ms=150)) == 1
+        assert len(check_thresholds(self.report(100, 0.1), max_error_rate=0.05)) == 1
+
+    def test_regression_against_baseline(self):
+        """Percentiles slower than the baseline by more than the margin fail."""
+        baseline = self.report(100)
+        assert check_thresholds(self.report(115), baseline=baseline) == []
+        failures = check_thresholds(self.report(130), baseline=baseline)
+        assert [f.split()[0] for f in failures] == ["p50", "p95", "p99"]
+
+    def test_hit_ratio_without_lookups(self):
+        """No cache activity gives no ratio."""
+        assert cache_hit_ratio({}, {}) is None
@@ -0,0 +1,141 @@
+"""
+Benchmark of the business report parsers.
+
+Compares the streaming parsers (``api.parser.parse_business_report_xml``
+and ``ClearXMLParser.parse_business_report_response``) with the previous
+approach of building the whole tree and searching it with
+``findall(".//SectionResults")``, on the same section handling, for each
+XML backend (ElementTree, and lxml when installed). Checks that every
+combination gives the same output, then reports time per parse and peak
+memory. Peak memory is measured with ``tracemalloc``, which does not see
+libxml2's own allocations, so lxml figures only cover Python objects::
+
+    python -m tools.bench_report_parser --repeat 50 output/business-report.xml
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from api import parser as api_parser
+from processing_engine.utils.xml_backend import (
+    get_xml_backend,
+    lxml_etree,
+    set_xml_backend,
+)
+from processing_engine.utils.xml_parser import ClearXMLParser
+
+DEFAULT_REPORT = os.path.join(
+    os.path.dirname(__file__), "..", "output", "business-report.xml"
+)
+
+
+def tree_parse_api(xml_content: str) -> Dict[str, Any]:
+    """``parse_business_report_xml`` as it was: whole tree, then findall."""
+    root = get_xml_backend().fromstring(xml_content)
+    result = api_parser._new_report_result()  # pylint: disable=protected-access
+    api_parser._set_status(result, root.find(".//Status"))  # pylint: disable=W0212
+    for section in root.findall(".//SectionResults"):
+        api_parser._add_section(result, section)  # pylint: disable=protected-access
+    return result
+
+
+def tree_parse_processor(xml_content: str) -> Dict[str, Any]:
+    """``parse_business_report_response`` as it was, without the model."""
+    root = get_xml_backend().fromstring(xml_content)
+    root.find(".//Status")
+    parsed_results: Dict[str, Any] = {}
+    flags: Dict[str, str] = {}
+    analyses: Dict[str, Any] = {}
+    for section in root.findall(".//SectionResults"):
+        flags = ClearXMLParser._add_section(  # pylint: disable=protected-access
+            section, parsed_results, flags, analyses
+        )
+    return parsed_results
+
+
+def measure(parse: Callable[[str], Any], xml_content: str, repeat: int) -> Dict:
+    """
+    Time ``parse`` and record the peak memory of one call.
+
+    Like ``timeit``, the garbage collector is paused while timing, so
+    collections triggered by earlier runs do not land on later ones.
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            parse(xml_content)
+            timings.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+
+    tracemalloc.start()
+    parse(xml_content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+        "min_ms": round(min(timings) * 1000, 2),
+        "peak_memory_kb": round(peak / 1024),
+    }
+
+
+def stream_processor(xml_content: str) -> Dict[str, Any]:
+    """``parse_business_report_response``, results only."""
+    return ClearXMLParser.parse_business_report_response(xml_content).parsed_results
+
+
+PARSERS = {
+    "api.parser tree": tree_parse_api,
+    "api.parser streaming": api_parser.parse_business_report_xml,
+    "ClearXMLParser tree": tree_parse_processor,
+    "ClearXMLParser streaming": stream_processor,
+}
+
+
+def main() -> None:
+    """Run the benchmark."""
+    backends = ["etree"] + (["lxml"] if lxml_etree is not None else [])
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("report", nargs="?", default=DEFAULT_REPORT)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--backend", action="append", choices=backends)
+    args = parser.parse_args()
+
+    with open(args.report, encoding="utf-8") as f:
+        xml_content = f.read()
+
+    rows = []
+    outputs = set()
+    for backend in args.backend or backends:
+        set_xml_backend(backend)
+        outputs.add(json.dumps(api_parser.parse_business_report_xml(xml_content)))
+        outputs.add(json.dumps(tree_parse_api(xml_content)))
+        for name, parse in PARSERS.items():
+            rows.append(
+                {"backend": backend, "parser": name}
+                | measure(parse, xml_content, args.repeat)
+            )
+    if len(outputs) != 1:
+        raise SystemExit("Parsers or backends disagree")
+
+    print(f"{len(xml_content.encode('utf-8')) / 1024:.0f} KB report")
+    print(f"{'backend':8} {'parser':26} {'median ms':>9} {'min ms':>8} {'peak KB':>8}")
+    for row in rows:
+        print(
+            f"{row['backend']:8} {row['parser']:26} {row['median_ms']:9.2f} "
+            f"{row['min_ms']:8.2f} {row['peak_memory_kb']:8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Local stand-in for the CLEAR OAuth and S2S APIs.
+
+Serves the token, searchResults and reportResults endpoints and the result
+URIs they point at, replaying ``output/business-search.xml`` and
+``output/business-report.xml`` with configurable latency, errors and 429
+bursts, so throughput, retries and caching can be measured offline.
+
+Run it and point the adapter at it::
+
+    python -m tools.clear_standin --port 8900 --latency report=1.5 \\
+        --error-rate 0.02 --burst-interval 60 --burst-duration 5
+
+    CLEAR_API_URL=http://127.0.0.1:8900 CLEAR_S2S_URL=http://127.0.0.1:8900 \\
+        uvicorn main:app
+
+``GET /_standin/stats`` returns request counts per route and status.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import math
+import os
+import random
+import re
+import time
+import uuid
+from collections import Counter
+from typing import Dict, Optional
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "output")
+
+# route name -> (method, path pattern); paths are matched after collapsing "//"
+ROUTES = {
+    "auth": ("POST", r"/tr-oauth/v1/token"),
+    "search": ("POST", r"/v[23]/(?P<kind>business|person)/searchResults"),
+    "results": (
+        "GET",
+        r"/v[23]/(?P<kind>business|person)/searchResults/(?P<id>[\w-]+)",
+    ),
+    "report": (
+        "POST",
+        r"/v[23]/(?P<kind>business|person)Report/reportResults",
+    ),
+    "report-results": (
+        "GET",
+        r"/v[23]/(?P<kind>business|person)Report/reportResults/(?P<id>[\w-]+)",
+    ),
+}
+
+NO_MATCH_ID = "nomatch"
+
+
+class StandInSettings(BaseModel):
+    """Behaviour of the stand-in server."""
+
+    latency: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "auth": 0.05,
+            "search": 0.3,
+            "results": 0.15,
+            "report": 0.8,
+            "report-results": 0.4,
+        },
+        description="Median latency in seconds per route",
+    )
+    latency_sigma: float = Field(
+        default=0.3,
+        description="Spread of the log-normal latency distribution (0 = fixed)",
+    )
+    error_rate: float = Field(
+        default=0.0, description="Fraction of S2S requests answered with a 503"
+    )
+    burst_interval: float = Field(
+        default=0.0, description="Seconds between 429 bursts (0 = no bursts)"
+    )
+    burst_duration: float = Field(
+        default=0.0, description="Seconds every S2S request is answered with a 429"
+    )
+    no_match_rate: float = Field(
+        default=0.0, description="Fraction of searches that find nothing"
+    )
+    synthetic: bool = Field(
+        default=False,
+        description="Derive GroupId and EntityId from the search request instead "
+        "of replaying the sample ids",
+    )
+    token_ttl: int = Field(default=3600, description="Access token lifetime")
+    seed: Optional[int] = Field(default=None, description="Random seed")
+
+
+class ClearStandIn:
+    """Request handling and counters of the stand-in server."""
+
+    def __init__(self, settings: StandInSettings):
+        self.settings = settings
+        self.rng = random.Random(settings.seed)
+        self.started = time.monotonic()
+        self.stats: Counter = Counter()
+
+        with open(
+            os.path.join(SAMPLES_DIR, "business-search.xml"), encoding="utf-8"
+        ) as f:
+            self.search_xml = f.read()
+        with open(
+            os.path.join(SAMPLES_DIR, "business-report.xml"), encoding="utf-8"
+        ) as f:
+            self.report_xml = f.read()
+        self.sample_group_id = re.search(
+            r"<GroupId>([^<]+)</GroupId>", self.search_xml
+        ).group(1)
+        self.sample_entity_id = re.search(
+            r"<EntityId>([^<]+)</EntityId>", self.report_xml
+        ).group(1)
+
+    def delay(self, route: str) -> float:
+        """Draw a latency for a route from its log-normal distribution."""
+        median = self.settings.latency.get(route, 0.0)
+        if median <= 0:
+            return 0.0
+        return median * math.exp(self.rng.gauss(0, self.settings.latency_sigma))
+
+    def burst_remaining(self) -> float:
+        """Seconds left in the current 429 burst, or 0 outside bursts."""
+        interval = self.settings.burst_interval
+        if interval <= 0 or self.settings.burst_duration <= 0:
+            return 0.0
+        into_cycle = (time.monotonic() - self.started) % interval
+        return max(0.0, self.settings.burst_duration - into_cycle)
+
+    def group_id_for(self, search_body: bytes) -> str:
+        """GroupId a search resolves to."""
+        if self.rng.random() < self.settings.no_match_rate:
+            return NO_MATCH_ID
+        if not self.settings.synthetic:
+            return self.sample_group_id
+        return hashlib.sha256(search_body).hexdigest()[:32]
+
+    def search_results(self, group_id: str) -> str:
+        """Search results page for a GroupId."""
+        if group_id == NO_MATCH_ID:
+            return (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                "<BusinessResultsPage><Status><StatusCode>200</StatusCode>"
+                "</Status><StartIndex>0</StartIndex><EndIndex>0</EndIndex>"
+                "</BusinessResultsPage>"
+            )
+        return self.search_xml.replace(self.sample_group_id, group_id)
+
+    def report(self, group_id: str) -> str:
+        """Report for a GroupId; synthetic reports get their own EntityId."""
+        if group_id == self.sample_group_id:
+            return self.report_xml
+        entity_id = "C1__" + hashlib.sha256(group_id.encode()).hexdigest()[:12]
+        return self.report_xml.replace(self.sample_entity_id, entity_id)
+
+
+def uri_response(uri: str) -> str:
+    """Body of a searchResults or reportResults POST pointing at its results."""
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f"<Results><Uri>{uri}</Uri><Status><StatusCode>200</StatusCode>"
+        "</Status></Results>"
+    )
+
+
+def create_app(settings: Optional[StandInSettings] = None) -> FastAPI:
+    """Build the stand-in FastAPI application."""
+    standin = ClearStandIn(settings or StandInSettings())
+    app = FastAPI(title="CLEAR stand-in")
+    app.state.standin = standin
+    patterns = {
+        name: (method, re.compile(pattern + "$"))
+        for name, (method, pattern) in ROUTES.items()
+    }
+
+    @app.get("/_standin/stats")
+    def stats():
+        """Request counts per route and status."""
+        counts: Dict[str, Dict[str, int]] = {}
+        for (route, status), count in standin.stats.items():
+            counts.setdefault(route, {})[str(status)] = count
+        return counts
+
+    @app.api_route("/{path:path}", methods=["GET", "POST"])
+    async def dispatch(path: str, request: Request):
+        path = "/" + re.sub(r"/+", "/", path).strip("/")
+        for name, (method, pattern) in patterns.items():
+            match = pattern.match(path)
+            if match and request.method == method:
+                response = await handle(name, match.groupdict(), request)
+                standin.stats[(name, response.status_code)] += 1
+                return response
+        standin.stats[("unknown", 404)] += 1
+        return Response(status_code=404)
+
+    async def handle(name: str, params: Dict[str, str], request: Request) -> Response:
+        await asyncio.sleep(standin.delay(name))
+
+        if name == "auth":
+            return JSONResponse(
+                {
+                    "access_token": uuid.uuid4().hex,
+                    "token_type": "Bearer",
+                    "expires_in": standin.settings.token_ttl,
+                }
+            )
+
+        if not request.headers.get("authorization", "").startswith("Bearer "):
+            return Response(status_code=401)
+        remaining = standin.burst_remaining()
+        if remaining > 0:
+            return Response(
+                status_code=429, headers={"Retry-After": str(math.ceil(remaining))}
+            )
+        if standin.rng.random() < standin.settings.error_rate:
+            return Response(status_code=503)
+
+        base = str(request.base_url).rstrip("/")
+        xml = "application/xml"
+        if name == "search":
+            group_id = standin.group_id_for(await request.body())
+            uri = f"{base}/v2/{params['kind']}/searchResults/{group_id}"
+            return Response(uri_response(uri), media_type=xml)
+        if name == "results":
+            return Response(standin.search_results(params["id"]), media_type=xml)
+        if name == "report":
+            body = (await request.body()).decode("utf-8", "replace")
+            group_id = re.search(r"<GroupI[dD]>([^<]*)</GroupI[dD]>", body)
+            if group_id is None or not group_id.group(1):
+                return Response(status_code=400)
+            uri = f"{base}/v2/{params['kind']}Report/reportResults/{group_id.group(1)}"
+            return Response(uri_response(uri), media_type=xml)
+        return Response(standin.report(params["id"]), media_type=xml)
+
+    return app
+
+
+def _parse_latency(values) -> Dict[str, float]:
+    latency = StandInSettings().latency
+    for value in values or []:
+        route, _, seconds = value.partition("=")
+        if route not in ROUTES:
+            raise argparse.ArgumentTypeError(f"Unknown route {route!r}")
+        latency[route] = float(seconds)
+    return latency
+
+
+def main() -> None:
+    """Run the stand-in server."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument(
+        "--latency",
+        action="append",
+        metavar="ROUTE=SECONDS",
+        help=f"Median latency of a route ({', '.join(ROUTES)}); repeatable",
+    )
+    parser.add_argument("--latency-sigma", type=float, default=0.3)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--burst-interval", type=float, default=0.0)
+    parser.add_argument("--burst-duration", type=float, default=0.0)
+    parser.add_argument("--no-match-rate", type=float, default=0.0)
+    parser.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--token-ttl", type=int, default=3600)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    import uvicorn  # pylint: disable=import-outside-toplevel
+
+    settings = StandInSettings(
+        latency=_parse_latency(args.latency),
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        burst_interval=args.burst_interval,
+        burst_duration=args.burst_duration,
+        no_match_rate=args.no_match_rate,
+        synthetic=args.synthetic,
+        token_ttl=args.token_ttl,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(settings), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+Load generator for the FastAPI app.
+
+Drives ``/search``, ``/search/batch`` or ``/jobs`` at a fixed concurrency
+(closed loop) or a target request rate (open loop) and reports latency
+percentiles, throughput, errors and the search cache hit ratio. Run it
+against the app backed by the CLEAR stand-in (``tools.clear_standin``)::
+
+    python -m tools.loadtest --scenario search --concurrency 20 \\
+        --requests 2000 --unique 200 --standin-url http://127.0.0.1:8900 \\
+        --output run.json --baseline previous.json --max-regression 0.2
+
+The process exits with status 1 when a threshold is exceeded.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+SCENARIOS = ("search", "batch", "jobs")
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of ``values`` (``fraction`` between 0 and 1)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def search_bodies(unique: int, prefix: str = "Loadtest Business") -> List[Dict]:
+    """``unique`` distinct business search bodies."""
+    return [
+        {"business": {"business_name": f"{prefix} {n}"}} for n in range(max(1, unique))
+    ]
+
+
+def _counter_delta(before: Dict, after: Dict) -> Dict[str, Any]:
+    """Difference of two nested dicts of counters."""
+    delta = {}
+    for key, value in after.items():
+        if isinstance(value, dict):
+            delta[key] = _counter_delta(before.get(key, {}), value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            delta[key] = value - before.get(key, 0)
+    return delta
+
+
+def cache_hit_ratio(before: Dict, after: Dict) -> Optional[float]:
+    """
+    Share of search cache lookups served from either tier during the run.
+
+    Computed from the ``caches.search`` counters of ``/metrics``.
+    """
+    delta = _counter_delta(
+        before.get("caches", {}).get("search", {}),
+        after.get("caches", {}).get("search", {}),
+    )
+    hits = delta.get("memory_hits", 0) + delta.get("disk_hits", 0)
+    lookups = hits + delta.get("disk_misses", 0)
+    return hits / lookups if lookups else None
+
+
+class LoadTest:
+    """One load test run against an app reachable through ``client``."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        scenario: str = "search",
+        bodies: Optional[List[Dict]] = None,
+        requests: int = 100,
+        concurrency: int = 10,
+        rps: Optional[float] = None,
+        batch_size: int = 20,
+        job_timeout: float = 60.0,
+    ):
+        if scenario not in SCENARIOS:
+            raise ValueError(f"Unknown scenario {scenario!r}")
+        self.client = client
+        self.scenario = scenario
+        self.bodies = bodies or search_bodies(requests)
+        self.requests = requests
+        self.concurrency = concurrency
+        self.rps = rps
+        self.batch_size = batch_size
+        self.job_timeout = job_timeout
+
+        self.latencies: List[float] = []
+        self.outcomes: Counter = Counter()
+
+    def _body(self, n: int) -> Dict:
+        return self.bodies[n % len(self.bodies)]
+
+    async def _search(self, n: int) -> str:
+        response = await self.client.post("/search", json=self._body(n))
+        if response.status_code == 200 and "error" in response.json():
+            return "search_error"
+        return str(response.status_code)
+
+    async def _batch(self, n: int) -> str:
+        rows = (
+            json.dumps(self._body(n * self.batch_size + i))
+            for i in range(self.batch_size)
+        )
+        response = await self.client.post("/search/batch", content="\n".join(rows))
+        if response.status_code == 200 and response.json()["failed"]:
+            return "batch_rows_failed"
+        return str(response.status_code)
+
+    async def _job(self, n: int) -> str:
+        response = await self.client.post("/jobs", json=self._body(n))
+        if response.status_code != 202:
+            return str(response.status_code)
+        job_id = response.json()["id"]
+        deadline = time.monotonic() + self.job_timeout
+        while time.monotonic() < deadline:
+            job = (await self.client.get(f"/jobs/{job_id}", params={"wait": 10})).json()
+            if job["status"] in ("succeeded", "failed"):
+                return "200" if job["status"] == "succeeded" else "job_failed"
+        return "job_timeout"
+
+    async def _one(self, n: int) -> None:
+        call = {"search": self._search, "batch": self._batch, "jobs": self._job}
+        started = time.perf_counter()
+        try:
+            outcome = await call[self.scenario](n)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            outcome = type(e).__name__
+        self.latencies.append(time.perf_counter() - started)
+        self.outcomes[outcome] += 1
+
+    async def _closed_loop(self) -> None:
+        counter = iter(range(self.requests))
+
+        async def worker():
+            for n in counter:
+                await self._one(n)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, self.concurrency))))
+
+    async def _open_loop(self) -> None:
+        start = time.monotonic()
+        tasks = []
+        for n in range(self.requests):
+            await asyncio.sleep(max(0.0, start + n / self.rps - time.monotonic()))
+            tasks.append(asyncio.ensure_future(self._one(n)))
+        await asyncio.gather(*tasks)
+
+    async def _metrics(self) -> Dict:
+        try:
+            response = await self.client.get("/metrics")
+            return response.json() if response.status_code == 200 else {}
+        except httpx.HTTPError:
+            return {}
+
+    async def run(self, standin_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run the load test.
+
+        Args:
+            standin_url: Base URL of the CLEAR stand-in, to count upstream calls
+
+        Returns:
+            Dict: The report (latencies in milliseconds)
+        """
+        before = await self._metrics()
+        upstream_before = await _standin_stats(standin_url)
+        started = time.monotonic()
+        if self.rps:
+            await self._open_loop()
+        else:
+            await self._closed_loop()
+        elapsed = time.monotonic() - started
+        after = await self._metrics()
+        upstream_after = await _standin_stats(standin_url)
+
+        ms = [latency * 1000 for latency in self.latencies]
+        errors = {k: v for k, v in self.outcomes.items() if k not in ("200", "202")}
+        return {
+            "scenario": self.scenario,
+            "settings": {
+                "requests": self.requests,
+                "concurrency": None if self.rps else self.concurrency,
+                "rps": self.rps,
+                "unique_bodies": len(self.bodies),
+                "batch_size": self.batch_size if self.scenario == "batch" else None,
+            },
+            "completed": len(ms),
+            "elapsed_s": round(elapsed, 3),
+            "throughput_rps": round(len(ms) / elapsed, 2) if elapsed else None,
+            "latency_ms": {
+                "p50": percentile(ms, 0.50),
+                "p95": percentile(ms, 0.95),
+                "p99": percentile(ms, 0.99),
+                "max": max(ms) if ms else None,
+                "mean": sum(ms) / len(ms) if ms else None,
+            },
+            "error_rate": sum(errors.values()) / len(ms) if ms else None,
+            "errors": errors,
+            "cache_hit_ratio": cache_hit_ratio(before, after),
+            "upstream_calls": _counter_delta(upstream_before, upstream_after),
+        }
+
+
+async def _standin_stats(standin_url: Optional[str]) -> Dict:
+    if not standin_url:
+        return {}
+    async with httpx.AsyncClient(base_url=standin_url) as client:
+        return (await client.get("/_standin/stats")).json()
+
+
+def check_thresholds(
+    report: Dict[str, Any],
+    max_p95_ms: Optional[float] = None,
+    max_p99_ms: Optional[float] = None,
+    max_error_rate: Optional[float] = None,
+    baseline: Optional[Dict[str, Any]] = None,
+    max_regression: float = 0.2,
+) -> List[str]:
+    """
+    Compare a report against absolute limits and a baseline report.
+
+    Returns:
+        List[str]: One message per exceeded threshold (empty if the run passed)
+    """
+    failures = []
+    latency = report["latency_ms"]
+    limits = {"p95": max_p95_ms, "p99": max_p99_ms}
+    for name, limit in limits.items():
+        if limit is not None and latency[name] is not None and latency[name] > limit:
+            failures.append(f"{name} {latency[name]:.1f} ms exceeds {limit:.1f} ms")
+    if max_error_rate is not None and (report["error_rate"] or 0) > max_error_rate:
+        failures.append(
+            f"error rate {report['error_rate']:.3f} exceeds {max_error_rate:.3f}"
+        )
+    if baseline is not None:
+        for name in ("p50", "p95", "p99"):
+            previous = baseline["latency_ms"].get(name)
+            current = latency[name]
+            if previous and current and current > previous * (1 + max_regression):
+                failures.append(
+                    f"{name} {current:.1f} ms regressed more than "
+                    f"{max_regression:.0%} from baseline {previous:.1f} ms"
+                )
+    return failures
+
+
+def main() -> None:
+    """Run a load test from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenario", choices=SCENARIOS, default="search")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rps", type=float, help="Open loop at this request rate")
+    parser.add_argument(
+        "--unique",
+        type=int,
+        default=50,
+        help="Distinct search bodies; fewer means more cache hits",
+    )
+    parser.add_argument(
+        "--bodies", help="JSONL file of search bodies to use instead of --unique"
+    )
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--standin-url", help="CLEAR stand-in, to count upstream calls")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report of an earlier run")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    parser.add_argument("--max-p95-ms", type=float)
+    parser.add_argument("--max-p99-ms", type=float)
+    parser.add_argument("--max-error-rate", type=float)
+    args = parser.parse_args()
+
+    if args.bodies:
+        with open(args.bodies, encoding="utf-8") as f:
+            bodies = [json.loads(line) for line in f if line.strip()]
+    else:
+        bodies = search_bodies(args.unique)
+
+    async def run():
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+        async with httpx.AsyncClient(
+            base_url=args.url, timeout=args.timeout, limits=limits
+        ) as client:
+            load_test = LoadTest(
+                client,
+                scenario=args.scenario,
+                bodies=bodies,
+                requests=args.requests,
+                concurrency=args.concurrency,
+                rps=args.rps,
+                batch_size=args.batch_size,
+                job_timeout=args.timeout,
+            )
+            return await load_test.run(args.standin_url)
+
+    report = asyncio.run(run())
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    report["failures"] = check_thresholds(
+        report,
+        max_p95_ms=args.max_p95_ms,
+        max_p99_ms=args.max_p99_ms,
+        max_error_rate=args.max_error_rate,
+        baseline=baseline,
+        max_regression=args.max_regression,
+    )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    if report["failures"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()